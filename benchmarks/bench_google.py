@@ -0,0 +1,125 @@
+"""
+Compares the Google Jobs payload extractor with the previous regex / recursive walk.
+
+Throughput runs on recorded pages:
+    payloads/google_initial/*.html   google.com/search?udm=8 result pages
+    payloads/google/*.txt            async/callback:550 page bodies
+The worst case is a synthetic page full of unterminated anchors and brackets,
+which makes the lazy regex backtrack across the whole document.
+
+usage: python benchmarks/bench_google.py [payload_dir] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import time
+from pathlib import Path
+
+from jobspy.google import util
+
+legacy_pattern = re.compile(f'520084652":(' + r"\[.*?\]\s*])\s*}\s*]\s*]\s*]\s*]\s*]")
+
+
+def legacy_initial_page(html_text: str) -> list:
+    return [json.loads(m.group(1)) for m in legacy_pattern.finditer(html_text)]
+
+
+def legacy_find_job_info(jobs_data):
+    if isinstance(jobs_data, dict):
+        for key, value in jobs_data.items():
+            if key == "520084652" and isinstance(value, list):
+                return value
+            result = legacy_find_job_info(value)
+            if result:
+                return result
+    elif isinstance(jobs_data, list):
+        for item in jobs_data:
+            result = legacy_find_job_info(item)
+            if result:
+                return result
+    return None
+
+
+def legacy_async_page(text: str) -> list:
+    start_idx = text.find("[[[")
+    end_idx = text.rindex("]]]") + 3
+    jobs = []
+    for _, job_data in json.loads(text[start_idx:end_idx])[0]:
+        if job_data.startswith("[[["):
+            jobs.append(legacy_find_job_info(json.loads(job_data)))
+    return jobs
+
+
+def async_page(text: str) -> list:
+    start_idx = text.find("[[[")
+    end_idx = text.rindex("]]]") + 3
+    jobs = []
+    for _, job_data in util.json_loads(text[start_idx:end_idx])[0]:
+        if job_data.startswith("[[["):
+            job_info = util.find_job_info_in_text(job_data)
+            if job_info is None:
+                job_info = util.find_job_info(util.json_loads(job_data))
+            jobs.append(job_info)
+    return jobs
+
+
+def worst_case_page(size: int) -> str:
+    chunk = '"520084652":[[' + '"x", ] ' * 20 + "} "
+    return "<html>" + chunk * (size // len(chunk)) + "</html>"
+
+
+def bench(fn, docs: list, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for doc in docs:
+            fn(doc)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "payload_dir", nargs="?", default=Path(__file__).parent / "payloads"
+    )
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--worst-case-kb", type=int, default=200)
+    args = parser.parse_args()
+    payload_dir = Path(args.payload_dir)
+
+    cases = [
+        (
+            "initial",
+            "google_initial",
+            legacy_initial_page,
+            util.find_job_info_initial_page,
+        ),
+        ("async", "google", legacy_async_page, async_page),
+    ]
+    print(f"{'case':<12}{'docs':>6}{'legacy ms':>12}{'extractor ms':>14}{'speedup':>9}")
+    for name, folder, legacy, current in cases:
+        paths = (
+            sorted((payload_dir / folder).glob("*"))
+            if (payload_dir / folder).is_dir()
+            else []
+        )
+        docs = [path.read_text() for path in paths]
+        if not docs:
+            print(
+                f"{name:<12}{'no recorded pages in ' + str(payload_dir / folder):>41}"
+            )
+            continue
+        old = bench(legacy, docs, args.repeat)
+        new = bench(current, docs, args.repeat)
+        print(f"{name:<12}{len(docs):>6}{old:>12.2f}{new:>14.2f}{old / new:>8.1f}x")
+
+    worst = [worst_case_page(args.worst_case_kb * 1024)]
+    old = bench(lambda doc: list(legacy_pattern.finditer(doc)), worst, 1)
+    new = bench(lambda doc: list(util.iter_job_info_slices(doc)), worst, 1)
+    print(f"{'worst case':<12}{1:>6}{old:>12.2f}{new:>14.2f}{old / new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
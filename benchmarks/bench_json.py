@@ -0,0 +1,99 @@
+"""
+Compares the stdlib json module with orjson on recorded job board payloads.
+
+Record payloads by saving raw response bodies under one directory per site:
+    payloads/indeed/*.json       Indeed GraphQL jobSearch responses
+    payloads/glassdoor/*.json    Glassdoor /graph responses
+    payloads/zip_recruiter/*.json  ZipRecruiter /jobs-app/jobs responses
+    payloads/naukri/*.json       Naukri /jobapi/v3/search responses
+    payloads/google/*.txt        Google async/callback:550 page bodies
+
+usage: python benchmarks/bench_json.py [payload_dir] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from jobspy.util import json_backend
+
+
+def google_blobs(text: str) -> list[str]:
+    """The outer [[[...]]] blob plus every nested job string, as Google._parse_jobs decodes them"""
+    start_idx = text.find("[[[")
+    end_idx = text.rindex("]]]") + 3
+    outer = text[start_idx:end_idx]
+    blobs = [outer]
+    for _, job_data in json.loads(outer)[0]:
+        if job_data.startswith("[[["):
+            blobs.append(job_data)
+    return blobs
+
+
+def load_payloads(payload_dir: Path) -> dict[str, list[bytes | str]]:
+    payloads = {}
+    for site_dir in sorted(p for p in payload_dir.iterdir() if p.is_dir()):
+        docs = []
+        for path in sorted(site_dir.iterdir()):
+            if site_dir.name == "google":
+                docs.extend(google_blobs(path.read_text()))
+            else:
+                docs.append(path.read_bytes())
+        if docs:
+            payloads[site_dir.name] = docs
+    return payloads
+
+
+def bench(fn, docs: list, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for doc in docs:
+            fn(doc)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "payload_dir", nargs="?", default=Path(__file__).parent / "payloads"
+    )
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = load_payloads(Path(args.payload_dir))
+    if not payloads:
+        raise SystemExit(f"no recorded payloads found in {args.payload_dir}")
+
+    print(f"jobspy decodes with {json_backend()}")
+    print(
+        f"{'site':<15}{'docs':>6}{'MB':>8}{'json ms':>10}{'orjson ms':>11}{'speedup':>9}"
+    )
+    for site, docs in payloads.items():
+        size = sum(len(doc) for doc in docs) / 1e6
+        stdlib = bench(json.loads, docs, args.repeat) * 1000
+        line = f"{site:<15}{len(docs):>6}{size:>8.2f}{stdlib:>10.2f}"
+        if orjson is not None:
+            fast = bench(orjson.loads, docs, args.repeat) * 1000
+            line += f"{fast:>11.2f}{stdlib / fast:>8.1f}x"
+        print(line)
+
+    if "glassdoor" in payloads:
+        bodies = [json.loads(doc) for doc in payloads["glassdoor"]]
+        stdlib = bench(json.dumps, bodies, args.repeat) * 1000
+        line = f"{'glassdoor dumps':<15}{len(bodies):>6}{'':>8}{stdlib:>10.2f}"
+        if orjson is not None:
+            fast = bench(orjson.dumps, bodies, args.repeat) * 1000
+            line += f"{fast:>11.2f}{stdlib / fast:>8.1f}x"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
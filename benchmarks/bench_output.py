@@ -0,0 +1,89 @@
+"""
+Compares the untyped scrape_jobs output (object columns) with typed_frame on
+synthetic rows shaped like a multi-site scrape: memory held by the DataFrame and
+the time of the site / date_posted sort scrape_jobs does.
+
+usage: python benchmarks/bench_output.py [--rows N] [--repeat N] [--pyarrow]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+
+from jobspy.util import desired_order, typed_frame
+
+sites = ["linkedin", "indeed", "glassdoor", "google", "zip_recruiter"]
+companies = [f"Company {i}" for i in range(500)]
+
+
+def synthetic_frame(n: int) -> pd.DataFrame:
+    rng = random.Random(0)
+    rows = []
+    for i in range(n):
+        site = rng.choice(sites)
+        posted = date(2024, 5, 1) - timedelta(days=rng.randrange(60))
+        amount = rng.choice([None, rng.randrange(40, 200) * 1000])
+        rows.append(
+            {
+                "id": f"{site[:2]}-{i}",
+                "site": site,
+                "job_url": f"https://example.com/jobs/{i}",
+                "title": f"Software Engineer {i % 50}",
+                "company": rng.choice(companies),
+                "location": "Austin, TX, US",
+                # Indeed gives strings, the other sites dates
+                "date_posted": posted.isoformat() if site == "indeed" else posted,
+                "job_type": rng.choice(["fulltime", "contract", None]),
+                "salary_source": "direct_data" if amount else None,
+                "interval": "yearly" if amount else None,
+                "min_amount": amount,
+                "max_amount": amount and amount + 20000,
+                "currency": "USD" if amount else None,
+                "is_remote": rng.random() < 0.3,
+                "description": "Build and run data pipelines in Python. " * 40,
+            }
+        )
+    return pd.DataFrame(rows).reindex(columns=desired_order)
+
+
+def sort_ms(jobs_df: pd.DataFrame, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        jobs_df.sort_values(by=["site", "date_posted"], ascending=[True, False])
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--pyarrow", action="store_true", help="pyarrow strings")
+    args = parser.parse_args()
+
+    untyped = synthetic_frame(args.rows)
+    frames = {"object": untyped}
+    start = time.perf_counter()
+    frames["typed"] = typed_frame(untyped)
+    convert_ms = (time.perf_counter() - start) * 1000
+    if args.pyarrow:
+        frames["typed pyarrow"] = typed_frame(untyped, "pyarrow")
+
+    print(f"typed_frame conversion of {args.rows} rows: {convert_ms:.0f} ms")
+    print(f"{'output':<15}{'MB':>10}{'sort ms':>10}")
+    for name, jobs_df in frames.items():
+        size = jobs_df.memory_usage(deep=True).sum() / 1e6
+        try:
+            line = f"{sort_ms(jobs_df, args.repeat):>10.1f}"
+        except TypeError:
+            # dates and strings in one object column don't compare
+            line = f"{'fails':>10}"
+        print(f"{name:<15}{size:>10.1f}{line}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,30 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Tuple
+from concurrent.futures import CancelledError, as_completed
+from typing import Callable, Tuple
 
 import pandas as pd
 
+from jobspy.arrow import DatasetWriter, import_pyarrow, rows_to_table, write_dataset
 from jobspy.bayt import BaytScraper
+from jobspy.budget import ResultsBudget, trim_to_budget
+from jobspy.checkpoint import CheckpointStore
+from jobspy.exception import CircuitOpenException, RequestBudgetException
+from jobspy.executor import ScrapeExecutor, configure_executor, get_executor
 from jobspy.glassdoor import Glassdoor
 from jobspy.google import Google
+from jobspy.identity import IdentityPool
 from jobspy.indeed import Indeed
 from jobspy.linkedin import LinkedIn
+from jobspy.memory import MemoryBound
 from jobspy.naukri import Naukri
+from jobspy.retry import CircuitBreaker, RetryPolicy
+from jobspy.session_state import SessionStateStore
+from jobspy.sink import PageSink
+from jobspy.store import JobStore, search_jobs
+from jobspy.shard import ShardCoverage, cap_merged_jobs, plan_shards, merge_shard_jobs
 from jobspy.model import JobType, Location, JobResponse, Country
-from jobspy.model import SalarySource, ScraperInput, Site
+from jobspy.model import JobFilter, SalarySource, ScraperInput, Site
 from jobspy.util import (
     set_logger_level,
     extract_salary,
@@ -21,9 +33,21 @@ from jobspy.util import (
     map_str_to_site,
     convert_to_annual,
     desired_order,
+    job_to_row,
+    typed_frame,
 )
 from jobspy.ziprecruiter import ZipRecruiter
 
+SCRAPER_MAPPING = {
+    Site.LINKEDIN: LinkedIn,
+    Site.INDEED: Indeed,
+    Site.ZIP_RECRUITER: ZipRecruiter,
+    Site.GLASSDOOR: Glassdoor,
+    Site.GOOGLE: Google,
+    Site.BAYT: BaytScraper,
+    Site.NAUKRI: Naukri,
+}
+
 
 def scrape_jobs(
     site_name: str | list[str] | Site | list[Site] | None = None,
@@ -41,26 +65,56 @@ def scrape_jobs(
     description_format: str = "markdown",
     linkedin_fetch_description: bool | None = False,
     linkedin_company_ids: list[int] | None = None,
+    indeed_two_phase: bool = False,
+    zip_fetch_details: str = "always",
     offset: int | None = 0,
     hours_old: int = None,
     enforce_annual_salary: bool = False,
     verbose: int = 0,
+    executor: ScrapeExecutor | None = None,
+    page_fanout: int = 1,
+    stream_json: bool = False,
+    shard_by: list[str] | None = None,
+    shard_locations: list[str] | None = None,
+    session_state: str | SessionStateStore | None = None,
+    identity_pool: IdentityPool | bool | None = None,
+    retry_policy: RetryPolicy | None = None,
+    filters: JobFilter | dict | None = None,
+    total_results_wanted: int | None = None,
+    site_priority: list[str | Site] | None = None,
+    store: JobStore | str | None = None,
+    on_page: Callable[[str, list[dict]], None] | None = None,
+    checkpoints: str | CheckpointStore | None = None,
+    memory: MemoryBound | dict | None = None,
+    dtype_backend: str | None = None,
+    as_arrow: bool = False,
     **kwargs,
 ) -> pd.DataFrame:
     """
     Scrapes job data from job boards concurrently
     :return: Pandas DataFrame containing job data
     """
-    SCRAPER_MAPPING = {
-        Site.LINKEDIN: LinkedIn,
-        Site.INDEED: Indeed,
-        Site.ZIP_RECRUITER: ZipRecruiter,
-        Site.GLASSDOOR: Glassdoor,
-        Site.GOOGLE: Google,
-        Site.BAYT: BaytScraper,
-        Site.NAUKRI: Naukri,
-    }
     set_logger_level(verbose)
+    executor = executor or get_executor()
+    if isinstance(session_state, str):
+        session_state = SessionStateStore(session_state)
+    if isinstance(checkpoints, str):
+        checkpoints = CheckpointStore(checkpoints)
+    if isinstance(memory, dict):
+        memory = MemoryBound(**memory)
+    if as_arrow:
+        # fail before scraping, not after
+        import_pyarrow()
+        if memory:
+            raise ValueError("memory and as_arrow can't be combined")
+    if identity_pool is True:
+        identity_pool = IdentityPool(proxies=proxies)
+    retry_policy = retry_policy or RetryPolicy()
+    if isinstance(filters, dict):
+        filters = JobFilter(**filters)
+    if filters and filters.is_remote:
+        # every site has a native remote filter
+        is_remote = True
     job_type = get_enum_from_value(job_type) if job_type else None
 
     def get_site_type():
@@ -77,6 +131,30 @@ def scrape_jobs(
         return site_types
 
     country_enum = Country.from_string(country_indeed)
+    budget = None
+    if total_results_wanted:
+        # any one site may fill the whole budget
+        budget = ResultsBudget(total_results_wanted)
+        results_wanted = total_results_wanted
+    site_order = [
+        (map_str_to_site(site) if isinstance(site, str) else site).value
+        for site in site_priority or []
+    ]
+
+    job_store = JobStore(store) if isinstance(store, str) else store
+    if memory and memory.store is None:
+        # spilled rows leave the DataFrame, so they are stored as they spill
+        memory.store = job_store
+    sink = None
+    if on_page is not None:
+        sink = PageSink(
+            on_page,
+            country_enum,
+            results_wanted,
+            total_results_wanted,
+            enforce_annual_salary,
+            store=job_store,
+        )
 
     scraper_input = ScraperInput(
         site_type=get_site_type(),
@@ -92,16 +170,49 @@ def scrape_jobs(
         linkedin_fetch_description=linkedin_fetch_description,
         results_wanted=results_wanted,
         linkedin_company_ids=linkedin_company_ids,
+        indeed_two_phase=indeed_two_phase,
+        zip_fetch_details=zip_fetch_details,
         offset=offset,
         hours_old=hours_old,
+        page_fanout=page_fanout,
+        stream_json=stream_json,
+        filters=filters,
     )
 
-    def scrape_site(site: Site) -> Tuple[str, JobResponse]:
+    # sites stopped early, with the reason
+    site_errors: dict[str, str] = {}
+
+    def scrape_site(
+        site: Site, site_input: ScraperInput = scraper_input
+    ) -> Tuple[str, JobResponse]:
         scraper_class = SCRAPER_MAPPING[site]
-        scraper = scraper_class(proxies=proxies, ca_cert=ca_cert)
-        scraped_data: JobResponse = scraper.scrape(scraper_input)
+        scraper = scraper_class(
+            proxies=proxies,
+            ca_cert=ca_cert,
+            executor=executor,
+            session_state=session_state,
+            identity_pool=identity_pool or None,
+            retry_policy=retry_policy,
+            budget=budget,
+            on_page=sink,
+            checkpoints=checkpoints,
+            memory=memory,
+        )
         cap_name = site.value.capitalize()
         site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
+        try:
+            scraped_data: JobResponse = scraper.scrape(site_input)
+        except (CircuitOpenException, RequestBudgetException) as e:
+            # the site blocked us or used up its requests, the other sites carry on
+            create_logger(site_name).warning(f"stopped early: {e}")
+            site_errors[site.value] = str(e)
+            jobs = scraper.collected_jobs(site_input.results_wanted)
+            scraped_data = JobResponse(jobs=jobs)
+        finally:
+            scraper.close()
+        if sink:
+            # jobs found after the last page_done, e.g. once results_wanted is met
+            sink(site, scraped_data.jobs)
         create_logger(site_name).info(f"finished scraping")
         return site.value, scraped_data
 
@@ -109,88 +220,105 @@ def scrape_jobs(
 
     def worker(site):
         site_val, scraped_info = scrape_site(site)
+        if sink:
+            # rows already went to on_page, don't hold on to the jobs
+            scraped_info = JobResponse(jobs=[])
         return site_val, scraped_info
 
-    with ThreadPoolExecutor() as executor:
-        future_to_site = {
-            executor.submit(worker, site): site for site in scraper_input.site_type
+    shard_coverage: list[ShardCoverage] = []
+    if shard_by:
+        shards = plan_shards(scraper_input, shard_by, shard_locations)
+        future_to_shard = {
+            executor.submit_site(scrape_site, shard.site, shard.scraper_input): shard
+            for shard in shards
         }
+        seen_ids = {site.value: set() for site in scraper_input.site_type}
+        merged_jobs = {site.value: [] for site in scraper_input.site_type}
+        for future in as_completed(future_to_shard):
+            shard = future_to_shard[future]
+            site_value, scraped_data = future.result()
+            shard_coverage.append(
+                merge_shard_jobs(
+                    shard,
+                    scraped_data.jobs,
+                    seen_ids[site_value],
+                    merged_jobs[site_value],
+                )
+            )
+        for site_value, jobs in merged_jobs.items():
+            coverages = [c for c in shard_coverage if c.site.value == site_value]
+            jobs = cap_merged_jobs(jobs, coverages, results_wanted)
+            if sink:
+                jobs = []
+            site_to_jobs_dict[site_value] = JobResponse(jobs=jobs)
+    else:
+        sites = sorted(
+            scraper_input.site_type,
+            key=lambda site: (
+                site_order.index(site.value) if site.value in site_order else 99
+            ),
+        )
+        future_to_site = {executor.submit_site(worker, site): site for site in sites}
 
         for future in as_completed(future_to_site):
-            site_value, scraped_data = future.result()
+            try:
+                site_value, scraped_data = future.result()
+            except CancelledError:
+                continue
+            if memory and not budget:
+                # rows are collected as sites finish so the JobPosts can go
+                memory.add(
+                    site_value, scraped_data.jobs, country_enum, enforce_annual_salary
+                )
+                scraped_data = JobResponse(jobs=[])
             site_to_jobs_dict[site_value] = scraped_data
+            if budget and budget.met.is_set():
+                # sites still queued never start, running ones stop after their page
+                for pending in future_to_site:
+                    pending.cancel()
+
+    if budget:
+        completed = list(site_to_jobs_dict)
+        trimmed = trim_to_budget(
+            {site: response.jobs for site, response in site_to_jobs_dict.items()},
+            total_results_wanted,
+            site_order or completed,
+        )
+        site_to_jobs_dict = {
+            site: JobResponse(jobs=jobs) for site, jobs in trimmed.items()
+        }
+
+    attrs = {"executor": executor.metrics(), "retries": retry_policy.retries}
+    if site_errors:
+        attrs["site_errors"] = site_errors
+    if shard_by:
+        attrs["shard_coverage"] = [coverage.summary() for coverage in shard_coverage]
+
+    if as_arrow:
+        # straight from the jobs to arrow, attrs go in the schema metadata
+        rows = [
+            job_to_row(job, site, country_enum, enforce_annual_salary)
+            for site, job_response in site_to_jobs_dict.items()
+            for job in job_response.jobs
+        ]
+        if job_store is not None and not sink and rows:
+            job_store.upsert(pd.DataFrame(rows))
+        if isinstance(store, str):
+            job_store.close()
+        return rows_to_table(rows, attrs)
 
     jobs_dfs: list[pd.DataFrame] = []
 
     for site, job_response in site_to_jobs_dict.items():
+        if memory:
+            memory.add(site, job_response.jobs, country_enum, enforce_annual_salary)
+            continue
         for job in job_response.jobs:
-            job_data = job.dict()
-            job_url = job_data["job_url"]
-            job_data["site"] = site
-            job_data["company"] = job_data["company_name"]
-            job_data["job_type"] = (
-                ", ".join(job_type.value[0] for job_type in job_data["job_type"])
-                if job_data["job_type"]
-                else None
-            )
-            job_data["emails"] = (
-                ", ".join(job_data["emails"]) if job_data["emails"] else None
-            )
-            if job_data["location"]:
-                job_data["location"] = Location(
-                    **job_data["location"]
-                ).display_location()
-
-            # Handle compensation
-            compensation_obj = job_data.get("compensation")
-            if compensation_obj and isinstance(compensation_obj, dict):
-                job_data["interval"] = (
-                    compensation_obj.get("interval").value
-                    if compensation_obj.get("interval")
-                    else None
-                )
-                job_data["min_amount"] = compensation_obj.get("min_amount")
-                job_data["max_amount"] = compensation_obj.get("max_amount")
-                job_data["currency"] = compensation_obj.get("currency", "USD")
-                job_data["salary_source"] = SalarySource.DIRECT_DATA.value
-                if enforce_annual_salary and (
-                    job_data["interval"]
-                    and job_data["interval"] != "yearly"
-                    and job_data["min_amount"]
-                    and job_data["max_amount"]
-                ):
-                    convert_to_annual(job_data)
-            else:
-                if country_enum == Country.USA:
-                    (
-                        job_data["interval"],
-                        job_data["min_amount"],
-                        job_data["max_amount"],
-                        job_data["currency"],
-                    ) = extract_salary(
-                        job_data["description"],
-                        enforce_annual_salary=enforce_annual_salary,
-                    )
-                    job_data["salary_source"] = SalarySource.DESCRIPTION.value
-
-            job_data["salary_source"] = (
-                job_data["salary_source"]
-                if "min_amount" in job_data and job_data["min_amount"]
-                else None
-            )
-
-            #naukri-specific fields
-            job_data["skills"] = (
-                ", ".join(job_data["skills"]) if job_data["skills"] else None
-            )
-            job_data["experience_range"] = job_data.get("experience_range")
-            job_data["company_rating"] = job_data.get("company_rating")
-            job_data["company_reviews_count"] = job_data.get("company_reviews_count")
-            job_data["vacancy_count"] = job_data.get("vacancy_count")
-            job_data["work_from_home_type"] = job_data.get("work_from_home_type")
-
+            job_data = job_to_row(job, site, country_enum, enforce_annual_salary)
             job_df = pd.DataFrame([job_data])
             jobs_dfs.append(job_df)
+    if memory and memory.rows:
+        jobs_dfs.append(memory.frame())
 
     if jobs_dfs:
         # Step 1: Filter out all-NA columns from each DataFrame before concatenation
@@ -206,10 +334,22 @@ def scrape_jobs(
 
         # Reorder the DataFrame according to the desired order
         jobs_df = jobs_df[desired_order]
+        if dtype_backend:
+            jobs_df = typed_frame(jobs_df, dtype_backend)
 
         # Step 4: Sort the DataFrame as required
-        return jobs_df.sort_values(
+        jobs_df = jobs_df.sort_values(
             by=["site", "date_posted"], ascending=[True, False]
         ).reset_index(drop=True)
     else:
-        return pd.DataFrame()
\ No newline at end of file
+        jobs_df = pd.DataFrame()
+    jobs_df.attrs.update(attrs)
+    if memory:
+        jobs_df.attrs["memory"] = memory.report()
+    if job_store is not None and not sink:
+        job_store.upsert(jobs_df)
+    if isinstance(store, str):
+        job_store.close()
+        if memory and memory.store is job_store:
+            memory.store = None
+    return jobs_df
\ No newline at end of file
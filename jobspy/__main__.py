@@ -0,0 +1,3 @@
+from jobspy.cli import main
+
+main()
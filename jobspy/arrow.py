@@ -0,0 +1,160 @@
+"""
+Arrow output without going through pandas (pip install -U "python-jobspy[arrow]"):
+scrape_jobs(as_arrow=True) returns a pyarrow.Table, and write_dataset streams
+each scraped page into a hive-partitioned Parquet dataset.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date
+from pathlib import Path
+from typing import Iterable
+from urllib.parse import quote
+
+from jobspy.util import create_logger, desired_order, json_dumps
+
+log = create_logger("Arrow")
+
+# arrow types of the JobPost fields that are not strings
+arrow_types = {
+    "date_posted": "date32",
+    "min_amount": "float64",
+    "max_amount": "float64",
+    "is_remote": "bool_",
+    "company_rating": "float64",
+    "company_reviews_count": "int64",
+    "vacancy_count": "int64",
+}
+default_partitions = ["site", "date_posted"]
+
+
+def import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            'arrow output needs pyarrow: pip install -U "python-jobspy[arrow]"'
+        )
+    return pyarrow
+
+
+def job_schema(exclude: Iterable[str] = ()):
+    """Fixed schema of the scrape_jobs columns"""
+    pa = import_pyarrow()
+    return pa.schema(
+        [
+            (column, getattr(pa, arrow_types.get(column, "string"))())
+            for column in desired_order
+            if column not in exclude
+        ]
+    )
+
+
+def arrow_row(row: dict) -> dict:
+    """Projects a job row to the schema columns, parsing Indeed's date strings"""
+    row = {column: row.get(column) for column in desired_order}
+    if isinstance(row["date_posted"], str):
+        try:
+            row["date_posted"] = date.fromisoformat(row["date_posted"])
+        except ValueError:
+            row["date_posted"] = None
+    return row
+
+
+def rows_to_table(rows: list[dict], metadata: dict | None = None):
+    """
+    :param rows: job rows, put in the scrape_jobs order (site, newest first)
+    :param metadata: stored as JSON under the "jobspy" schema metadata key
+    """
+    pa = import_pyarrow()
+    rows = sorted(
+        (arrow_row(row) for row in rows),
+        key=lambda row: row["date_posted"] or date.min,
+        reverse=True,
+    )
+    rows.sort(key=lambda row: row["site"])
+    table = pa.Table.from_pylist(rows, schema=job_schema())
+    if metadata:
+        table = table.replace_schema_metadata({"jobspy": json_dumps(metadata)})
+    return table
+
+
+class DatasetWriter:
+    """
+    on_page callback appending each page to a Parquet dataset under path,
+    partitioned hive style, by default as site=indeed/date_posted=2024-05-01/.
+    Each partition gets one file per writer with one row group per page; close
+    the writer to finish the files.
+    """
+
+    def __init__(self, path: str | Path, partition_by: list[str] | None = None):
+        self.pa = import_pyarrow()
+        self.path = Path(path)
+        if partition_by is None:
+            partition_by = default_partitions
+        self.partition_by = list(partition_by)
+        unknown = set(self.partition_by) - set(desired_order)
+        if unknown:
+            raise ValueError(f"unknown partition columns: {', '.join(unknown)}")
+        self.schema = job_schema(exclude=self.partition_by)
+        self.name = f"part-{uuid.uuid4().hex}.parquet"
+        self.writers = {}
+        self.files: list[str] = []
+        self.rows_written = 0
+
+    def partition(self, row: dict) -> Path:
+        directory = self.path
+        for column in self.partition_by:
+            value = row[column]
+            value = "__HIVE_DEFAULT_PARTITION__" if value is None else str(value)
+            directory /= f"{column}={quote(value, safe='')}"
+        return directory
+
+    def __call__(self, site: str, rows: list[dict]):
+        pages: dict[Path, list[dict]] = {}
+        for row in map(arrow_row, rows):
+            pages.setdefault(self.partition(row), []).append(row)
+        for directory, page in pages.items():
+            writer = self.writers.get(directory)
+            if writer is None:
+                directory.mkdir(parents=True, exist_ok=True)
+                path = str(directory / self.name)
+                writer = self.pa.parquet.ParquetWriter(path, self.schema)
+                self.writers[directory] = writer
+                self.files.append(path)
+            writer.write_table(self.pa.Table.from_pylist(page, schema=self.schema))
+            self.rows_written += len(page)
+
+    def close(self):
+        for writer in self.writers.values():
+            writer.close()
+        self.writers = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_dataset(
+    path: str | Path,
+    partition_by: list[str] | None = None,
+    **scrape_params,
+) -> list[str]:
+    """
+    Scrapes straight into a Parquet dataset, one row group per scraped page,
+    without building a DataFrame
+    :param partition_by: columns partitioning the dataset, site and date_posted
+        by default, [] for none
+    :param scrape_params: scrape_jobs parameters
+    :return: the files written
+    """
+    from jobspy import scrape_jobs
+
+    with DatasetWriter(path, partition_by) as writer:
+        scrape_jobs(**scrape_params, on_page=writer)
+    log.info(f"wrote {writer.rows_written} jobs to {len(writer.files)} files")
+    return writer.files
@@ -14,6 +14,7 @@ from jobspy.model import (
     Location,
     Country,
 )
+from jobspy.pagination import fan_out_pages
 from jobspy.util import create_logger, create_session
 
 log = create_logger("Bayt")
@@ -25,9 +26,12 @@ class BaytScraper(Scraper):
     band_delay = 3
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        **kwargs,
     ):
-        super().__init__(Site.BAYT, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(Site.BAYT, proxies=proxies, ca_cert=ca_cert, **kwargs)
         self.scraper_input = None
         self.session = None
         self.country = "worldwide"
@@ -35,7 +39,13 @@ class BaytScraper(Scraper):
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         self.scraper_input = scraper_input
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            is_tls=False,
+            has_retry=True,
+            identity=self.identity,
+            site=self.site,
+            retry_policy=self.retry_policy,
         )
         job_list: list[JobPost] = []
         page = 1
@@ -43,50 +53,85 @@ class BaytScraper(Scraper):
             scraper_input.results_wanted if scraper_input.results_wanted else 10
         )
 
+        if scraper_input.page_fanout > 1:
+            pages = fan_out_pages(
+                self.executor,
+                self.site,
+                lambda page: self._fetch_jobs(self.scraper_input.search_term, page),
+                page,
+                scraper_input.page_fanout,
+                between_batches=self._sleep,
+            )
+            for page, job_elements in enumerate(pages, start=page):
+                extracted = self._process_page(job_elements, job_list, results_wanted)
+                if not extracted:
+                    log.info(f"No new jobs found on page {page}. Ending pagination.")
+                    break
+                if len(job_list) >= results_wanted or self.page_done(job_list):
+                    break
+            pages.close()
+            return JobResponse(jobs=job_list[: scraper_input.results_wanted])
+
         while len(job_list) < results_wanted:
             log.info(f"Fetching Bayt jobs page {page}")
             job_elements = self._fetch_jobs(self.scraper_input.search_term, page)
             if not job_elements:
                 break
 
-            if job_elements:
-                log.debug(
-                    "First job element snippet:\n" + job_elements[0].prettify()[:500]
-                )
-
-            initial_count = len(job_list)
-            for job in job_elements:
-                try:
-                    job_post = self._extract_job_info(job)
-                    if job_post:
-                        job_list.append(job_post)
-                        if len(job_list) >= results_wanted:
-                            break
-                    else:
-                        log.debug(
-                            "Extraction returned None. Job snippet:\n"
-                            + job.prettify()[:500]
-                        )
-                except Exception as e:
-                    log.error(f"Bayt: Error extracting job info: {str(e)}")
-                    continue
-
-            if len(job_list) == initial_count:
+            if not self._process_page(job_elements, job_list, results_wanted):
                 log.info(f"No new jobs found on page {page}. Ending pagination.")
                 break
+            if self.page_done(job_list):
+                break
 
             page += 1
-            time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+            self._sleep()
 
         job_list = job_list[: scraper_input.results_wanted]
         return JobResponse(jobs=job_list)
 
+    def _sleep(self):
+        time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+
+    def _process_page(
+        self, job_elements: list, job_list: list[JobPost], results_wanted: int
+    ) -> int:
+        """
+        Extracts the job listings of a page into job_list, keeping the ones that
+        pass scraper_input.filters.
+        :return: number of jobs extracted, whether kept or filtered out
+        """
+        log.debug("First job element snippet:\n" + job_elements[0].prettify()[:500])
+
+        extracted = 0
+        filters = self.scraper_input.filters
+        for job in job_elements:
+            try:
+                job_post = self._extract_job_info(job)
+                if job_post:
+                    extracted += 1
+                    if filters and not filters.accepts_job(job_post):
+                        continue
+                    job_list.append(job_post)
+                    if len(job_list) >= results_wanted:
+                        break
+                else:
+                    log.debug(
+                        "Extraction returned None. Job snippet:\n"
+                        + job.prettify()[:500]
+                    )
+            except Exception as e:
+                log.error(f"Bayt: Error extracting job info: {str(e)}")
+                continue
+        return extracted
+
     def _fetch_jobs(self, query: str, page: int) -> list | None:
         """
         Grabs the job results for the given query and page number.
         """
         try:
             url = f"{self.base_url}/en/international/jobs/{query}-jobs/?page={page}"
+            self.executor.throttle(self.site)
             response = self.session.get(url)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, "html.parser")
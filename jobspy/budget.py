@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import threading
+
+
+class ResultsBudget:
+    """
+    One results budget shared by the scrapers of a scrape_jobs call. Scrapers
+    report how many jobs they hold after each page and stop paginating once the
+    jobs reported by all of them reach total.
+    """
+
+    def __init__(self, total: int):
+        self.total = total
+        self.counts: dict[int, int] = {}
+        self.lock = threading.Lock()
+        self.met = threading.Event()
+
+    def report(self, scraper_key: int, jobs_found: int) -> bool:
+        """
+        :return: whether the budget is met and the scraper should stop
+        """
+        with self.lock:
+            self.counts[scraper_key] = jobs_found
+            if sum(self.counts.values()) >= self.total:
+                self.met.set()
+        return self.met.is_set()
+
+    @property
+    def jobs_found(self) -> int:
+        with self.lock:
+            return sum(self.counts.values())
+
+
+def trim_to_budget(
+    site_to_jobs: dict[str, list], total: int, site_order: list[str]
+) -> dict[str, list]:
+    """
+    Keeps the first total jobs, taking each site's jobs in turn in site_order
+    :param site_order: site values by priority, sites missing from it go last
+    """
+    ordered = [site for site in site_order if site in site_to_jobs]
+    ordered += [site for site in site_to_jobs if site not in ordered]
+    trimmed = {}
+    remaining = total
+    for site in ordered:
+        trimmed[site] = site_to_jobs[site][: max(remaining, 0)]
+        remaining -= len(trimmed[site])
+    return trimmed
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from datetime import date
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from jobspy.model import (
+    CompensationInterval,
+    Country,
+    JobPost,
+    JobType,
+    ScraperInput,
+    Site,
+)
+from jobspy.util import create_logger, json_dumps, json_loads
+
+log = create_logger("Checkpoint")
+
+enum_types = {cls.__name__: cls for cls in (CompensationInterval, Country, JobType)}
+# fields that change which slice of the results a run wants, not the results
+slice_fields = {"offset", "results_wanted", "page_fanout", "stream_json"}
+
+
+def _encode(value):
+    """Makes job fields JSON-safe, enums by name since their values are tuples"""
+    if isinstance(value, Enum):
+        return {"__enum__": f"{type(value).__name__}.{value.name}"}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _decode(value):
+    if isinstance(value, dict):
+        if "__enum__" in value:
+            type_name, name = value["__enum__"].split(".")
+            return enum_types[type_name][name]
+        if "__date__" in value:
+            return date.fromisoformat(value["__date__"])
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+def _digest(data: str) -> str:
+    return hashlib.sha1(data.encode()).hexdigest()
+
+
+class CheckpointStore:
+    """
+    SQLite record of pagination state, kept for ttl seconds. For each query it
+    caches the cursor found at each result position, so a later run with a
+    larger offset starts from the nearest cursor instead of page one. For each
+    run it keeps the next cursor and the jobs collected so far, so a run that
+    died part way through resumes where it stopped.
+    """
+
+    def __init__(self, path: str | Path = "checkpoints.db", ttl: float = 3600):
+        self.path = str(path)
+        self.ttl = ttl
+        self.conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS cursors (
+                    query TEXT, position INTEGER, cursor TEXT, updated REAL,
+                    PRIMARY KEY (query, position)
+                );
+                CREATE TABLE IF NOT EXISTS runs (
+                    run TEXT PRIMARY KEY, position INTEGER, cursor TEXT,
+                    updated REAL
+                );
+                CREATE TABLE IF NOT EXISTS run_jobs (
+                    run TEXT, seq INTEGER, job TEXT, PRIMARY KEY (run, seq)
+                );
+                """
+            )
+
+    def open(self, site: Site, scraper_input: ScraperInput) -> Checkpoint:
+        query = scraper_input.model_dump_json(exclude=slice_fields)
+        run = scraper_input.model_dump_json()
+        return Checkpoint(self, _digest(site.value + query), _digest(site.value + run))
+
+    def nearest_cursor(
+        self, query: str, position: int, exact: bool = False
+    ) -> tuple[int, Any] | None:
+        comparison = "=" if exact else "<="
+        with self.lock:
+            row = self.conn.execute(
+                f"SELECT position, cursor FROM cursors WHERE query = ? "
+                f"AND position {comparison} ? AND updated > ? "
+                f"ORDER BY position DESC LIMIT 1",
+                (query, position, time.time() - self.ttl),
+            ).fetchone()
+        return (row[0], json_loads(row[1])) if row else None
+
+    def load_run(self, run: str) -> tuple[int, Any, list[JobPost]] | None:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT position, cursor FROM runs WHERE run = ? AND updated > ?",
+                (run, time.time() - self.ttl),
+            ).fetchone()
+            if row is None:
+                return None
+            jobs = self.conn.execute(
+                "SELECT job FROM run_jobs WHERE run = ? ORDER BY seq", (run,)
+            ).fetchall()
+        jobs = [JobPost(**_decode(json_loads(job))) for (job,) in jobs]
+        return row[0], json_loads(row[1]), jobs
+
+    def save(
+        self,
+        query: str,
+        run: str,
+        cursor: Any,
+        position: int | None,
+        start_position: int,
+        new_jobs: list[JobPost],
+        first_seq: int,
+    ):
+        now = time.time()
+        cursor_json = json_dumps(cursor)
+        rows = [
+            (run, first_seq + i, json_dumps(_encode(job.model_dump())))
+            for i, job in enumerate(new_jobs)
+        ]
+        with self.lock, self.conn:
+            if position is not None:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO cursors VALUES (?, ?, ?, ?)",
+                    (query, position, cursor_json, now),
+                )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?)",
+                (run, start_position, cursor_json, now),
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO run_jobs VALUES (?, ?, ?)", rows
+            )
+
+    def finish(self, run: str):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM runs WHERE run = ?", (run,))
+            self.conn.execute("DELETE FROM run_jobs WHERE run = ?", (run,))
+
+    def purge(self):
+        """Deletes state older than ttl"""
+        cutoff = time.time() - self.ttl
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM cursors WHERE updated <= ?", (cutoff,))
+            stale = "SELECT run FROM runs WHERE updated <= ?"
+            self.conn.execute(f"DELETE FROM run_jobs WHERE run IN ({stale})", (cutoff,))
+            self.conn.execute("DELETE FROM runs WHERE updated <= ?", (cutoff,))
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+class Checkpoint:
+    """
+    Pagination state of one scrape. Without a store every call is a no-op, so
+    scrapers use it unconditionally.
+    """
+
+    def __init__(self, store: CheckpointStore | None, query: str = "", run: str = ""):
+        self.store = store
+        self.query = query
+        self.run = run
+        self.start_position = 0
+        self.saved_jobs = 0
+
+    def start(self, position: int = 0, exact: bool = False) -> tuple[Any, int, list]:
+        """
+        Finds where to start paginating for results from position on
+        :param exact: only a cursor cached at exactly position will do
+        :return: cursor to start from (None for the first page), the position the
+            cursor starts at (0 for the first page), and the jobs a resumed run
+            had already collected
+        """
+        if self.store is None:
+            return None, 0, []
+        resumed = self.store.load_run(self.run)
+        if resumed is not None:
+            self.start_position, cursor, jobs = resumed
+            self.saved_jobs = len(jobs)
+            log.info(f"resuming after {len(jobs)} jobs")
+            return cursor, self.start_position, jobs
+        cached = self.store.nearest_cursor(self.query, position, exact)
+        if cached is not None:
+            self.start_position, cursor = cached
+            log.info(f"starting from the cursor cached at result {self.start_position}")
+            return cursor, self.start_position, []
+        return None, 0, []
+
+    def save(self, cursor: Any, job_list: list[JobPost], position: int | None = None):
+        """
+        Records the cursor of the next page after a page was processed
+        :param job_list: jobs collected since start, only new ones are written
+        :param position: result position the cursor starts at, to cache it for
+            later offsets; None when the site has no use for it
+        """
+        if self.store is None or cursor is None:
+            return
+        self.store.save(
+            self.query,
+            self.run,
+            cursor,
+            position,
+            self.start_position,
+            job_list[self.saved_jobs :],
+            self.saved_jobs,
+        )
+        self.saved_jobs = len(job_list)
+
+    def finish(self):
+        """Drops the run's resume state once it completed"""
+        if self.store is not None:
+            self.store.finish(self.run)
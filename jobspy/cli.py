@@ -0,0 +1,137 @@
+"""
+jobspy console script: maps the scrape_jobs parameters to flags and writes rows
+as each page of results completes, e.g.
+
+    jobspy --site-name indeed linkedin --search-term python --results-wanted 500
+    jobspy --search-term python --format csv --output jobs.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import inspect
+import sys
+from typing import IO
+
+from jobspy import scrape_jobs
+from jobspy.arrow import arrow_row, import_pyarrow, job_schema
+from jobspy.util import desired_order, json_dumps, json_loads
+
+# parameters taking several values, with the type of each value
+list_params = {
+    "site_name": str,
+    "proxies": str,
+    "linkedin_company_ids": int,
+    "shard_by": str,
+    "shard_locations": str,
+    "site_priority": str,
+}
+# parameters that only make sense from Python, or not when streaming pages
+python_params = {
+    "executor",
+    "retry_policy",
+    "on_page",
+    "memory",
+    "dtype_backend",
+    "as_arrow",
+    "kwargs",
+}
+
+
+class NDJSONWriter:
+    def __init__(self, out: IO[str]):
+        self.out = out
+
+    def write(self, rows: list[dict]):
+        for row in rows:
+            self.out.write(json_dumps(row) + "\n")
+        self.out.flush()
+
+    def close(self):
+        pass
+
+
+class CSVWriter:
+    def __init__(self, out: IO[str]):
+        self.out = out
+        self.writer = csv.DictWriter(out, fieldnames=desired_order)
+        self.writer.writeheader()
+
+    def write(self, rows: list[dict]):
+        self.writer.writerows(rows)
+        self.out.flush()
+
+    def close(self):
+        pass
+
+
+class ParquetWriter:
+    """Writes each page as a row group of one file (pip install pyarrow)"""
+
+    def __init__(self, path: str):
+        self.pa = import_pyarrow()
+        self.schema = job_schema()
+        self.writer = self.pa.parquet.ParquetWriter(path, self.schema)
+
+    def write(self, rows: list[dict]):
+        rows = [arrow_row(row) for row in rows]
+        table = self.pa.Table.from_pylist(rows, schema=self.schema)
+        self.writer.write_table(table)
+
+    def close(self):
+        self.writer.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """One flag per scrape_jobs parameter, e.g. --results-wanted for results_wanted"""
+    parser = argparse.ArgumentParser(
+        prog="jobspy", description="Scrapes job boards and streams the jobs found"
+    )
+    for name, param in inspect.signature(scrape_jobs).parameters.items():
+        if name in python_params:
+            continue
+        flag = "--" + name.replace("_", "-")
+        annotation = str(param.annotation)
+        if name in list_params:
+            parser.add_argument(flag, nargs="+", type=list_params[name])
+        elif name == "filters":
+            parser.add_argument(flag, type=json_loads, help="JSON object")
+        elif annotation.startswith("bool") or "| bool" in annotation:
+            parser.add_argument(flag, action=argparse.BooleanOptionalAction)
+        elif annotation.startswith("int"):
+            parser.add_argument(flag, type=int)
+        else:
+            parser.add_argument(flag)
+    parser.add_argument(
+        "--format", choices=["ndjson", "csv", "parquet"], default="ndjson"
+    )
+    parser.add_argument("--output", "-o", help="file to write, stdout by default")
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    args = vars(build_parser().parse_args(argv))
+    output_format = args.pop("format")
+    output = args.pop("output")
+    # unset flags keep the scrape_jobs defaults
+    params = {name: value for name, value in args.items() if value is not None}
+
+    if output_format == "parquet":
+        if not output:
+            raise SystemExit("--format parquet needs --output")
+        writer = ParquetWriter(output)
+        out = None
+    else:
+        out = open(output, "w", newline="") if output else sys.stdout
+        writer = (CSVWriter if output_format == "csv" else NDJSONWriter)(out)
+    try:
+        scrape_jobs(**params, on_page=lambda site, rows: writer.write(rows))
+    finally:
+        writer.close()
+        if out is not None and out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
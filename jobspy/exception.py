@@ -37,4 +37,19 @@ class BaytException(Exception):
 
 class NaukriException(Exception):
     def __init__(self,message=None):
-        super().__init__(message or "An error occurred with Naukri")
\ No newline at end of file
+        super().__init__(message or "An error occurred with Naukri")
+
+
+class CircuitOpenException(Exception):
+    def __init__(self, message=None):
+        super().__init__(message or "Requests paused after the site blocked us")
+
+
+class RequestBudgetException(Exception):
+    def __init__(self, message=None):
+        super().__init__(message or "The run used up its requests to the site")
+
+
+class ScrapeFailedException(Exception):
+    def __init__(self, message=None):
+        super().__init__(message or "The scraper logged errors and came back short")
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable
+
+from jobspy.model import Site
+
+# requests per second of the sites that fetch pages concurrently with page_fanout;
+# their sequential pages already sleep longer than this between requests
+default_requests_per_second = {Site.LINKEDIN: 1, Site.NAUKRI: 1, Site.BAYT: 1}
+
+# detail tasks a site may have in flight; Glassdoor and ZipRecruiter keep the
+# concurrency of the thread pool they used to start for each page
+default_detail_quota = {Site.GLASSDOOR: 30, Site.ZIP_RECRUITER: 20}
+
+
+class RateLimiter:
+    """
+    Spaces request starts at least 1 / requests_per_second apart across all
+    threads sharing the limiter
+    """
+
+    def __init__(self, requests_per_second: float | None = None):
+        self.interval = 1 / requests_per_second if requests_per_second else 0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class ScrapeExecutor:
+    """
+    Bounded executor hierarchy shared by all scrapers.
+
+    - site pool: one slot per concurrently running site scrape
+    - detail pool: shared by every site for per-job requests (descriptions,
+      detail pages, page prefetches), with a per-site quota so one site
+      cannot starve the others
+    Both pools are long-lived and reused across pages and scrape_jobs calls.
+
+    detail_quota bounds each site's detail tasks, 16 for the sites missing from
+    default_detail_quota, a dict overriding the defaults per site.
+    requests_per_second caps each site's request rate, a dict overriding
+    default_requests_per_second per site and 0 lifting a site's limit.
+    """
+
+    def __init__(
+        self,
+        site_workers: int | None = None,
+        detail_workers: int = 64,
+        detail_quota: int | dict[Site, int] | None = None,
+        requests_per_second: float | dict[Site, float] | None = None,
+    ):
+        self.site_workers = site_workers or len(Site)
+        self.requests_per_second = requests_per_second
+        self.detail_workers = detail_workers
+        self._detail_quota = detail_quota
+        self.site_pool = ThreadPoolExecutor(
+            max_workers=self.site_workers, thread_name_prefix="jobspy-site"
+        )
+        self.detail_pool = ThreadPoolExecutor(
+            max_workers=self.detail_workers, thread_name_prefix="jobspy-detail"
+        )
+        self._lock = threading.Lock()
+        self._quotas: dict[Site, threading.BoundedSemaphore] = {}
+        self._limiters: dict[Site, RateLimiter] = {}
+        self._in_flight: dict[Site, int] = {}
+        self._submitted: dict[Site, int] = {}
+        self._completed: dict[Site, int] = {}
+
+    def quota_for(self, site: Site) -> int:
+        quota = self._detail_quota
+        if isinstance(quota, dict):
+            quota = quota.get(site, default_detail_quota.get(site, 16))
+        elif quota is None:
+            quota = default_detail_quota.get(site, 16)
+        return min(quota, self.detail_workers)
+
+    def _semaphore(self, site: Site) -> threading.BoundedSemaphore:
+        with self._lock:
+            if site not in self._quotas:
+                self._quotas[site] = threading.BoundedSemaphore(self.quota_for(site))
+            return self._quotas[site]
+
+    def throttle(self, site: Site):
+        """Waits for the site's shared rate limit before a request"""
+        with self._lock:
+            if site not in self._limiters:
+                rate = self.requests_per_second
+                if isinstance(rate, dict):
+                    rate = rate.get(site, default_requests_per_second.get(site))
+                elif rate is None:
+                    rate = default_requests_per_second.get(site)
+                self._limiters[site] = RateLimiter(rate)
+            limiter = self._limiters[site]
+        limiter.wait()
+
+    def submit_site(self, fn: Callable, *args, **kwargs) -> Future:
+        """Runs a whole site scrape in one of the site slots"""
+        return self.site_pool.submit(fn, *args, **kwargs)
+
+    def submit(self, site: Site, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Submits a detail task for site to the shared pool.
+        Blocks the caller (never a pool thread) while the site is at its quota.
+        """
+        semaphore = self._semaphore(site)
+        semaphore.acquire()
+        with self._lock:
+            self._in_flight[site] = self._in_flight.get(site, 0) + 1
+            self._submitted[site] = self._submitted.get(site, 0) + 1
+
+        def release(_):
+            with self._lock:
+                self._in_flight[site] -= 1
+                self._completed[site] = self._completed.get(site, 0) + 1
+            semaphore.release()
+
+        try:
+            future = self.detail_pool.submit(fn, *args, **kwargs)
+        except BaseException:
+            release(None)
+            raise
+        future.add_done_callback(release)
+        return future
+
+    def map(self, site: Site, fn: Callable, items: Iterable) -> list[Future]:
+        """Submits fn(item) for every item, returning the futures in input order"""
+        return [self.submit(site, fn, item) for item in items]
+
+    def metrics(self) -> dict:
+        """Thread and task counts for the site and detail pools"""
+        with self._lock:
+            return {
+                "site_workers": self.site_workers,
+                "site_threads": len(self.site_pool._threads),
+                "detail_workers": self.detail_workers,
+                "detail_threads": len(self.detail_pool._threads),
+                "detail_in_flight": {
+                    site.value: count for site, count in self._in_flight.items()
+                },
+                "detail_submitted": {
+                    site.value: count for site, count in self._submitted.items()
+                },
+                "detail_completed": {
+                    site.value: count for site, count in self._completed.items()
+                },
+                "detail_quota": {site.value: self.quota_for(site) for site in Site},
+            }
+
+    def shutdown(self, wait: bool = True):
+        self.site_pool.shutdown(wait=wait)
+        self.detail_pool.shutdown(wait=wait)
+
+
+_default_executor: ScrapeExecutor | None = None
+_default_lock = threading.Lock()
+
+
+def get_executor() -> ScrapeExecutor:
+    """Returns the process-wide executor, creating it on first use"""
+    global _default_executor
+    with _default_lock:
+        if _default_executor is None:
+            _default_executor = ScrapeExecutor()
+        return _default_executor
+
+
+def configure_executor(
+    site_workers: int | None = None,
+    detail_workers: int = 64,
+    detail_quota: int | dict[Site, int] | None = None,
+    requests_per_second: float | dict[Site, float] | None = None,
+) -> ScrapeExecutor:
+    """
+    Replaces the process-wide executor. The previous one finishes its queued
+    work in the background.
+    """
+    global _default_executor
+    with _default_lock:
+        previous = _default_executor
+        _default_executor = ScrapeExecutor(
+            site_workers=site_workers,
+            detail_workers=detail_workers,
+            detail_quota=detail_quota,
+            requests_per_second=requests_per_second,
+        )
+    if previous is not None:
+        previous.shutdown(wait=False)
+    return _default_executor
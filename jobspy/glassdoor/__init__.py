@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import re
-import json
+import threading
 import requests
-from typing import Tuple
+from typing import Iterable, Tuple
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 
 from jobspy.glassdoor.constant import fallback_token, query_template, headers
 from jobspy.glassdoor.util import (
@@ -13,14 +13,20 @@ from jobspy.glassdoor.util import (
     parse_compensation,
     parse_location,
 )
+from jobspy.pagination import pipelined_pages
 from jobspy.util import (
     extract_emails_from_text,
     create_logger,
     create_session,
     markdown_converter,
+    posted_before,
+    posted_cutoff,
+    json_loads,
+    json_dumps,
 )
 from jobspy.exception import GlassdoorException
 from jobspy.model import (
+    Compensation,
     JobPost,
     JobResponse,
     DescriptionFormat,
@@ -34,13 +40,16 @@ log = create_logger("Glassdoor")
 
 class Glassdoor(Scraper):
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        **kwargs,
     ):
         """
         Initializes GlassdoorScraper with the Glassdoor job search url
         """
         site = Site(Site.GLASSDOOR)
-        super().__init__(site, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(site, proxies=proxies, ca_cert=ca_cert, **kwargs)
 
         self.base_url = None
         self.country = None
@@ -49,6 +58,12 @@ class Glassdoor(Scraper):
         self.jobs_per_page = 30
         self.max_pages = 30
         self.seen_urls = set()
+        self.token_lock = threading.Lock()
+        self.token_from_store = False
+        self.token_refreshed = False
+        self.cutoff = None
+        self.reached_cutoff = False
+        self.page_size = 0
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         """
@@ -59,11 +74,26 @@ class Glassdoor(Scraper):
         self.scraper_input = scraper_input
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
         self.base_url = self.scraper_input.country.get_glassdoor_url()
+        self.cutoff = posted_cutoff(scraper_input.hours_old)
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            has_retry=True,
+            identity=self.identity,
+            site=self.site,
+            retry_policy=self.retry_policy,
+        )
+        tokens = (
+            self.session_state.restore(self.site, self.proxies, self.session)
+            if self.session_state
+            else None
         )
-        token = self._get_csrf_token()
+        token = tokens.get("csrf_token") if tokens else None
+        self.token_from_store = token is not None
+        if token is None:
+            token = self._get_csrf_token()
+            self._persist_session_state(token)
         headers["gd-csrf-token"] = token if token else fallback_token
         self.session.headers.update(headers)
 
@@ -73,40 +103,69 @@ class Glassdoor(Scraper):
         if location_type is None:
             log.error("Glassdoor: location not parsed")
             return JobResponse(jobs=[])
-        job_list: list[JobPost] = []
-        cursor = None
-
         range_start = 1 + (scraper_input.offset // self.jobs_per_page)
+        checkpoint = self.open_checkpoint(scraper_input)
+        # page cursors of the pages an offset maps to are cached by their position
+        page_state, _, job_list = checkpoint.start(
+            (range_start - 1) * self.jobs_per_page, exact=True
+        )
         tot_pages = (scraper_input.results_wanted // self.jobs_per_page) + 2
         range_end = min(tot_pages, self.max_pages + 1)
-        for page in range(range_start, range_end):
+        if scraper_input.filters:
+            # filtered out jobs do not count, keep paging up to the site's limit
+            range_end = self.max_pages + 1
+
+        def fetch_page(page_state: Tuple[int, str | None]):
+            page, cursor = page_state
             log.info(f"search page: {page} / {range_end - 1}")
-            try:
-                jobs, cursor = self._fetch_jobs_page(
-                    scraper_input, location_id, location_type, page, cursor
-                )
+            jobs_data, next_cursor = self._fetch_jobs_page(
+                location_id, location_type, page, cursor
+            )
+            next_state = (page + 1, next_cursor) if page + 1 < range_end else None
+            return jobs_data, next_state
+
+        if range_start >= range_end:
+            return JobResponse(jobs=job_list)
+        pages = pipelined_pages(
+            self.executor,
+            self.site,
+            fetch_page,
+            cursor=tuple(page_state) if page_state else (range_start, None),
+            should_prefetch=lambda _: len(job_list) + self.jobs_per_page
+            < scraper_input.results_wanted,
+            with_cursor=True,
+        )
+        try:
+            for jobs_data, next_state in pages:
+                jobs = self._process_jobs_page(jobs_data)
                 job_list.extend(jobs)
-                if not jobs or len(job_list) >= scraper_input.results_wanted:
-                    job_list = job_list[: scraper_input.results_wanted]
+                if next_state is not None:
+                    next_position = (next_state[0] - 1) * self.jobs_per_page
+                    checkpoint.save(next_state, job_list, next_position)
+                if self.reached_cutoff:
+                    log.info("reached jobs older than hours_old, stopping")
+                    break
+                if not self.page_size or len(job_list) >= scraper_input.results_wanted:
+                    break
+                if self.page_done(job_list):
                     break
-            except Exception as e:
-                log.error(f"Glassdoor: {str(e)}")
-                break
-        return JobResponse(jobs=job_list)
+        except Exception as e:
+            log.error(f"Glassdoor: {str(e)}")
+        finally:
+            pages.close()
+        checkpoint.finish()
+        return JobResponse(jobs=job_list[: scraper_input.results_wanted])
 
     def _fetch_jobs_page(
         self,
-        scraper_input: ScraperInput,
         location_id: int,
         location_type: str,
         page_num: int,
         cursor: str | None,
-    ) -> Tuple[list[JobPost], str | None]:
+    ) -> Tuple[Iterable[dict], str | None]:
         """
-        Scrapes a page of Glassdoor for jobs with scraper_input criteria
+        Fetches the raw job listings of a page of Glassdoor with scraper_input criteria
         """
-        jobs = []
-        self.scraper_input = scraper_input
         try:
             payload = self._add_payload(location_id, location_type, page_num, cursor)
             response = self.session.post(
@@ -114,10 +173,16 @@ class Glassdoor(Scraper):
                 timeout_seconds=15,
                 data=payload,
             )
+            if response.status_code in (401, 403) and self._refresh_csrf_token():
+                response = self.session.post(
+                    f"{self.base_url}/graph",
+                    timeout_seconds=15,
+                    data=payload,
+                )
             if response.status_code != 200:
                 exc_msg = f"bad response status code: {response.status_code}"
                 raise GlassdoorException(exc_msg)
-            res_json = response.json()[0]
+            res_json = json_loads(response.content)[0]
             if "errors" in res_json:
                 raise ValueError("Error encountered in API response")
         except (
@@ -127,26 +192,43 @@ class Glassdoor(Scraper):
             Exception,
         ) as e:
             log.error(f"Glassdoor: {str(e)}")
-            return jobs, None
+            return [], None
 
         jobs_data = res_json["data"]["jobListings"]["jobListings"]
-
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            future_to_job_data = {
-                executor.submit(self._process_job, job): job for job in jobs_data
-            }
-            for future in as_completed(future_to_job_data):
-                try:
-                    job_post = future.result()
-                    if job_post:
-                        jobs.append(job_post)
-                except Exception as exc:
-                    raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
-
-        return jobs, get_cursor_for_page(
+        return jobs_data, get_cursor_for_page(
             res_json["data"]["jobListings"]["paginationCursors"], page_num + 1
         )
 
+    def _process_jobs_page(self, jobs_data: Iterable[dict]) -> list[JobPost]:
+        """
+        Processes the job listings of a page, fetching descriptions in the shared pool
+        for the ones within hours_old. Results are sorted by date, so a page with
+        only older listings marks the end of the wanted ones.
+        """
+        jobs = []
+        if self.cutoff is not None:
+            jobs_data = list(jobs_data)
+            recent = [job for job in jobs_data if not self._is_too_old(job)]
+            self.reached_cutoff = bool(jobs_data) and not recent
+            jobs_data = recent
+        futures = self.executor.map(self.site, self._process_job, jobs_data)
+        self.page_size = len(futures)
+        for future in as_completed(futures):
+            try:
+                job_post = future.result()
+                if job_post:
+                    jobs.append(job_post)
+            except Exception as exc:
+                raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
+        return jobs
+
+    def _is_too_old(self, job_data: dict) -> bool:
+        age_in_days = job_data["jobview"]["header"].get("ageInDays")
+        if age_in_days is None:
+            return False
+        date_posted = (datetime.now() - timedelta(days=age_in_days)).date()
+        return posted_before(date_posted, self.cutoff)
+
     def _get_csrf_token(self):
         """
         Fetches csrf token needed for API by visiting a generic page
@@ -159,6 +241,32 @@ class Glassdoor(Scraper):
             token = matches[0]
         return token
 
+    def _refresh_csrf_token(self) -> bool:
+        """
+        Replaces a stored csrf token rejected by the API with a freshly fetched one
+        :return: whether the token was refreshed and the request is worth retrying
+        """
+        with self.token_lock:
+            if self.token_from_store:
+                self.token_from_store = False
+                log.info("stored csrf token rejected, fetching a new one")
+                self.session_state.invalidate(self.site, self.proxies)
+                token = self._get_csrf_token()
+                self._persist_session_state(token)
+                headers["gd-csrf-token"] = token if token else fallback_token
+                self.session.headers.update(headers)
+                self.token_refreshed = True
+            return self.token_refreshed
+
+    def _persist_session_state(self, token: str | None):
+        """
+        Stores the session cookies and a fetched csrf token for later runs
+        """
+        if self.session_state and token:
+            self.session_state.persist(
+                self.site, self.proxies, self.session, tokens={"csrf_token": token}
+            )
+
     def _process_job(self, job_data):
         """
         Processes a single job and fetches its description.
@@ -185,6 +293,14 @@ class Glassdoor(Scraper):
             location = parse_location(location_name)
 
         compensation = parse_compensation(job["header"])
+        filters = self.scraper_input.filters
+        if filters and not filters.accepts(
+            title=title,
+            company_name=company_name,
+            compensation=compensation or Compensation(),
+            is_remote=is_remote,
+        ):
+            return None
         try:
             description = self._fetch_job_description(job_id)
         except:
@@ -247,7 +363,7 @@ class Glassdoor(Scraper):
         res = requests.post(url, json=body, headers=headers)
         if res.status_code != 200:
             return None
-        data = res.json()[0]
+        data = json_loads(res.content)[0]
         desc = data["data"]["jobview"]["job"]["description"]
         if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
             desc = markdown_converter(desc)
@@ -268,7 +384,7 @@ class Glassdoor(Scraper):
                 err += f" - {res.text}"
                 log.error(f"Glassdoor response status code {res.status_code}")
                 return None, None
-        items = res.json()
+        items = json_loads(res.content)
 
         if not items:
             raise ValueError(f"Location '{location}' not found on Glassdoor")
@@ -317,4 +433,4 @@ class Glassdoor(Scraper):
             payload["variables"]["filterParams"].append(
                 {"filterKey": "jobType", "values": self.scraper_input.job_type.value[0]}
             )
-        return json.dumps([payload])
+        return json_dumps([payload])
@@ -56,6 +56,11 @@ query_template = """
                 }
                 filterOptions
                 indeedCtk
+                paginationCursors {
+                    cursor
+                    pageNumber
+                    __typename
+                }
                 jobListings {
                     ...JobView
                     __typename
@@ -74,11 +79,6 @@ query_template = """
                     pageTitle
                     __typename
                 }
-                paginationCursors {
-                    cursor
-                    pageNumber
-                    __typename
-                }
                 indexablePageForSeo
                 searchResultsMetadata {
                     searchCriteria {
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import math
 import re
-import json
 from typing import Tuple
 from datetime import datetime, timedelta
 
@@ -16,25 +15,40 @@ from jobspy.model import (
     Location,
     JobType,
 )
-from jobspy.util import extract_emails_from_text, extract_job_type, create_session
-from jobspy.google.util import log, find_job_info_initial_page, find_job_info
+from jobspy.pagination import pipelined_pages
+from jobspy.util import (
+    extract_emails_from_text,
+    extract_job_type,
+    create_session,
+    json_loads,
+)
+from jobspy.google.util import (
+    log,
+    find_job_info_initial_page,
+    find_job_info,
+    find_job_info_in_text,
+)
 
 
 class Google(Scraper):
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        **kwargs,
     ):
         """
         Initializes Google Scraper with the Goodle jobs search url
         """
         site = Site(Site.GOOGLE)
-        super().__init__(site, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(site, proxies=proxies, ca_cert=ca_cert, **kwargs)
 
         self.country = None
         self.session = None
         self.scraper_input = None
         self.jobs_per_page = 10
         self.seen_urls = set()
+        self.page_size = 0
         self.url = "https://www.google.com/search"
         self.jobs_url = "https://www.google.com/async/callback:550"
 
@@ -48,9 +62,18 @@ class Google(Scraper):
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            is_tls=False,
+            has_retry=True,
+            identity=self.identity,
+            site=self.site,
+            retry_policy=self.retry_policy,
         )
-        forward_cursor, job_list = self._get_initial_cursor_and_jobs()
+        checkpoint = self.open_checkpoint(scraper_input)
+        forward_cursor, position, job_list = checkpoint.start(scraper_input.offset)
+        if forward_cursor is None:
+            forward_cursor, job_list = self._get_initial_cursor_and_jobs()
         if forward_cursor is None:
             log.warning(
                 "initial cursor not found, try changing your query or there was at most 10 results"
@@ -58,29 +81,43 @@ class Google(Scraper):
             return JobResponse(jobs=job_list)
 
         page = 1
-
-        while (
-            len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset
-            and forward_cursor
-        ):
-            log.info(
-                f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
-            )
-            try:
-                jobs, forward_cursor = self._get_jobs_next_page(forward_cursor)
-            except Exception as e:
-                log.error(f"failed to get jobs on page: {page}, {e}")
-                break
-            if not jobs:
-                log.info(f"found no jobs on page: {page}")
-                break
-            job_list += jobs
-            page += 1
+        # job_list holds the jobs from position on, so skip only the rest of offset
+        offset = scraper_input.offset - position
+        jobs_needed = scraper_input.results_wanted + offset
+        total_pages = math.ceil(scraper_input.results_wanted / self.jobs_per_page)
+
+        pages = pipelined_pages(
+            self.executor,
+            self.site,
+            self._get_jobs_next_page,
+            cursor=forward_cursor,
+            should_prefetch=lambda _: len(job_list) + self.jobs_per_page < jobs_needed,
+            with_cursor=True,
+        )
+        try:
+            while len(job_list) < jobs_needed:
+                log.info(f"search page: {page} / {total_pages}")
+                try:
+                    page_data, next_cursor = next(pages, (None, None))
+                    if page_data is None:
+                        break
+                    jobs = self._parse_jobs(page_data)
+                except Exception as e:
+                    log.error(f"failed to get jobs on page: {page}, {e}")
+                    break
+                if not jobs and not (scraper_input.filters and self.page_size):
+                    log.info(f"found no jobs on page: {page}")
+                    break
+                job_list += jobs
+                page += 1
+                checkpoint.save(next_cursor, job_list, position + len(job_list))
+                if self.page_done(job_list, offset):
+                    break
+        finally:
+            pages.close()
+        checkpoint.finish()
         return JobResponse(
-            jobs=job_list[
-                scraper_input.offset : scraper_input.offset
-                + scraper_input.results_wanted
-            ]
+            jobs=job_list[offset : offset + scraper_input.results_wanted]
         )
 
     def _get_initial_cursor_and_jobs(self) -> Tuple[str, list[JobPost]]:
@@ -134,35 +171,40 @@ class Google(Scraper):
                 jobs.append(job_post)
         return data_async_fc, jobs
 
-    def _get_jobs_next_page(self, forward_cursor: str) -> Tuple[list[JobPost], str]:
+    def _get_jobs_next_page(self, forward_cursor: str) -> Tuple[str, str | None]:
+        """
+        Fetches a page of jobs, pulling out the next page cursor before any parsing
+        """
         params = {"fc": [forward_cursor], "fcv": ["3"], "async": [async_param]}
         response = self.session.get(self.jobs_url, headers=headers_jobs, params=params)
-        return self._parse_jobs(response.text)
+        pattern_fc = r'data-async-fc="([^"]+)"'
+        match_fc = re.search(pattern_fc, response.text)
+        data_async_fc = match_fc.group(1) if match_fc else None
+        return response.text, data_async_fc
 
-    def _parse_jobs(self, job_data: str) -> Tuple[list[JobPost], str]:
+    def _parse_jobs(self, job_data: str) -> list[JobPost]:
         """
-        Parses jobs on a page with next page cursor
+        Parses jobs on a page
         """
         start_idx = job_data.find("[[[")
         end_idx = job_data.rindex("]]]") + 3
         s = job_data[start_idx:end_idx]
-        parsed = json.loads(s)[0]
+        parsed = json_loads(s)[0]
 
-        pattern_fc = r'data-async-fc="([^"]+)"'
-        match_fc = re.search(pattern_fc, job_data)
-        data_async_fc = match_fc.group(1) if match_fc else None
         jobs_on_page = []
+        self.page_size = 0
         for array in parsed:
             _, job_data = array
             if not job_data.startswith("[[["):
                 continue
-            job_d = json.loads(job_data)
-
-            job_info = find_job_info(job_d)
+            self.page_size += 1
+            job_info = find_job_info_in_text(job_data)
+            if job_info is None:
+                job_info = find_job_info(json_loads(job_data))
             job_post = self._parse_job(job_info)
             if job_post:
                 jobs_on_page.append(job_post)
-        return jobs_on_page, data_async_fc
+        return jobs_on_page
 
     def _parse_job(self, job_info: list):
         job_url = job_info[3][0][0] if job_info[3] and job_info[3][0] else None
@@ -199,4 +241,7 @@ class Google(Scraper):
             emails=extract_emails_from_text(description),
             job_type=extract_job_type(description),
         )
+        filters = self.scraper_input.filters
+        if filters and not filters.accepts_job(job_post):
+            return None
         return job_post
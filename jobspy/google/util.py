@@ -1,15 +1,79 @@
 import re
 
-from jobspy.util import create_logger
+from jobspy.util import create_logger, json_loads
 
 log = create_logger("Google")
 
+job_info_key = "520084652"
+job_info_anchor = f'"{job_info_key}":'
+json_token = re.compile(r'[\[\]"\\]')
+
+
+def find_json_array_end(text: str, start: int) -> int | None:
+    """
+    Finds the end of the JSON array opening at text[start] by bracket matching,
+    skipping brackets inside strings
+    :return: index just past the closing bracket, None if the array is unterminated
+    """
+    depth = 0
+    in_string = False
+    pos = start
+    while True:
+        match = json_token.search(text, pos)
+        if not match:
+            return None
+        char = match.group()
+        pos = match.end()
+        if in_string:
+            if char == "\\":
+                pos += 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+            if depth == 0:
+                return pos
+
+
+def iter_job_info_slices(text: str):
+    """Single linear scan yielding the raw JSON array after every job info key"""
+    pos = 0
+    while True:
+        idx = text.find(job_info_anchor, pos)
+        if idx == -1:
+            return
+        start = idx + len(job_info_anchor)
+        while start < len(text) and text[start].isspace():
+            start += 1
+        pos = start
+        if start >= len(text) or text[start] != "[":
+            continue
+        end = find_json_array_end(text, start)
+        if end is None:
+            return
+        pos = end
+        yield text[start:end]
+
+
+def find_job_info_in_text(job_data: str) -> list | None:
+    """Decodes only the job info array of a job JSON string"""
+    for raw in iter_job_info_slices(job_data):
+        try:
+            return json_loads(raw)
+        except ValueError:
+            continue
+    return None
+
 
 def find_job_info(jobs_data: list | dict) -> list | None:
     """Iterates through the JSON data to find the job listings"""
     if isinstance(jobs_data, dict):
         for key, value in jobs_data.items():
-            if key == "520084652" and isinstance(value, list):
+            if key == job_info_key and isinstance(value, list):
                 return value
             else:
                 result = find_job_info(value)
@@ -24,18 +88,11 @@ def find_job_info(jobs_data: list | dict) -> list | None:
 
 
 def find_job_info_initial_page(html_text: str):
-    pattern = f'520084652":(' + r"\[.*?\]\s*])\s*}\s*]\s*]\s*]\s*]\s*]"
     results = []
-    matches = re.finditer(pattern, html_text)
-
-    import json
-
-    for match in matches:
+    for raw in iter_job_info_slices(html_text):
         try:
-            parsed_data = json.loads(match.group(1))
-            results.append(parsed_data)
-
-        except json.JSONDecodeError as e:
+            results.append(json_loads(raw))
+        except ValueError as e:
             log.error(f"Failed to parse match: {str(e)}")
-            results.append({"raw_match": match.group(0), "error": str(e)})
+            results.append({"raw_match": raw, "error": str(e)})
     return results
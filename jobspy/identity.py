@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import threading
+from itertools import cycle
+from typing import Iterable
+
+from requests.cookies import RequestsCookieJar
+
+from jobspy.model import Site
+from jobspy.user_agents import DEFAULT_USER_AGENTS
+
+
+def tls_client_identifier(user_agent: str) -> str:
+    """
+    Picks the tls_client fingerprint of the browser family named in user_agent,
+    so the TLS handshake does not contradict the user agent header
+    """
+    if "Firefox/" in user_agent:
+        return "firefox_120"
+    if "Safari/" in user_agent and "Version/" in user_agent:
+        if "iPhone" in user_agent or "iPad" in user_agent:
+            return "safari_ios_17_0"
+        return "safari_16_0"
+    return "chrome_120"
+
+
+class Identity:
+    """
+    A proxy, user agent, TLS fingerprint and cookie jar used together, so a
+    scraper run looks like one browser instead of rotating per request
+    """
+
+    def __init__(self, proxy: str | None, user_agent: str):
+        self.proxy = proxy
+        self.user_agent = user_agent
+        self.client_identifier = tls_client_identifier(user_agent)
+        self.cookies = RequestsCookieJar()
+        self.leases = 0
+
+    def __repr__(self):
+        return f"Identity(proxy={self.proxy!r}, client={self.client_identifier})"
+
+    def apply(self, session):
+        """Copies the identity's cookies into session"""
+        for cookie in self.cookies:
+            session.cookies.set_cookie(cookie)
+
+    def update(self, session):
+        """Keeps the session's cookies for the next lease"""
+        cookies = RequestsCookieJar()
+        for cookie in session.cookies:
+            cookies.set_cookie(cookie)
+        self.cookies = cookies
+
+
+class IdentityPool:
+    """
+    Leases identities per site; a released identity, with the cookies it
+    picked up, is handed to the next run on the same site
+    """
+
+    def __init__(
+        self,
+        proxies: list[str] | str | None = None,
+        user_agents: Iterable[str] | str | None = None,
+    ):
+        if isinstance(proxies, str):
+            proxies = [proxies]
+        if isinstance(user_agents, str):
+            user_agents = [user_agents]
+        self.proxy_cycle = cycle(proxies) if proxies else None
+        self.user_agent_cycle = cycle(user_agents or DEFAULT_USER_AGENTS)
+        self.idle: dict[Site, list[Identity]] = {}
+        self.lock = threading.Lock()
+
+    def lease(self, site: Site) -> Identity:
+        with self.lock:
+            idle = self.idle.setdefault(site, [])
+            if idle:
+                identity = idle.pop(0)
+            else:
+                proxy = next(self.proxy_cycle) if self.proxy_cycle else None
+                identity = Identity(proxy, next(self.user_agent_cycle))
+            identity.leases += 1
+            return identity
+
+    def release(self, site: Site, identity: Identity, session=None):
+        if session is not None:
+            identity.update(session)
+        with self.lock:
+            self.idle.setdefault(site, []).append(identity)
@@ -2,11 +2,17 @@ from __future__ import annotations
 
 import math
 from datetime import datetime
-from typing import Tuple
+from typing import Iterable, Iterator, Tuple
 
-from jobspy.indeed.constant import job_search_query, api_headers
+from jobspy.indeed.constant import (
+    job_search_query,
+    job_search_lean_query,
+    job_details_query,
+    api_headers,
+)
 from jobspy.indeed.util import is_job_remote, get_compensation, get_job_type
 from jobspy.model import (
+    Compensation,
     Scraper,
     ScraperInput,
     Site,
@@ -16,9 +22,15 @@ from jobspy.model import (
     JobType,
     DescriptionFormat,
 )
+from jobspy.pagination import pipelined_pages
 from jobspy.util import (
     extract_emails_from_text,
     markdown_converter,
+    posted_before,
+    posted_cutoff,
+    split_json_stream,
+    json_loads,
+    json_dumps,
     create_session,
     create_logger,
 )
@@ -28,15 +40,23 @@ log = create_logger("Indeed")
 
 class Indeed(Scraper):
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        **kwargs,
     ):
         """
         Initializes IndeedScraper with the Indeed API url
         """
-        super().__init__(Site.INDEED, proxies=proxies)
+        super().__init__(Site.INDEED, proxies=proxies, **kwargs)
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=ca_cert, is_tls=False
+            proxies=self.proxies,
+            ca_cert=ca_cert,
+            is_tls=False,
+            identity=self.identity,
+            site=self.site,
+            retry_policy=self.retry_policy,
         )
         self.scraper_input = None
         self.jobs_per_page = 100
@@ -44,6 +64,8 @@ class Indeed(Scraper):
         self.seen_urls = set()
         self.headers = None
         self.api_country_code = None
+        self.cutoff = None
+        self.page_size = 0
         self.base_url = None
         self.api_url = "https://apis.indeed.com/graphql"
 
@@ -54,37 +76,53 @@ class Indeed(Scraper):
         :return: job_response
         """
         self.scraper_input = scraper_input
+        self.cutoff = posted_cutoff(scraper_input.hours_old)
         domain, self.api_country_code = self.scraper_input.country.indeed_domain_value
         self.base_url = f"https://{domain}.indeed.com"
         self.headers = api_headers.copy()
         self.headers["indeed-co"] = self.scraper_input.country.indeed_domain_value
-        job_list = []
-        page = 1
-
-        cursor = None
+        checkpoint = self.open_checkpoint(scraper_input)
+        cursor, position, job_list = checkpoint.start(scraper_input.offset)
+        # job_list holds the jobs from position on, so skip only the rest of offset
+        offset = scraper_input.offset - position
+        jobs_needed = scraper_input.results_wanted + offset
+        total_pages = math.ceil(scraper_input.results_wanted / self.jobs_per_page)
 
-        while len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset:
-            log.info(
-                f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
-            )
-            jobs, cursor = self._scrape_page(cursor)
-            if not jobs:
-                log.info(f"found no jobs on page: {page}")
-                break
-            job_list += jobs
-            page += 1
+        pages = pipelined_pages(
+            self.executor,
+            self.site,
+            self._scrape_page,
+            cursor=cursor,
+            should_prefetch=lambda _: len(job_list) + self.jobs_per_page < jobs_needed,
+            with_cursor=True,
+        )
+        # with client side filters a page may keep no jobs while later ones do
+        filtering = self.cutoff is not None or scraper_input.filters is not None
+        try:
+            for page, (raw_jobs, next_cursor) in enumerate(pages, start=1):
+                log.info(f"search page: {page} / {total_pages}")
+                jobs = self._process_page(raw_jobs)
+                if not jobs and not (filtering and self.page_size):
+                    log.info(f"found no jobs on page: {page}")
+                    break
+                job_list += jobs
+                checkpoint.save(next_cursor, job_list, position + len(job_list))
+                if len(job_list) >= jobs_needed:
+                    break
+                if self.page_done(job_list, offset):
+                    break
+        finally:
+            pages.close()
+        checkpoint.finish()
         return JobResponse(
-            jobs=job_list[
-                scraper_input.offset : scraper_input.offset
-                + scraper_input.results_wanted
-            ]
+            jobs=job_list[offset : offset + scraper_input.results_wanted]
         )
 
-    def _scrape_page(self, cursor: str | None) -> Tuple[list[JobPost], str | None]:
+    def _scrape_page(self, cursor: str | None) -> Tuple[list[dict], str | None]:
         """
-        Scrapes a page of Indeed for jobs with scraper_input criteria
+        Fetches a page of Indeed for jobs with scraper_input criteria
         :param cursor:
-        :return: jobs found on page, next page cursor
+        :return: raw jobs found on page, next page cursor
         """
         jobs = []
         new_cursor = None
@@ -94,7 +132,12 @@ class Indeed(Scraper):
             if self.scraper_input.search_term
             else ""
         )
-        query = job_search_query.format(
+        search_query = (
+            job_search_lean_query
+            if self.scraper_input.indeed_two_phase
+            else job_search_query
+        )
+        query = search_query.format(
             what=(f'what: "{search_term}"' if search_term else ""),
             location=(
                 f'location: {{where: "{self.scraper_input.location}", radius: {self.scraper_input.distance}, radiusUnit: MILES}}'
@@ -105,6 +148,50 @@ class Indeed(Scraper):
             cursor=f'cursor: "{cursor}"' if cursor else "",
             filters=filters,
         )
+        if self.scraper_input.stream_json:
+            return self._stream_page(query)
+        data = self._post_query(query)
+        if data is None:
+            return jobs, new_cursor
+        jobs = data["data"]["jobSearch"]["results"]
+        new_cursor = data["data"]["jobSearch"]["pageInfo"]["nextCursor"]
+        return jobs, new_cursor
+
+    def _stream_page(self, query: str) -> Tuple[Iterator[dict], str | None]:
+        """
+        Sends the search query and decodes the response incrementally, reading
+        only up to the next page cursor before returning
+        :param query:
+        :return: lazily decoded raw jobs, next page cursor
+        """
+        response = self._send_query(query, stream=True)
+        if response is None:
+            return iter(()), None
+        response.raw.decode_content = True
+        jobs, new_cursor = split_json_stream(
+            response.raw,
+            "data.jobSearch.results.item",
+            "data.jobSearch.pageInfo.nextCursor",
+        )
+
+        def read_jobs():
+            try:
+                yield from jobs
+            finally:
+                response.close()
+
+        return read_jobs(), new_cursor
+
+    def _post_query(self, query: str) -> dict | None:
+        """
+        Sends a GraphQL query to the Indeed API
+        :param query:
+        :return: response json, None if the request failed
+        """
+        response = self._send_query(query)
+        return json_loads(response.content) if response is not None else None
+
+    def _send_query(self, query: str, stream: bool = False):
         payload = {
             "query": query,
         }
@@ -113,26 +200,81 @@ class Indeed(Scraper):
         response = self.session.post(
             self.api_url,
             headers=api_headers_temp,
-            json=payload,
+            data=json_dumps(payload).encode(),
             timeout=10,
             verify=False,
+            stream=stream,
         )
         if not response.ok:
             log.info(
                 f"responded with status code: {response.status_code} (submit GitHub issue if this appears to be a bug)"
             )
-            return jobs, new_cursor
-        data = response.json()
-        jobs = data["data"]["jobSearch"]["results"]
-        new_cursor = data["data"]["jobSearch"]["pageInfo"]["nextCursor"]
+            return None
+        return response
 
+    def _process_page(self, jobs: Iterable[dict]) -> list[JobPost]:
+        """
+        Parses the raw jobs of a page into JobPosts, skipping ones already seen
+        :param jobs:
+        :return: new jobs on page
+        """
+        self.page_size = 0
+        jobs = (self._count_job(job)["job"] for job in jobs)
+        if self.cutoff is not None:
+            jobs = (
+                job
+                for job in jobs
+                if not posted_before(job.get("datePublished"), self.cutoff)
+            )
+        if self.scraper_input.filters:
+            jobs = (job for job in jobs if self._passes_filters(job))
+        if self.scraper_input.indeed_two_phase:
+            jobs = [
+                job
+                for job in jobs
+                if f'{self.base_url}/viewjob?jk={job["key"]}' not in self.seen_urls
+            ]
+            self._add_job_details(jobs)
         job_list = []
         for job in jobs:
-            processed_job = self._process_job(job["job"])
+            processed_job = self._process_job(job)
             if processed_job:
                 job_list.append(processed_job)
+        return job_list
+
+    def _count_job(self, job: dict) -> dict:
+        self.page_size += 1
+        return job
 
-        return job_list, new_cursor
+    def _add_job_details(self, jobs: list[dict]):
+        """
+        Fetches descriptions and employer details in one batched query for the
+        jobs of a lean search page and merges them into the job dicts
+        :param jobs:
+        """
+        details = {}
+        if jobs:
+            job_keys = ", ".join(f'"{job["key"]}"' for job in jobs)
+            data = self._post_query(job_details_query.format(job_keys=job_keys))
+            if data and data.get("data"):
+                for result in data["data"]["jobData"]["results"]:
+                    details[result["job"]["key"]] = result["job"]
+        for job in jobs:
+            job.update(details.get(job["key"], {}))
+            job.setdefault("description", {"html": ""})
+            if job.get("employer"):
+                job["employer"].setdefault("relativeCompanyPageUrl", None)
+
+    def _passes_filters(self, job: dict) -> bool:
+        """
+        Checks the search result fields of a raw job against scraper_input.filters
+        """
+        employer = job.get("employer")
+        return self.scraper_input.filters.accepts(
+            title=job.get("title"),
+            company_name=employer.get("name") if employer else None,
+            compensation=get_compensation(job["compensation"]) or Compensation(),
+        )
 
     def _build_filters(self):
         """
@@ -212,12 +354,12 @@ class Indeed(Scraper):
         employer = job["employer"].get("dossier") if job["employer"] else None
         employer_details = employer.get("employerDetails", {}) if employer else {}
         rel_url = job["employer"]["relativeCompanyPageUrl"] if job["employer"] else None
-        return JobPost(
+        job_post = JobPost(
             id=f'in-{job["key"]}',
             title=job["title"],
             description=description,
             company_name=job["employer"].get("name") if job.get("employer") else None,
-            company_url=(f"{self.base_url}{rel_url}" if job["employer"] else None),
+            company_url=(f"{self.base_url}{rel_url}" if rel_url else None),
             company_url_direct=(
                 employer["links"]["corporateWebsite"] if employer else None
             ),
@@ -258,3 +400,8 @@ class Indeed(Scraper):
                 else None
             ),
         )
+        # the other filters ran on the raw job in _process_page
+        filters = self.scraper_input.filters
+        if filters and not filters.accepts(is_remote=job_post.is_remote):
+            return None
+        return job_post
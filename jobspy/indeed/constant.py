@@ -97,6 +97,106 @@ job_search_query = """
     }}
     """
 
+job_search_lean_query = """
+    query GetJobKeys {{
+        jobSearch(
+        {what}
+        {location}
+        limit: 100
+        {cursor}
+        sort: RELEVANCE
+        {filters}
+        ) {{
+        pageInfo {{
+            nextCursor
+        }}
+        results {{
+            job {{
+            key
+            title
+            datePublished
+            location {{
+                countryCode
+                admin1Code
+                city
+                formatted {{
+                long
+                }}
+            }}
+            compensation {{
+                estimated {{
+                currencyCode
+                baseSalary {{
+                    unitOfWork
+                    range {{
+                    ... on Range {{
+                        min
+                        max
+                    }}
+                    }}
+                }}
+                }}
+                baseSalary {{
+                unitOfWork
+                range {{
+                    ... on Range {{
+                    min
+                    max
+                    }}
+                }}
+                }}
+                currencyCode
+            }}
+            attributes {{
+                key
+                label
+            }}
+            employer {{
+                name
+            }}
+            }}
+        }}
+        }}
+    }}
+    """
+
+job_details_query = """
+    query GetJobDetails {{
+        jobData(jobKeys: [{job_keys}]) {{
+        results {{
+            job {{
+            key
+            description {{
+                html
+            }}
+            employer {{
+                relativeCompanyPageUrl
+                name
+                dossier {{
+                    employerDetails {{
+                    addresses
+                    industry
+                    employeesLocalizedLabel
+                    revenueLocalizedLabel
+                    briefDescription
+                    }}
+                    images {{
+                        squareLogoUrl
+                    }}
+                    links {{
+                    corporateWebsite
+                }}
+                }}
+            }}
+            recruit {{
+                viewJobUrl
+            }}
+            }}
+        }}
+        }}
+    }}
+    """
+
 api_headers = {
     "Host": "apis.indeed.com",
     "content-type": "application/json",
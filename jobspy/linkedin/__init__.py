@@ -16,6 +16,7 @@ from jobspy.linkedin.constant import headers
 from jobspy.linkedin.util import (
     is_job_remote,
     job_type_code,
+    salary_bucket,
     parse_job_type,
     parse_job_level,
     parse_company_industry
@@ -31,6 +32,7 @@ from jobspy.model import (
     ScraperInput,
     Site,
 )
+from jobspy.pagination import fan_out_pages
 from jobspy.util import (
     extract_emails_from_text,
     currency_parser,
@@ -50,21 +52,31 @@ class LinkedIn(Scraper):
     jobs_per_page = 25
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        **kwargs,
     ):
         """
         Initializes LinkedInScraper with the LinkedIn job search url
         """
-        super().__init__(Site.LINKEDIN, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(Site.LINKEDIN, proxies=proxies, ca_cert=ca_cert, **kwargs)
         self.session = create_session(
             proxies=self.proxies,
             ca_cert=ca_cert,
             is_tls=False,
             has_retry=True,
             delay=5,
-            clear_cookies=True,
+            clear_cookies=self.session_state is None,
+            identity=self.identity,
+            site=self.site,
+            retry_policy=self.retry_policy,
         )
         self.session.headers.update(headers)
+        self.state_restored = self.session_state is not None and (
+            self.session_state.restore(self.site, self.proxies, self.session)
+            is not None
+        )
         self.scraper_input = None
         self.country = "worldwide"
         self.job_url_direct_regex = re.compile(r'(?<=\?url=)[^"]+')
@@ -76,99 +88,152 @@ class LinkedIn(Scraper):
         :return: job_response
         """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
-        seen_ids = set()
         start = scraper_input.offset // 10 * 10 if scraper_input.offset else 0
+        # start addresses results directly, so only resuming needs the checkpoint
+        checkpoint = self.open_checkpoint(scraper_input)
+        resumed_start, _, job_list = checkpoint.start(start, exact=True)
+        start = resumed_start or start
+        seen_ids = {job.id.removeprefix("li-") for job in job_list}
         request_count = 0
-        seconds_old = (
-            scraper_input.hours_old * 3600 if scraper_input.hours_old else None
-        )
         continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and start < 1000
+            lambda: len(job_list) < scraper_input.results_wanted
+            and start < 1000
+            and not self.page_done(job_list)
         )
+        if scraper_input.page_fanout > 1:
+            pages = fan_out_pages(
+                self.executor,
+                self.site,
+                self._fetch_job_cards,
+                start,
+                scraper_input.page_fanout,
+                step=10,
+                end=1000,
+                between_batches=self._sleep,
+            )
+            for job_cards in pages:
+                self._process_job_cards(job_cards, seen_ids, job_list)
+                if len(job_list) >= scraper_input.results_wanted:
+                    break
+                if self.page_done(job_list):
+                    break
+            pages.close()
+            return JobResponse(jobs=job_list[: scraper_input.results_wanted])
+
         while continue_search():
             request_count += 1
             log.info(
                 f"search page: {request_count} / {math.ceil(scraper_input.results_wanted / 10)}"
             )
-            params = {
-                "keywords": scraper_input.search_term,
-                "location": scraper_input.location,
-                "distance": scraper_input.distance,
-                "f_WT": 2 if scraper_input.is_remote else None,
-                "f_JT": (
-                    job_type_code(scraper_input.job_type)
-                    if scraper_input.job_type
-                    else None
-                ),
-                "pageNum": 0,
-                "start": start,
-                "f_AL": "true" if scraper_input.easy_apply else None,
-                "f_C": (
-                    ",".join(map(str, scraper_input.linkedin_company_ids))
-                    if scraper_input.linkedin_company_ids
-                    else None
-                ),
-            }
-            if seconds_old is not None:
-                params["f_TPR"] = f"r{seconds_old}"
-
-            params = {k: v for k, v in params.items() if v is not None}
-            try:
-                response = self.session.get(
-                    f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?",
-                    params=params,
-                    timeout=10,
-                )
-                if response.status_code not in range(200, 400):
-                    if response.status_code == 429:
-                        err = (
-                            f"429 Response - Blocked by LinkedIn for too many requests"
-                        )
-                    else:
-                        err = f"LinkedIn response status code {response.status_code}"
-                        err += f" - {response.text}"
-                    log.error(err)
-                    return JobResponse(jobs=job_list)
-            except Exception as e:
-                if "Proxy responded with" in str(e):
-                    log.error(f"LinkedIn: Bad proxy")
-                else:
-                    log.error(f"LinkedIn: {str(e)}")
+            job_cards = self._fetch_job_cards(start)
+            if not job_cards:
                 return JobResponse(jobs=job_list)
-
-            soup = BeautifulSoup(response.text, "html.parser")
-            job_cards = soup.find_all("div", class_="base-search-card")
-            if len(job_cards) == 0:
-                return JobResponse(jobs=job_list)
-
-            for job_card in job_cards:
-                href_tag = job_card.find("a", class_="base-card__full-link")
-                if href_tag and "href" in href_tag.attrs:
-                    href = href_tag.attrs["href"].split("?")[0]
-                    job_id = href.split("-")[-1]
-
-                    if job_id in seen_ids:
-                        continue
-                    seen_ids.add(job_id)
-
-                    try:
-                        fetch_desc = scraper_input.linkedin_fetch_description
-                        job_post = self._process_job(job_card, job_id, fetch_desc)
-                        if job_post:
-                            job_list.append(job_post)
-                        if not continue_search():
-                            break
-                    except Exception as e:
-                        raise LinkedInException(str(e))
+            self._process_job_cards(job_cards, seen_ids, job_list)
 
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
-                start += len(job_list)
+                self._sleep()
+                start += len(job_cards)
+                checkpoint.save(start, job_list)
 
+        checkpoint.finish()
         job_list = job_list[: scraper_input.results_wanted]
         return JobResponse(jobs=job_list)
 
+    def _sleep(self):
+        time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+
+    def _fetch_job_cards(self, start: int) -> list[Tag]:
+        """
+        Fetches the job cards of the search page at offset start
+        :param start:
+        :return: job cards, empty on error or when there are no more jobs
+        """
+        scraper_input = self.scraper_input
+        seconds_old = (
+            scraper_input.hours_old * 3600 if scraper_input.hours_old else None
+        )
+        params = {
+            "keywords": scraper_input.search_term,
+            "location": scraper_input.location,
+            "distance": scraper_input.distance,
+            "f_WT": 2 if scraper_input.is_remote else None,
+            "f_JT": (
+                job_type_code(scraper_input.job_type)
+                if scraper_input.job_type
+                else None
+            ),
+            "pageNum": 0,
+            "start": start,
+            "f_AL": "true" if scraper_input.easy_apply else None,
+            "f_C": (
+                ",".join(map(str, scraper_input.linkedin_company_ids))
+                if scraper_input.linkedin_company_ids
+                else None
+            ),
+        }
+        if seconds_old is not None:
+            params["f_TPR"] = f"r{seconds_old}"
+        filters = scraper_input.filters
+        if filters and filters.min_salary and not filters.include_unknown_salary:
+            params["f_SB2"] = salary_bucket(filters.min_salary)
+
+        params = {k: v for k, v in params.items() if v is not None}
+        self.executor.throttle(self.site)
+        try:
+            response = self.session.get(
+                f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?",
+                params=params,
+                timeout=10,
+            )
+            if response.status_code not in range(200, 400):
+                if response.status_code == 429:
+                    err = f"429 Response - Blocked by LinkedIn for too many requests"
+                else:
+                    err = f"LinkedIn response status code {response.status_code}"
+                    err += f" - {response.text}"
+                log.error(err)
+                if self.session_state:
+                    self.session_state.invalidate(self.site, self.proxies)
+                return []
+            if self.session_state and not self.state_restored:
+                self.session_state.persist(self.site, self.proxies, self.session)
+                self.state_restored = True
+        except Exception as e:
+            if "Proxy responded with" in str(e):
+                log.error(f"LinkedIn: Bad proxy")
+            else:
+                log.error(f"LinkedIn: {str(e)}")
+            return []
+
+        soup = BeautifulSoup(response.text, "html.parser")
+        return soup.find_all("div", class_="base-search-card")
+
+    def _process_job_cards(
+        self, job_cards: list[Tag], seen_ids: set[str], job_list: list[JobPost]
+    ):
+        """
+        Processes the job cards of a page into job_list, skipping seen job ids
+        """
+        for job_card in job_cards:
+            href_tag = job_card.find("a", class_="base-card__full-link")
+            if href_tag and "href" in href_tag.attrs:
+                href = href_tag.attrs["href"].split("?")[0]
+                job_id = href.split("-")[-1]
+
+                if job_id in seen_ids:
+                    continue
+                seen_ids.add(job_id)
+
+                try:
+                    fetch_desc = self.scraper_input.linkedin_fetch_description
+                    job_post = self._process_job(job_card, job_id, fetch_desc)
+                    if job_post:
+                        job_list.append(job_post)
+                    if len(job_list) >= self.scraper_input.results_wanted:
+                        break
+                except Exception as e:
+                    raise LinkedInException(str(e))
+
     def _process_job(
         self, job_card: Tag, job_id: str, full_descr: bool
     ) -> Optional[JobPost]:
@@ -215,13 +280,20 @@ class LinkedIn(Scraper):
                 date_posted = datetime.strptime(datetime_str, "%Y-%m-%d")
             except:
                 date_posted = None
+        filters = self.scraper_input.filters
+        if filters and not filters.accepts(
+            title=title,
+            company_name=company,
+            compensation=compensation or Compensation(),
+        ):
+            return None
         job_details = {}
         if full_descr:
             job_details = self._get_job_details(job_id)
             description = job_details.get("description")
         is_remote = is_job_remote(title, description, location)
 
-        return JobPost(
+        job_post = JobPost(
             id=f"li-{job_id}",
             title=title,
             company_name=company,
@@ -240,6 +312,9 @@ class LinkedIn(Scraper):
             company_logo=job_details.get("company_logo"),
             job_function=job_details.get("job_function"),
         )
+        if filters and not filters.accepts_job(job_post):
+            return None
+        return job_post
 
     def _get_job_details(self, job_id: str) -> dict:
         """
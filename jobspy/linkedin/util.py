@@ -14,6 +14,17 @@ def job_type_code(job_type_enum: JobType) -> str:
     }.get(job_type_enum, "")
 
 
+def salary_bucket(min_salary: float) -> int | None:
+    """
+    Maps an annual salary floor to the f_SB2 search filter, whose buckets are
+    1: $40k+, 2: $60k+ ... 9: $200k+, rounding down so no wanted job is excluded
+    :return: bucket, None below the lowest one
+    """
+    if min_salary < 40000:
+        return None
+    return min(9, int(min_salary // 20000) - 1)
+
+
 def parse_job_type(soup_job_type: BeautifulSoup) -> list[JobType] | None:
     """
     Gets the job type from job page
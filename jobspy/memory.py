@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import hashlib
+import sys
+import threading
+import zlib
+from pathlib import Path
+
+import pandas as pd
+
+from jobspy.model import Country, JobPost
+from jobspy.store import JobStore
+from jobspy.util import create_logger, desired_order, job_to_row
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+log = create_logger("Memory")
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of the process so far"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def current_rss_mb() -> float | None:
+    """Current resident set size, falling back to the peak off Linux"""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return peak_rss_mb()
+    return pages * resource.getpagesize() / 1024 / 1024
+
+
+class MemoryBound:
+    """
+    Keeps the memory of large scrapes in check. Identical descriptions, e.g. of
+    reposted jobs, are stored once; with compress they are held compressed (zstd
+    when the zstandard package is installed, else zlib) until the DataFrame is
+    built. Once the process grows past limit_mb, the rows collected so far are
+    written to parquet files in spill_dir and dropped from memory; with a store
+    they are upserted into it first, so a spilled row is never only on disk.
+    """
+
+    def __init__(
+        self,
+        limit_mb: float | None = None,
+        spill_dir: str | Path | None = None,
+        compress: bool = False,
+        store: JobStore | None = None,
+    ):
+        self.limit_mb = limit_mb
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self.compress = compress
+        self.store = store
+        self.descriptions: dict[str, str | bytes] = {}
+        self.rows: list[dict] = []
+        self.spilled: list[Path] = []
+        self.rows_spilled = 0
+        self.descriptions_seen = 0
+        self.warned = False
+        self.lock = threading.RLock()
+        self.peak_rss_before = peak_rss_mb()
+        if self.spill_dir:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+        if zstandard is not None:
+            self._compress = zstandard.ZstdCompressor(level=3).compress
+            self._decompress = zstandard.ZstdDecompressor().decompress
+        else:
+            self._compress = lambda data: zlib.compress(data, 6)
+            self._decompress = zlib.decompress
+
+    def intern(self, description: str | None) -> str | None:
+        """
+        :return: the shared copy of description, or with compress its key
+        """
+        if not description:
+            return description
+        key = hashlib.sha1(description.encode()).hexdigest()
+        with self.lock:
+            self.descriptions_seen += 1
+            if key not in self.descriptions:
+                self.descriptions[key] = (
+                    self._compress(description.encode())
+                    if self.compress
+                    else description
+                )
+        return key if self.compress else self.descriptions[key]
+
+    def intern_jobs(self, jobs: list[JobPost]):
+        """Swaps the descriptions of jobs still held by a scraper for shared ones"""
+        if self.compress:
+            return
+        for job in jobs:
+            job.description = self.intern(job.description)
+
+    def description(self, value: str | None) -> str | None:
+        if not self.compress or not isinstance(value, str):
+            return value
+        return self._decompress(self.descriptions[value]).decode()
+
+    def add(
+        self,
+        site: str,
+        jobs: list[JobPost],
+        country: Country,
+        enforce_annual_salary: bool = False,
+    ):
+        """
+        Converts a site's jobs to rows, so the JobPosts can be released, and
+        spills the rows to disk if the process is over limit_mb
+        """
+        with self.lock:
+            for job in jobs:
+                row = job_to_row(job, site, country, enforce_annual_salary)
+                row = {column: row.get(column) for column in desired_order}
+                row["description"] = self.intern(row["description"])
+                self.rows.append(row)
+        if self.limit_mb and (current_rss_mb() or 0) > self.limit_mb:
+            if self.spill_dir:
+                self.spill()
+            elif not self.warned:
+                self.warned = True
+                log.warning(f"over {self.limit_mb} MB with no spill_dir to spill to")
+
+    def _frame(self, rows: list[dict]) -> pd.DataFrame:
+        frame = pd.DataFrame(rows, columns=desired_order)
+        frame["description"] = frame["description"].map(self.description)
+        return frame
+
+    def spill(self):
+        """
+        Writes the rows held in memory to the store, if any, and the next parquet
+        file of spill_dir, then forgets their descriptions
+        """
+        with self.lock:
+            if not self.rows:
+                return
+            path = self.spill_dir / f"part-{len(self.spilled):05d}.parquet"
+            frame = self._frame(self.rows)
+            if self.store is not None:
+                self.store.upsert(frame)
+            try:
+                frame.to_parquet(path, index=False)
+            except ImportError:
+                raise ImportError(
+                    'spilling needs pyarrow: pip install -U "python-jobspy[arrow]"'
+                )
+            self.spilled.append(path)
+            self.rows_spilled += len(self.rows)
+            log.info(f"spilled {len(self.rows)} jobs to {path}")
+            self.rows = []
+            self.descriptions.clear()
+
+    def frame(self) -> pd.DataFrame:
+        """Rows still held in memory, descriptions restored"""
+        with self.lock:
+            rows, self.rows = self.rows, []
+        return self._frame(rows)
+
+    def report(self) -> dict:
+        return {
+            "peak_rss_mb_before": self.peak_rss_before,
+            "peak_rss_mb": peak_rss_mb(),
+            "descriptions": self.descriptions_seen,
+            "unique_descriptions": len(self.descriptions),
+            "rows_spilled": self.rows_spilled,
+            "spill_files": [str(path) for path in self.spilled],
+        }
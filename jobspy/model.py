@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Literal, Optional
 from datetime import date
 from enum import Enum
 from pydantic import BaseModel
@@ -298,6 +298,81 @@ class SalarySource(Enum):
     DESCRIPTION = "description"
 
 
+annual_multipliers = {
+    CompensationInterval.YEARLY: 1,
+    CompensationInterval.MONTHLY: 12,
+    CompensationInterval.WEEKLY: 52,
+    CompensationInterval.DAILY: 260,
+    CompensationInterval.HOURLY: 2080,
+}
+
+
+class JobFilter(BaseModel):
+    """
+    Predicates applied to each job as soon as its search card is parsed, before
+    any detail request; jobs that fail are not counted towards results_wanted
+    """
+
+    min_salary: float | None = None  # annual, compared with the top of the range
+    include_unknown_salary: bool = True
+    exclude_companies: list[str] | None = None
+    title_keywords: list[str] | None = None  # any of, case insensitive
+    exclude_title_keywords: list[str] | None = None
+    is_remote: bool | None = None
+
+    def accepts(
+        self,
+        title: str | None = None,
+        company_name: str | None = None,
+        compensation: Compensation | None = None,
+        is_remote: bool | None = None,
+    ) -> bool:
+        """
+        Checks the fields known so far, a field left None is not checked
+        """
+        if title is not None:
+            lowered = title.lower()
+            if self.title_keywords and not any(
+                keyword.lower() in lowered for keyword in self.title_keywords
+            ):
+                return False
+            if self.exclude_title_keywords and any(
+                keyword.lower() in lowered for keyword in self.exclude_title_keywords
+            ):
+                return False
+        if company_name is not None and self.exclude_companies:
+            lowered = company_name.lower()
+            if any(company.lower() == lowered for company in self.exclude_companies):
+                return False
+        if self.min_salary is not None and compensation is not None:
+            annual = self.annual_max(compensation)
+            if annual is None and not self.include_unknown_salary:
+                return False
+            if annual is not None and annual < self.min_salary:
+                return False
+        if self.is_remote is not None and is_remote is not None:
+            return is_remote == self.is_remote
+        return True
+
+    def accepts_job(self, job_post: JobPost) -> bool:
+        return self.accepts(
+            title=job_post.title,
+            company_name=job_post.company_name,
+            compensation=job_post.compensation or Compensation(),
+            is_remote=job_post.is_remote,
+        )
+
+    @staticmethod
+    def annual_max(compensation: Compensation) -> float | None:
+        amount = compensation.max_amount or compensation.min_amount
+        if amount is None:
+            return None
+        interval = compensation.interval
+        if isinstance(interval, str):
+            interval = CompensationInterval(interval)
+        return amount * annual_multipliers.get(interval, 1)
+
+
 class ScraperInput(BaseModel):
     site_type: list[Site]
     search_term: str | None = None
@@ -312,19 +387,104 @@ class ScraperInput(BaseModel):
     offset: int = 0
     linkedin_fetch_description: bool = False
     linkedin_company_ids: list[int] | None = None
+    indeed_two_phase: bool = False
+    zip_fetch_details: Literal["never", "missing", "always"] = "always"
     description_format: DescriptionFormat | None = DescriptionFormat.MARKDOWN
 
     results_wanted: int = 15
     hours_old: int | None = None
+    page_fanout: int = 1
+    stream_json: bool = False
+    filters: JobFilter | None = None
 
 
 class Scraper(ABC):
     def __init__(
-        self, site: Site, proxies: list[str] | None = None, ca_cert: str | None = None
+        self,
+        site: Site,
+        proxies: list[str] | None = None,
+        ca_cert: str | None = None,
+        executor=None,
+        session_state=None,
+        identity_pool=None,
+        retry_policy=None,
+        budget=None,
+        on_page=None,
+        checkpoints=None,
+        memory=None,
     ):
         self.site = site
         self.proxies = proxies
         self.ca_cert = ca_cert
+        self.session_state = session_state
+        self.identity_pool = identity_pool
+        self.retry_policy = retry_policy
+        self.budget = budget
+        self.on_page = on_page
+        self.checkpoints = checkpoints
+        self.memory = memory
+        self.jobs_emitted = 0
+        self.jobs_interned = 0
+        # job list and offset of the last page_done, kept for a scrape cut short
+        self.page_jobs: list[JobPost] = []
+        self.page_offset = 0
+        self.identity = identity_pool.lease(site) if identity_pool else None
+        if self.identity is not None:
+            self.proxies = self.identity.proxy
+        if executor is None:
+            from jobspy.executor import get_executor
+
+            executor = get_executor()
+        self.executor = executor
 
     @abstractmethod
     def scrape(self, scraper_input: ScraperInput) -> JobResponse: ...
+
+    def open_checkpoint(self, scraper_input: ScraperInput):
+        """
+        Pagination state of this scrape in the checkpoint store, a no-op without one
+        """
+        from jobspy.checkpoint import Checkpoint
+
+        if self.checkpoints is None:
+            return Checkpoint(None)
+        return self.checkpoints.open(self.site, scraper_input)
+
+    def budget_met(self, jobs_found: int) -> bool:
+        """
+        Reports the jobs found so far to the budget shared with other scrapers
+        :return: whether the shared budget is met and pagination should stop
+        """
+        if self.budget is None:
+            return False
+        return self.budget.report(id(self), jobs_found)
+
+    def page_done(self, job_list: list[JobPost], offset: int = 0) -> bool:
+        """
+        Hands the jobs added since the last page to on_page, then reports them
+        :param offset: leading jobs of job_list that are skipped, not returned
+        :return: whether the shared budget is met and pagination should stop
+        """
+        self.page_jobs, self.page_offset = job_list, offset
+        if self.memory is not None:
+            self.memory.intern_jobs(job_list[self.jobs_interned :])
+            self.jobs_interned = len(job_list)
+        start = max(self.jobs_emitted, offset)
+        if self.on_page is not None and len(job_list) > start:
+            self.on_page(self.site, job_list[start:])
+            self.jobs_emitted = len(job_list)
+        return self.budget_met(len(job_list) - offset)
+
+    def collected_jobs(self, results_wanted: int) -> list[JobPost]:
+        """Jobs of the pages completed so far, for a scrape that was cut short"""
+        return self.page_jobs[self.page_offset :][:results_wanted]
+
+    def close(self):
+        """
+        Returns the leased identity and the cookies it picked up to its pool
+        """
+        if self.identity is not None:
+            self.identity_pool.release(
+                self.site, self.identity, getattr(self, "session", None)
+            )
+            self.identity = None
@@ -27,12 +27,16 @@ from jobspy.model import (
     ScraperInput,
     Site,
 )
+from jobspy.pagination import fan_out_pages
 from jobspy.util import (
     extract_emails_from_text,
+    json_loads,
     currency_parser,
     markdown_converter,
     create_session,
     create_logger,
+    posted_before,
+    posted_cutoff,
 )
 
 log = create_logger("Naukri")
@@ -44,12 +48,15 @@ class Naukri(Scraper):
     jobs_per_page = 20  
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        **kwargs,
     ):
         """
         Initializes NaukriScraper with the Naukri API URL
         """
-        super().__init__(Site.NAUKRI, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(Site.NAUKRI, proxies=proxies, ca_cert=ca_cert, **kwargs)
         self.session = create_session(
             proxies=self.proxies,
             ca_cert=ca_cert,
@@ -57,6 +64,9 @@ class Naukri(Scraper):
             has_retry=True,
             delay=5,
             clear_cookies=True,
+            identity=self.identity,
+            site=self.site,
+            retry_policy=self.retry_policy,
         )
         self.session.headers.update(naukri_headers)
         self.scraper_input = None
@@ -75,80 +85,130 @@ class Naukri(Scraper):
         start = scraper_input.offset or 0
         page = (start // self.jobs_per_page) + 1
         request_count = 0
-        seconds_old = (
-            scraper_input.hours_old * 3600 if scraper_input.hours_old else None
-        )
         continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and page <= 50  # Arbitrary limit
+            lambda: len(job_list) < scraper_input.results_wanted
+            and page <= 50  # Arbitrary limit
+            and not self.page_done(job_list)
         )
 
+        if scraper_input.page_fanout > 1:
+            pages = fan_out_pages(
+                self.executor,
+                self.site,
+                self._fetch_page,
+                page,
+                scraper_input.page_fanout,
+                end=51,
+                between_batches=self._sleep,
+            )
+            for job_details in pages:
+                self._process_page(job_details, seen_ids, job_list)
+                if len(job_list) >= scraper_input.results_wanted:
+                    break
+                if self.page_done(job_list):
+                    break
+            pages.close()
+            job_list = job_list[:scraper_input.results_wanted]
+            log.info(f"Scraping completed. Total jobs collected: {len(job_list)}")
+            return JobResponse(jobs=job_list)
+
         while continue_search():
             request_count += 1
             log.info(
                 f"Scraping page {request_count} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)} "
                 f"for search term: {scraper_input.search_term}"
             )
-            params = {
-                "noOfResults": self.jobs_per_page,
-                "urlType": "search_by_keyword",
-                "searchType": "adv",
-                "keyword": scraper_input.search_term,
-                "pageNo": page,
-                "k": scraper_input.search_term,
-                "seoKey": f"{scraper_input.search_term.lower().replace(' ', '-')}-jobs",
-                "src": "jobsearchDesk",
-                "latLong": "",
-                "location": scraper_input.location,
-                "remote": "true" if scraper_input.is_remote else None,
-            }
-            if seconds_old:
-                params["days"] = seconds_old // 86400  # Convert to days
-
-            params = {k: v for k, v in params.items() if v is not None}
-            try:
-                log.debug(f"Sending request to {self.base_url} with params: {params}")
-                response = self.session.get(self.base_url, params=params, timeout=10)
-                if response.status_code not in range(200, 400):
-                    err = f"Naukri API response status code {response.status_code} - {response.text}"
-                    log.error(err)
-                    return JobResponse(jobs=job_list)
-                data = response.json()
-                job_details = data.get("jobDetails", [])
-                log.info(f"Received {len(job_details)} job entries from API")
-                if not job_details:
-                    log.warning("No job details found in API response")
-                    break
-            except Exception as e:
-                log.error(f"Naukri API request failed: {str(e)}")
-                return JobResponse(jobs=job_list)
-
-            for job in job_details:
-                job_id = job.get("jobId")
-                if not job_id or job_id in seen_ids:
-                    continue
-                seen_ids.add(job_id)
-                log.debug(f"Processing job ID: {job_id}")
-
-                try:
-                    fetch_desc = scraper_input.linkedin_fetch_description
-                    job_post = self._process_job(job, job_id, fetch_desc)
-                    if job_post:
-                        job_list.append(job_post)
-                        log.info(f"Added job: {job_post.title} (ID: {job_id})")
-                    if not continue_search():
-                        break
-                except Exception as e:
-                    log.error(f"Error processing job ID {job_id}: {str(e)}")
-                    raise NaukriException(str(e))
+            job_details = self._fetch_page(page)
+            if not job_details:
+                break
+            self._process_page(job_details, seen_ids, job_list)
 
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+                self._sleep()
                 page += 1
 
         job_list = job_list[:scraper_input.results_wanted]
         log.info(f"Scraping completed. Total jobs collected: {len(job_list)}")
         return JobResponse(jobs=job_list)
 
+    def _sleep(self):
+        time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+
+    def _fetch_page(self, page: int) -> list[dict]:
+        """
+        Fetches the raw job entries of a search results page
+        """
+        scraper_input = self.scraper_input
+        seconds_old = (
+            scraper_input.hours_old * 3600 if scraper_input.hours_old else None
+        )
+        params = {
+            "noOfResults": self.jobs_per_page,
+            "urlType": "search_by_keyword",
+            "searchType": "adv",
+            "keyword": scraper_input.search_term,
+            "pageNo": page,
+            "k": scraper_input.search_term,
+            "seoKey": f"{scraper_input.search_term.lower().replace(' ', '-')}-jobs",
+            "src": "jobsearchDesk",
+            "latLong": "",
+            "location": scraper_input.location,
+            "remote": "true" if scraper_input.is_remote else None,
+        }
+        if seconds_old:
+            params["days"] = seconds_old // 86400  # Convert to days
+
+        params = {k: v for k, v in params.items() if v is not None}
+        self.executor.throttle(self.site)
+        try:
+            log.debug(f"Sending request to {self.base_url} with params: {params}")
+            response = self.session.get(self.base_url, params=params, timeout=10)
+            if response.status_code not in range(200, 400):
+                err = f"Naukri API response status code {response.status_code} - {response.text}"
+                log.error(err)
+                return []
+            data = json_loads(response.content)
+            job_details = data.get("jobDetails", [])
+            log.info(f"Received {len(job_details)} job entries from API")
+            if not job_details:
+                log.warning("No job details found in API response")
+            return job_details
+        except Exception as e:
+            log.error(f"Naukri API request failed: {str(e)}")
+            return []
+
+    def _process_page(
+        self, job_details: list[dict], seen_ids: set, job_list: list[JobPost]
+    ):
+        """
+        Processes the raw job entries of a page into job_list, skipping seen job ids
+        """
+        cutoff = posted_cutoff(self.scraper_input.hours_old)
+        for job in job_details:
+            job_id = job.get("jobId")
+            if not job_id or job_id in seen_ids:
+                continue
+            seen_ids.add(job_id)
+            if posted_before(job.get("createdDate"), cutoff):
+                log.debug(f"Skipping job ID {job_id} older than hours_old")
+                continue
+            log.debug(f"Processing job ID: {job_id}")
+
+            try:
+                fetch_desc = self.scraper_input.linkedin_fetch_description
+                job_post = self._process_job(job, job_id, fetch_desc)
+                filters = self.scraper_input.filters
+                if job_post and filters and not filters.accepts_job(job_post):
+                    continue
+                if job_post:
+                    job_list.append(job_post)
+                    log.info(f"Added job: {job_post.title} (ID: {job_id})")
+                if len(job_list) >= self.scraper_input.results_wanted:
+                    break
+            except Exception as e:
+                log.error(f"Error processing job ID {job_id}: {str(e)}")
+                raise NaukriException(str(e))
+
     def _process_job(
         self, job: dict, job_id: str, full_descr: bool
     ) -> Optional[JobPost]:
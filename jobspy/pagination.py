@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterator, Tuple
+
+from jobspy.executor import ScrapeExecutor
+from jobspy.model import Site
+
+
+def pipelined_pages(
+    executor: ScrapeExecutor,
+    site: Site,
+    fetch_page: Callable[[Any], Tuple[Any, Any]],
+    cursor: Any = None,
+    should_prefetch: Callable[[Any], bool] | None = None,
+    with_cursor: bool = False,
+) -> Iterator[Any]:
+    """
+    Drives a cursor-chained pagination, fetching the next page while the
+    caller processes the current one.
+    :param fetch_page: cursor -> (page, next_cursor); a falsy page ends the chain
+    :param cursor: cursor of the first page
+    :param should_prefetch: page -> whether the next page will still be needed
+    :param with_cursor: yield (page, next_cursor) pairs, e.g. to checkpoint them
+    :return: iterator of pages in order
+    """
+    future = executor.submit(site, fetch_page, cursor)
+    try:
+        while future is not None:
+            page, next_cursor = future.result()
+            future = None
+            if not page:
+                return
+            if next_cursor is not None and (
+                should_prefetch is None or should_prefetch(page)
+            ):
+                future = executor.submit(site, fetch_page, next_cursor)
+            yield (page, next_cursor) if with_cursor else page
+    finally:
+        if future is not None:
+            future.cancel()
+
+
+def fan_out_pages(
+    executor: ScrapeExecutor,
+    site: Site,
+    fetch_page: Callable[[int], Any],
+    start: int,
+    fanout: int,
+    step: int = 1,
+    end: int | None = None,
+    between_batches: Callable[[], None] | None = None,
+) -> Iterator[Any]:
+    """
+    Fetches directly addressable pages in concurrent batches of fanout,
+    yielding them in order and stopping at the first empty page.
+    :param fetch_page: page key (offset or page number) -> page
+    :param start: key of the first page
+    :param step: distance between consecutive page keys
+    :param end: exclusive upper bound on page keys
+    :param between_batches: called before each batch after the first, e.g. a delay
+    :return: iterator of pages in order
+    """
+    key = start
+    futures = []
+    try:
+        while end is None or key < end:
+            if key != start and between_batches:
+                between_batches()
+            keys = [key + i * step for i in range(fanout)]
+            keys = [k for k in keys if end is None or k < end]
+            futures = [executor.submit(site, fetch_page, k) for k in keys]
+            while futures:
+                page = futures.pop(0).result()
+                if not page:
+                    return
+                yield page
+            key += len(keys) * step
+    finally:
+        for future in futures:
+            future.cancel()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+from tls_client.exceptions import TLSClientException
+
+from jobspy.exception import CircuitOpenException, RequestBudgetException
+from jobspy.model import Site
+from jobspy.util import create_logger
+
+log = create_logger("Retry")
+
+transport_errors = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    TLSClientException,
+)
+
+
+def retry_after_seconds(response) -> float | None:
+    """
+    Parses the Retry-After header, either delay seconds or an HTTP date
+    """
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    if isinstance(value, list):
+        value = value[0]
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """
+    Counts consecutive blocked responses per site and proxy. Once threshold is
+    reached, requests through that proxy fail fast for cooldown seconds, after
+    which a single trial request decides whether the circuit closes again.
+    """
+
+    def __init__(self, threshold: int = 3, cooldown: float = 300):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures: dict[tuple[Site, str], int] = {}
+        self.open_until: dict[tuple[Site, str], float] = {}
+        self.lock = threading.Lock()
+
+    def check(self, site: Site, proxy: str):
+        with self.lock:
+            open_until = self.open_until.get((site, proxy))
+            if open_until is None:
+                return
+            if time.time() < open_until:
+                raise CircuitOpenException(
+                    f"{site.value} blocked requests through {proxy}, "
+                    f"paused for {open_until - time.time():.0f}s"
+                )
+            # half open, let this request through as the trial
+            del self.open_until[(site, proxy)]
+            self.failures[(site, proxy)] = self.threshold - 1
+
+    def record(self, site: Site, proxy: str, blocked: bool):
+        with self.lock:
+            if not blocked:
+                self.failures.pop((site, proxy), None)
+                return
+            failures = self.failures.get((site, proxy), 0) + 1
+            self.failures[(site, proxy)] = failures
+            if failures >= self.threshold:
+                log.warning(f"{site.value} is blocking {proxy}, opening circuit")
+                self.open_until[(site, proxy)] = time.time() + self.cooldown
+
+    def is_open(self, site: Site, proxy: str) -> bool:
+        with self.lock:
+            return self.open_until.get((site, proxy), 0) > time.time()
+
+
+default_breaker = CircuitBreaker()
+
+
+class RetryPolicy:
+    """
+    Retries transport errors and retryable statuses with jittered exponential
+    backoff, honouring Retry-After, until the attempts per request or the
+    retries shared by the whole run are used up. Blocked responses feed the
+    circuit breaker, which is shared across runs by default.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        retry_statuses: tuple[int, ...] = (429, 500, 502, 503, 504),
+        blocked_statuses: tuple[int, ...] = (429,),
+        blocked_urls: tuple[str, ...] = ("linkedin.com/signup",),
+        budget: int | None = 100,
+        breaker: CircuitBreaker | None = None,
+        request_limits: dict[Site, int] | None = None,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = retry_statuses
+        self.blocked_statuses = blocked_statuses
+        self.blocked_urls = blocked_urls
+        self.budget = budget
+        self.breaker = breaker or default_breaker
+        self.retries = 0
+        self.requests: dict[Site, int] = {}
+        # requests the run may send per site, further ones fail without sending
+        self.request_limits = request_limits or {}
+        self.lock = threading.Lock()
+
+    def is_blocked(self, response) -> bool:
+        if response.status_code in self.blocked_statuses:
+            return True
+        return any(marker in (response.url or "") for marker in self.blocked_urls)
+
+    def count_request(self, site: Site | None):
+        if site is None:
+            return
+        with self.lock:
+            count = self.requests.get(site, 0) + 1
+            limit = self.request_limits.get(site)
+            if limit is not None and count > limit:
+                raise RequestBudgetException(
+                    f"{site.value} request budget of {limit} used up"
+                )
+            self.requests[site] = count
+
+    def take_retry(self) -> bool:
+        """Uses one retry of the run's budget, False once it is spent"""
+        with self.lock:
+            if self.budget is not None and self.retries >= self.budget:
+                return False
+            self.retries += 1
+            return True
+
+    def delay(self, attempt: int, response=None) -> float:
+        retry_after = retry_after_seconds(response)
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        delay = self.backoff * 2**attempt
+        return min(random.uniform(delay / 2, delay * 1.5), self.max_backoff)
+
+    def send(self, site: Site | None, proxy: str, send):
+        """
+        Calls send() until it returns a response that should not be retried
+        :param site: site the circuit breaker is keyed on, None to skip it
+        :param proxy: proxy the request goes through, "direct" without one
+        :param send: function sending the request and returning its response
+        """
+        if site is not None:
+            self.breaker.check(site, proxy)
+        attempt = 0
+        while True:
+            self.count_request(site)
+            try:
+                response = send()
+            except transport_errors:
+                if attempt + 1 >= self.max_attempts or not self.take_retry():
+                    raise
+                time.sleep(self.delay(attempt))
+                attempt += 1
+                continue
+            if site is not None:
+                self.breaker.record(site, proxy, self.is_blocked(response))
+            if (
+                response.status_code not in self.retry_statuses
+                or attempt + 1 >= self.max_attempts
+                or (site is not None and self.breaker.is_open(site, proxy))
+                or not self.take_retry()
+            ):
+                return response
+            wait = self.delay(attempt, response)
+            log.debug(f"status {response.status_code}, retrying in {wait:.1f}s")
+            time.sleep(wait)
+            attempt += 1
@@ -0,0 +1,255 @@
+"""
+Runs saved searches on their own intervals, e.g.
+
+    python -m jobspy.scheduler searches.json --store jobs.db
+
+where searches.json holds
+
+    {
+        "site_budgets": {"linkedin": {"requests": 300, "window_minutes": 60}},
+        "searches": [
+            {
+                "name": "python-nyc",
+                "interval_minutes": 120,
+                "params": {"site_name": ["linkedin", "indeed"],
+                           "search_term": "python", "location": "New York, NY"}
+            }
+        ]
+    }
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import time
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from jobspy import scrape_jobs
+from jobspy.model import Site
+from jobspy.retry import RetryPolicy
+from jobspy.shard import hours_old_conflicts_with
+from jobspy.store import JobStore
+from jobspy.util import (
+    create_logger,
+    json_loads,
+    map_str_to_site,
+    set_logger_level,
+    write_json_atomic,
+)
+
+log = create_logger("Scheduler")
+
+
+class SavedSearch(BaseModel):
+    name: str
+    interval_minutes: float
+    params: dict
+    # runs are spread over interval * (1 +/- jitter)
+    jitter: float = 0.1
+
+    def sites(self) -> list[Site]:
+        site_name = self.params.get("site_name")
+        if site_name is None:
+            return list(Site)
+        if isinstance(site_name, str):
+            site_name = [site_name]
+        return [map_str_to_site(site) for site in site_name]
+
+
+class SiteBudget(BaseModel):
+    requests: int
+    window_minutes: float = 60
+
+
+class RequestWindow:
+    """
+    Sliding window of the requests sent to each site. A site over its budget is
+    left out of runs until enough of its requests age out of the window.
+    """
+
+    def __init__(self, budgets: dict[Site, SiteBudget], usage: dict | None = None):
+        self.budgets = budgets
+        self.usage: dict[str, list[list[float]]] = usage or {}
+
+    def _prune(self, site: Site, now: float) -> list[list[float]]:
+        budget = self.budgets[site]
+        start = now - budget.window_minutes * 60
+        entries = [
+            entry for entry in self.usage.get(site.value, []) if entry[0] > start
+        ]
+        self.usage[site.value] = entries
+        return entries
+
+    def allows(self, site: Site, now: float) -> bool:
+        if site not in self.budgets:
+            return True
+        return self.remaining(site, now) > 0
+
+    def remaining(self, site: Site, now: float) -> int:
+        used = sum(count for _, count in self._prune(site, now))
+        return max(0, self.budgets[site].requests - used)
+
+    def reopens(self, site: Site, now: float) -> float:
+        """Time at which the oldest request of the window ages out"""
+        entries = self._prune(site, now)
+        if not entries:
+            return now
+        return entries[0][0] + self.budgets[site].window_minutes * 60
+
+    def charge(self, requests: dict[Site, int], now: float):
+        for site, count in requests.items():
+            if site in self.budgets and count:
+                self.usage.setdefault(site.value, []).append([now, count])
+
+
+class Scheduler:
+    """
+    Runs each saved search every interval_minutes with jitter, first runs spread
+    over one interval so searches loaded together do not fire together. Each run
+    only asks for jobs posted since the search last ran on a site, unless that
+    would drop a filter of the search (Indeed ignores job_type, is_remote and
+    easy_apply with hours_old, LinkedIn easy_apply). A run may send each site
+    only what is left of its budget. The run times and request usage survive
+    restarts through the state file.
+    """
+
+    def __init__(
+        self,
+        searches: list[SavedSearch],
+        state_path: str | Path = "scheduler_state.json",
+        site_budgets: dict[str | Site, SiteBudget | dict] | None = None,
+        store: JobStore | str | None = None,
+        overlap_hours: int = 1,
+    ):
+        self.searches = {search.name: search for search in searches}
+        self.state_path = Path(state_path)
+        self.store = JobStore(store) if isinstance(store, str) else store
+        self.overlap_hours = overlap_hours
+        state = {}
+        if self.state_path.exists():
+            state = json_loads(self.state_path.read_text())
+        self.state: dict[str, dict] = state.get("searches", {})
+        budgets = {
+            (map_str_to_site(site) if isinstance(site, str) else site): (
+                SiteBudget(**budget) if isinstance(budget, dict) else budget
+            )
+            for site, budget in (site_budgets or {}).items()
+        }
+        self.window = RequestWindow(budgets, state.get("usage"))
+        now = time.time()
+        for search in searches:
+            if "next_run" not in self.state.get(search.name, {}):
+                first_run = now + random.uniform(0, search.interval_minutes * 60)
+                self.state[search.name] = {"next_run": first_run, "last_run": {}}
+
+    @classmethod
+    def from_file(cls, path: str | Path, **kwargs) -> Scheduler:
+        config = json_loads(Path(path).read_text())
+        searches = [SavedSearch(**search) for search in config["searches"]]
+        kwargs.setdefault("site_budgets", config.get("site_budgets"))
+        kwargs.setdefault("store", config.get("store"))
+        return cls(searches, **kwargs)
+
+    def save_state(self):
+        write_json_atomic(
+            self.state_path, {"searches": self.state, "usage": self.window.usage}
+        )
+
+    def next_run(self) -> float:
+        return min(
+            (self.state[name]["next_run"] for name in self.searches), default=math.inf
+        )
+
+    def run_pending(self, now: float | None = None) -> int:
+        """
+        Runs every search that is due, earliest first
+        :return: number of searches run
+        """
+        now = now or time.time()
+        due = sorted(
+            (name for name in self.searches if self.state[name]["next_run"] <= now),
+            key=lambda name: self.state[name]["next_run"],
+        )
+        ran = sum(self.run_search(self.searches[name], now) for name in due)
+        self.save_state()
+        return ran
+
+    def run_search(self, search: SavedSearch, now: float) -> bool:
+        state = self.state[search.name]
+        sites = [site for site in search.sites() if self.window.allows(site, now)]
+        if not sites:
+            state["next_run"] = min(
+                self.window.reopens(site, now) for site in search.sites()
+            )
+            log.info(f"{search.name}: every site is over budget, deferred")
+            return False
+
+        params = dict(search.params, site_name=[site.value for site in sites])
+        last_runs = [state["last_run"].get(site.value) for site in sites]
+        drops_filters = not params.get("hours_old") and any(
+            hours_old_conflicts_with(site, params) for site in sites
+        )
+        if all(last_runs) and not drops_filters:
+            hours_since = math.ceil((now - min(last_runs)) / 3600) + self.overlap_hours
+            if params.get("hours_old"):
+                hours_since = min(hours_since, params["hours_old"])
+            params["hours_old"] = hours_since
+        retry_policy = params.pop("retry_policy", None) or RetryPolicy()
+        retry_policy.request_limits = {
+            site: self.window.remaining(site, now)
+            for site in sites
+            if site in self.window.budgets
+        }
+
+        try:
+            jobs = scrape_jobs(**params, retry_policy=retry_policy, store=self.store)
+            log.info(f"{search.name}: {len(jobs)} jobs from {len(sites)} sites")
+            # sites stopped early, e.g. by their request budget, are covered again
+            stopped = jobs.attrs.get("site_errors", {})
+            for site in sites:
+                if site.value not in stopped:
+                    state["last_run"][site.value] = now
+        except Exception as e:
+            # last_run stays put so the next run covers the missed window
+            log.error(f"{search.name}: run failed - {e}")
+        self.window.charge(retry_policy.requests, now)
+        interval = search.interval_minutes * 60
+        state["next_run"] = now + interval * random.uniform(
+            1 - search.jitter, 1 + search.jitter
+        )
+        return True
+
+    def run_forever(self, poll: float = 30):
+        while True:
+            self.run_pending()
+            time.sleep(max(1.0, min(poll, self.next_run() - time.time())))
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m jobspy.scheduler", description="Runs saved job searches"
+    )
+    parser.add_argument("searches", help="JSON file of saved searches")
+    parser.add_argument("--state", default="scheduler_state.json")
+    parser.add_argument("--store", help="SQLite job store the results go to")
+    parser.add_argument("--once", action="store_true", help="run due searches, exit")
+    parser.add_argument("--verbose", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    set_logger_level(args.verbose)
+    kwargs = {"state_path": args.state}
+    if args.store:
+        kwargs["store"] = args.store
+    scheduler = Scheduler.from_file(args.searches, **kwargs)
+    if args.once:
+        scheduler.run_pending()
+    else:
+        scheduler.run_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""
+Serves scrape_jobs as a JSON API, e.g.
+
+    python -m jobspy.server --port 8000
+    curl -d '{"site_name": "indeed", "search_term": "python"}' localhost:8000/scrape
+
+POST /scrape takes the scrape_jobs parameters as a JSON object and streams the
+jobs back as NDJSON while pages complete, or as one JSON array with ?format=json.
+Identical requests share one in-flight scrape and its result for ttl seconds.
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from jobspy import scrape_jobs
+from jobspy.cli import python_params
+from jobspy.model import ScraperInput
+from jobspy.util import create_logger, json_dumps, json_loads, set_logger_level
+from jobspy.work_queue import dump_scraper_input, search_scraper_input
+
+log = create_logger("Server")
+
+# parameters naming files on the server are not taken from requests
+server_params = {"store", "session_state", "checkpoints", "ca_cert", "verbose"}
+# parameters that go into the ScraperInput, the others are output options
+input_params = {"site_name", "country_indeed", *ScraperInput.model_fields}
+
+
+class Flight:
+    """
+    One scrape and the pages it produced so far. Any number of readers iterate
+    over the pages, waiting for new ones until the scrape finishes.
+    """
+
+    def __init__(self):
+        self.pages: list[list[dict]] = []
+        self.done = False
+        self.error: Exception | None = None
+        self.expires = float("inf")
+        self.cond = threading.Condition()
+
+    def add(self, site: str, rows: list[dict]):
+        with self.cond:
+            self.pages.append(rows)
+            self.cond.notify_all()
+
+    def finish(self, error: Exception | None = None, ttl: float = 0):
+        with self.cond:
+            self.done = True
+            self.error = error
+            self.expires = time.time() + ttl
+            self.cond.notify_all()
+
+    def __iter__(self):
+        read = 0
+        while True:
+            with self.cond:
+                self.cond.wait_for(lambda: read < len(self.pages) or self.done)
+                pages = self.pages[read:]
+                done, error = self.done, self.error
+            read += len(pages)
+            yield from pages
+            if done and read == len(self.pages):
+                if error is not None:
+                    raise error
+                return
+
+
+class SingleFlight:
+    """
+    Coalesces identical scrapes: a request joins the scrape already running for
+    its parameters, or reuses a finished one for ttl seconds, instead of
+    starting another. Failed scrapes are not cached.
+    """
+
+    def __init__(self, ttl: float = 60, **defaults):
+        self.ttl = ttl
+        self.defaults = defaults
+        self.flights: dict[str, Flight] = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(params: dict) -> str:
+        """
+        Requests for the same ScraperInput and output options share a key, however
+        they spell them, e.g. "indeed" or ["indeed"], or a default left out
+        """
+        scraper_input = dump_scraper_input(search_scraper_input(params))
+        scraper_input["site_type"] = sorted(scraper_input["site_type"])
+        options = {
+            name: params.get(name, param.default)
+            for name, param in inspect.signature(scrape_jobs).parameters.items()
+            if name not in input_params | python_params | server_params
+        }
+        return json.dumps([scraper_input, options], sort_keys=True, default=str)
+
+    def get(self, params: dict) -> tuple[Flight, str]:
+        """
+        :return: the flight for params, and whether it was a cache hit, shared
+            with a running scrape or started (a miss)
+        """
+        key = self.key(params)
+        now = time.time()
+        with self.lock:
+            for stale in [k for k, f in self.flights.items() if f.expires < now]:
+                del self.flights[stale]
+            flight = self.flights.get(key)
+            if flight is not None:
+                return flight, "hit" if flight.done else "shared"
+            flight = self.flights[key] = Flight()
+        threading.Thread(
+            target=self._run, args=(key, flight, params), daemon=True
+        ).start()
+        return flight, "miss"
+
+    def _run(self, key: str, flight: Flight, params: dict):
+        try:
+            scrape_jobs(**self.defaults, **params, on_page=flight.add)
+        except Exception as e:
+            log.error(f"scrape failed: {e}")
+            with self.lock:
+                self.flights.pop(key, None)
+            flight.finish(e)
+            return
+        flight.finish(ttl=self.ttl)
+
+    def stats(self) -> dict:
+        with self.lock:
+            flights = list(self.flights.values())
+        in_flight = sum(not flight.done for flight in flights)
+        return {"in_flight": in_flight, "cached": len(flights) - in_flight}
+
+
+def request_params(body: bytes) -> dict:
+    params = json_loads(body or b"{}")
+    if not isinstance(params, dict):
+        raise ValueError("expected a JSON object of scrape_jobs parameters")
+    allowed = set(inspect.signature(scrape_jobs).parameters)
+    allowed -= python_params | server_params
+    unknown = set(params) - allowed
+    if unknown:
+        raise ValueError(f"unknown parameters: {', '.join(sorted(unknown))}")
+    return params
+
+
+class ScrapeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    flights: SingleFlight
+
+    def do_GET(self):
+        if urlparse(self.path).path != "/health":
+            return self._send_json(404, {"error": "not found"})
+        self._send_json(200, {"status": "ok", **self.flights.stats()})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != "/scrape":
+            return self._send_json(404, {"error": "not found"})
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            params = request_params(self.rfile.read(length))
+            flight, cache = self.flights.get(params)
+        except Exception as e:
+            # unknown parameters, or values the ScraperInput rejects
+            return self._send_json(400, {"error": str(e)})
+        rows = iter(flight)
+        try:
+            # wait for the first page so failed scrapes still get an error status
+            first = next(rows, None)
+        except Exception as e:
+            return self._send_json(502, {"error": str(e)})
+
+        if parse_qs(url.query).get("format") == ["json"]:
+            try:
+                jobs = [row for page in (first, *rows) if page for row in page]
+            except Exception as e:
+                return self._send_json(502, {"error": str(e)})
+            return self._send_json(200, jobs, cache)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("X-JobSpy-Cache", cache)
+        self.end_headers()
+        try:
+            if first:
+                self._send_chunk(first)
+            for page in rows:
+                self._send_chunk(page)
+        except Exception as e:
+            # the status is already sent, report the failure in the stream
+            self._send_chunk([{"error": str(e)}])
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send_chunk(self, rows: list[dict]):
+        data = "".join(json_dumps(row) + "\n" for row in rows).encode()
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def _send_json(self, status: int, body, cache: str | None = None):
+        data = json_dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if cache:
+            self.send_header("X-JobSpy-Cache", cache)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        log.debug(format % args)
+
+
+def create_server(
+    host: str = "127.0.0.1", port: int = 8000, ttl: float = 60, **defaults
+) -> ThreadingHTTPServer:
+    """
+    :param defaults: scrape_jobs parameters for every request, e.g. store or proxies
+    """
+    flights = SingleFlight(ttl, **defaults)
+    handler = type("Handler", (ScrapeHandler,), {"flights": flights})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m jobspy.server", description="Serves scrape_jobs over HTTP"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--ttl", type=float, default=60, help="result cache seconds")
+    parser.add_argument("--store", help="SQLite job store every scrape goes to")
+    parser.add_argument("--verbose", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    set_logger_level(args.verbose)
+    defaults = {"verbose": args.verbose}
+    if args.store:
+        defaults["store"] = args.store
+    server = create_server(args.host, args.port, args.ttl, **defaults)
+    log.info(f"serving on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
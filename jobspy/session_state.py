@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from pathlib import Path
+
+from jobspy.model import Site
+from jobspy.util import create_logger, json_loads, write_json_atomic
+
+log = create_logger("SessionState")
+
+
+class SessionStateStore:
+    """
+    Persists cookies, tokens and their expiry per site and proxy in a directory
+    shared across processes, so warm-up requests (csrf tokens, session events,
+    cookies) are only repeated when the stored state expires or is rejected.
+    """
+
+    def __init__(self, path: str | Path, ttl: int = 6 * 3600):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def proxy_key(proxies: list[str] | str | None) -> str:
+        if not proxies:
+            return "direct"
+        if isinstance(proxies, str):
+            return proxies
+        return ",".join(proxies)
+
+    def _file(self, site: Site, proxies: list[str] | str | None) -> Path:
+        digest = hashlib.sha1(self.proxy_key(proxies).encode()).hexdigest()[:12]
+        return self.path / f"{site.value}-{digest}.json"
+
+    def load(self, site: Site, proxies: list[str] | str | None) -> dict | None:
+        """
+        :return: {"cookies", "tokens", "expires_at"}, None if missing or expired
+        """
+        file = self._file(site, proxies)
+        try:
+            state = json_loads(file.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if state.get("expires_at", 0) < time.time():
+            return None
+        return state
+
+    def save(
+        self,
+        site: Site,
+        proxies: list[str] | str | None,
+        cookies: dict | None = None,
+        tokens: dict | None = None,
+        ttl: int | None = None,
+    ):
+        state = {
+            "site": site.value,
+            "proxy": self.proxy_key(proxies),
+            "cookies": cookies or {},
+            "tokens": tokens or {},
+            "expires_at": time.time() + (ttl or self.ttl),
+        }
+        with self._lock:
+            write_json_atomic(self._file(site, proxies), state)
+
+    def invalidate(self, site: Site, proxies: list[str] | str | None):
+        try:
+            self._file(site, proxies).unlink()
+        except FileNotFoundError:
+            pass
+
+    def restore(
+        self, site: Site, proxies: list[str] | str | None, session
+    ) -> dict | None:
+        """
+        Applies the stored cookies to session
+        :return: stored tokens, None if there is no valid stored state
+        """
+        state = self.load(site, proxies)
+        if state is None:
+            return None
+        session.cookies.update(state["cookies"])
+        log.debug(f"reusing stored session state for {site.value}")
+        return state["tokens"]
+
+    def persist(
+        self,
+        site: Site,
+        proxies: list[str] | str | None,
+        session,
+        tokens: dict | None = None,
+    ):
+        """Stores the session's current cookies along with tokens"""
+        cookies = {cookie.name: cookie.value for cookie in session.cookies}
+        self.save(site, proxies, cookies=cookies, tokens=tokens)
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from itertools import product
+
+from pydantic import BaseModel
+
+from jobspy.model import JobPost, JobType, ScraperInput, Site
+
+SHARD_DIMENSIONS = ("job_type", "hours_old", "location", "company")
+
+shard_job_types = [
+    JobType.FULL_TIME,
+    JobType.PART_TIME,
+    JobType.CONTRACT,
+    JobType.INTERNSHIP,
+    JobType.TEMPORARY,
+]
+
+# posting-age windows in hours; sites only filter by "newer than", so the
+# windows overlap and the narrow ones surface recent jobs the wide ones cap out on
+shard_hours_old = [24, 72, 168, 720]
+
+# filters a site drops once hours_old is set, see "Indeed limitations" in the README
+hours_old_conflicts = {
+    Site.INDEED: ("job_type", "is_remote", "easy_apply"),
+    Site.LINKEDIN: ("easy_apply",),
+}
+
+
+def hours_old_conflicts_with(site: Site, params: dict) -> bool:
+    """Whether adding hours_old would make the site ignore a filter of params"""
+    return any(params.get(name) for name in hours_old_conflicts.get(site, ()))
+
+
+class Shard(BaseModel):
+    site: Site
+    label: str
+    scraper_input: ScraperInput
+
+
+class ShardCoverage(BaseModel):
+    site: Site
+    label: str
+    results_wanted: int
+    jobs_found: int = 0
+    new_jobs: int = 0
+    kept: int = 0
+
+    @property
+    def saturated(self) -> bool:
+        """Shard returned as many jobs as it asked for, so it may be capped"""
+        return self.jobs_found >= self.results_wanted
+
+    def summary(self) -> dict:
+        return {
+            "site": self.site.value,
+            "shard": self.label,
+            "jobs_found": self.jobs_found,
+            "new_jobs": self.new_jobs,
+            "kept": self.kept,
+            "saturated": self.saturated,
+        }
+
+
+def _dimension_values(
+    dimension: str,
+    site: Site,
+    scraper_input: ScraperInput,
+    shard_locations: list[str] | None,
+    shard_by: list[str] = (),
+) -> list[tuple[str, dict]]:
+    """
+    Gets the (label, ScraperInput overrides) for one sharding dimension on a site
+    :param shard_by: all dimensions of the plan, as they interact
+    """
+    if dimension == "job_type" and not scraper_input.job_type:
+        return [
+            (job_type.value[0], {"job_type": job_type}) for job_type in shard_job_types
+        ]
+    if dimension == "hours_old" and not scraper_input.hours_old:
+        filters = scraper_input.model_dump()
+        if "job_type" in shard_by:
+            filters["job_type"] = True
+        if hours_old_conflicts_with(site, filters):
+            # the site would drop the query's filters for any posting-age window
+            return [("", {})]
+    if dimension == "hours_old":
+        windows = [
+            hours
+            for hours in shard_hours_old
+            if not scraper_input.hours_old or hours < scraper_input.hours_old
+        ]
+        # the widest shard keeps the query's own limit, none if it had none
+        windows.append(scraper_input.hours_old)
+        return [
+            (f"{hours}h" if hours else "any age", {"hours_old": hours})
+            for hours in windows
+        ]
+    if dimension == "location" and shard_locations:
+        return [(location, {"location": location}) for location in shard_locations]
+    if (
+        dimension == "company"
+        and site == Site.LINKEDIN
+        and scraper_input.linkedin_company_ids
+    ):
+        return [
+            (f"company:{company_id}", {"linkedin_company_ids": [company_id]})
+            for company_id in scraper_input.linkedin_company_ids
+        ]
+    if dimension not in SHARD_DIMENSIONS:
+        raise ValueError(
+            f"Invalid shard dimension: {dimension}. Valid dimensions are: {', '.join(SHARD_DIMENSIONS)}"
+        )
+    return [("", {})]
+
+
+def plan_shards(
+    scraper_input: ScraperInput,
+    shard_by: list[str],
+    shard_locations: list[str] | None = None,
+) -> list[Shard]:
+    """
+    Splits a logical query into independent per-site queries, one for each
+    combination of the shard dimensions that apply to the site
+    :param shard_by: any of job_type, hours_old, location, company
+    :param shard_locations: sub-locations used by the location dimension
+    :return: shards to run in parallel
+    """
+    shards = []
+    for site in scraper_input.site_type:
+        dimensions = [
+            _dimension_values(dimension, site, scraper_input, shard_locations, shard_by)
+            for dimension in shard_by
+        ]
+        for combination in product(*dimensions):
+            overrides = {"site_type": [site]}
+            labels = []
+            for label, dimension_overrides in combination:
+                overrides.update(dimension_overrides)
+                if label:
+                    labels.append(label)
+            shards.append(
+                Shard(
+                    site=site,
+                    label="/".join(labels) or "all",
+                    scraper_input=scraper_input.model_copy(update=overrides),
+                )
+            )
+    return shards
+
+
+def merge_shard_jobs(
+    shard: Shard,
+    jobs: list[JobPost],
+    seen_ids: set[str],
+    merged: list[JobPost],
+) -> ShardCoverage:
+    """
+    Adds the jobs of a shard not already merged from another shard of the site
+    :return: coverage of the shard
+    """
+    coverage = ShardCoverage(
+        site=shard.site,
+        label=shard.label,
+        results_wanted=shard.scraper_input.results_wanted,
+        jobs_found=len(jobs),
+    )
+    for job in jobs:
+        job_key = job.id or job.job_url
+        if job_key in seen_ids:
+            continue
+        seen_ids.add(job_key)
+        merged.append(job)
+        coverage.new_jobs += 1
+    return coverage
+
+
+def cap_merged_jobs(
+    merged: list[JobPost],
+    coverages: list[ShardCoverage],
+    results_wanted: int,
+) -> list[JobPost]:
+    """
+    Keeps the first results_wanted merged jobs of a site, as each shard asks for
+    results_wanted on its own
+    :param coverages: coverage of the site's shards, in merge order; kept is set
+        to how many of each shard's new jobs survive the cap
+    """
+    remaining = results_wanted
+    for coverage in coverages:
+        coverage.kept = min(coverage.new_jobs, remaining)
+        remaining -= coverage.kept
+    return merged[:results_wanted]
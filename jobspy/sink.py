@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable
+
+import pandas as pd
+
+from jobspy.model import Country, JobPost, Site
+from jobspy.util import desired_order, job_to_row
+
+
+class PageSink:
+    """
+    Turns the jobs each scraper hands over after a page into rows and passes them
+    to on_page as they arrive, skipping jobs passed on before and jobs beyond
+    results_wanted for the site or total_results_wanted overall. Calls are
+    serialized, so on_page may write to a single file without locking. The
+    sink keeps only the ids it saw; the scrapers keep their own pages until
+    they return.
+    """
+
+    def __init__(
+        self,
+        on_page: Callable[[str, list[dict]], None],
+        country: Country,
+        results_wanted: int,
+        total_results_wanted: int | None = None,
+        enforce_annual_salary: bool = False,
+        store=None,
+    ):
+        self.on_page = on_page
+        self.country = country
+        self.results_wanted = results_wanted
+        self.total_results_wanted = total_results_wanted
+        self.enforce_annual_salary = enforce_annual_salary
+        self.store = store
+        self.seen: dict[str, set[str]] = {}
+        self.rows_emitted = 0
+        self.lock = threading.Lock()
+
+    def full(self, seen: set[str]) -> bool:
+        if len(seen) >= self.results_wanted:
+            return True
+        total = self.total_results_wanted
+        return total is not None and self.rows_emitted >= total
+
+    def __call__(self, site: Site, jobs: list[JobPost]):
+        with self.lock:
+            seen = self.seen.setdefault(site.value, set())
+            rows = []
+            for job in jobs:
+                key = job.id or job.job_url
+                if key in seen:
+                    continue
+                if self.full(seen):
+                    break
+                seen.add(key)
+                self.rows_emitted += 1
+                row = job_to_row(
+                    job, site.value, self.country, self.enforce_annual_salary
+                )
+                rows.append({column: row.get(column) for column in desired_order})
+            if not rows:
+                return
+            if self.store is not None:
+                self.store.upsert(pd.DataFrame(rows))
+            self.on_page(site.value, rows)
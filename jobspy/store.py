@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from jobspy.model import Site
+from jobspy.util import create_logger, desired_order
+
+log = create_logger("Store")
+
+column_types = {
+    "min_amount": "REAL",
+    "max_amount": "REAL",
+    "company_rating": "REAL",
+    "company_reviews_count": "INTEGER",
+    "vacancy_count": "INTEGER",
+    "is_remote": "INTEGER",
+}
+indexed_columns = ["site", "date_posted", "company", "min_amount"]
+# full text columns with their bm25 weights
+text_columns = {"title": 10.0, "company": 5.0, "skills": 3.0, "description": 1.0}
+columns = [column for column in desired_order if column != "id"]
+
+
+def _sql_value(value):
+    """Converts a DataFrame cell to a value sqlite3 can bind"""
+    if value is None:
+        return None
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    if value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, pd.Timestamp):
+        # date_posted of typed output, stored as the date like untyped rows
+        value = value.date()
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return ", ".join(map(str, value))
+    return value
+
+
+class JobStore:
+    """
+    SQLite table of scraped jobs keyed by the site-prefixed job id. Upserts keep
+    the first_seen time of a job, refresh last_seen and never replace a stored
+    value with a missing one.
+
+    With full_text, an FTS5 index over title, company, skills and description is
+    kept in sync by triggers, so every later upsert into the database updates it.
+    """
+
+    table = "jobs"
+    fts_table = "jobs_fts"
+
+    def __init__(self, path: str | Path = "jobs.db", full_text: bool = False):
+        self.path = str(path)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self._create_schema()
+            if full_text:
+                self._create_full_text_index()
+
+    def _create_schema(self):
+        definitions = ", ".join(
+            f"{column} {column_types.get(column, 'TEXT')}" for column in columns
+        )
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            f"id TEXT PRIMARY KEY, {definitions}, "
+            f"first_seen TEXT NOT NULL, last_seen TEXT NOT NULL)"
+        )
+        for column in indexed_columns + ["last_seen"]:
+            self.conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.table}_{column} "
+                f"ON {self.table} ({column})"
+            )
+
+    def _create_full_text_index(self):
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = ?", (self.fts_table,)
+        ).fetchone()
+        if exists:
+            return
+        names = ", ".join(text_columns)
+        new_values = ", ".join(f"new.{column}" for column in text_columns)
+        old_values = ", ".join(f"old.{column}" for column in text_columns)
+        changed = " OR ".join(
+            f"old.{column} IS NOT new.{column}" for column in text_columns
+        )
+        delete_old = (
+            f"INSERT INTO {self.fts_table} ({self.fts_table}, rowid, {names}) "
+            f"VALUES ('delete', old.rowid, {old_values});"
+        )
+        insert_new = (
+            f"INSERT INTO {self.fts_table} (rowid, {names}) "
+            f"VALUES (new.rowid, {new_values});"
+        )
+        self.conn.executescript(
+            f"""
+            CREATE VIRTUAL TABLE {self.fts_table} USING fts5(
+                {names}, content='{self.table}', content_rowid='rowid',
+                tokenize='porter unicode61'
+            );
+            CREATE TRIGGER {self.table}_fts_insert AFTER INSERT ON {self.table}
+            BEGIN {insert_new} END;
+            CREATE TRIGGER {self.table}_fts_delete AFTER DELETE ON {self.table}
+            BEGIN {delete_old} END;
+            CREATE TRIGGER {self.table}_fts_update AFTER UPDATE ON {self.table}
+            WHEN {changed}
+            BEGIN {delete_old} {insert_new} END;
+            INSERT INTO {self.fts_table} ({self.fts_table}) VALUES ('rebuild');
+            """
+        )
+
+    def upsert(self, jobs_df: pd.DataFrame) -> int:
+        """
+        Inserts new jobs and updates known ones in one transaction
+        :param jobs_df: DataFrame in the scrape_jobs layout
+        :return: number of rows written
+        """
+        if jobs_df is None or jobs_df.empty or "id" not in jobs_df.columns:
+            return 0
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        present = [column for column in columns if column in jobs_df.columns]
+        rows = [
+            [_sql_value(value) for value in row] + [now, now]
+            for row in jobs_df[["id"] + present].itertuples(index=False, name=None)
+            if row[0] is not None
+        ]
+        updates = ", ".join(
+            f"{column} = COALESCE(excluded.{column}, {column})" for column in present
+        )
+        insert_columns = ", ".join(["id", *present, "first_seen", "last_seen"])
+        placeholders = ", ".join("?" * (len(present) + 3))
+        sql = (
+            f"INSERT INTO {self.table} ({insert_columns}) VALUES ({placeholders}) "
+            f"ON CONFLICT(id) DO UPDATE SET {updates}, "
+            f"last_seen = excluded.last_seen"
+        )
+        with self.lock, self.conn:
+            self.conn.executemany(sql, rows)
+        log.debug(f"upserted {len(rows)} jobs into {self.path}")
+        return len(rows)
+
+    def query(
+        self,
+        site: str | Site | Iterable[str | Site] | None = None,
+        company: str | None = None,
+        posted_since: date | str | None = None,
+        min_salary: float | None = None,
+        is_remote: bool | None = None,
+        where: str | None = None,
+        params: Iterable = (),
+        order_by: str = "date_posted DESC",
+        limit: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Reads stored jobs matching all of the given conditions
+        :param where: extra SQL condition, with ? placeholders bound to params
+        :return: DataFrame with the scrape_jobs columns plus first_seen, last_seen
+        """
+        conditions, values = self._conditions(
+            site, company, posted_since, min_salary, is_remote, where, params
+        )
+        sql = f"SELECT * FROM {self.table}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        if order_by:
+            sql += f" ORDER BY {order_by}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return self.sql(sql, values)
+
+    def search(
+        self,
+        query: str,
+        site: str | Site | Iterable[str | Site] | None = None,
+        company: str | None = None,
+        posted_since: date | str | None = None,
+        min_salary: float | None = None,
+        is_remote: bool | None = None,
+        where: str | None = None,
+        params: Iterable = (),
+        limit: int = 50,
+    ) -> pd.DataFrame:
+        """
+        Full text search of the stored jobs, best matches first
+        :param query: FTS5 query, e.g. 'python AND "machine learning"' or 'kubernet*'
+        :return: matching jobs with a rank column, lower is better
+        """
+        with self.lock, self.conn:
+            self._create_full_text_index()
+        weights = ", ".join(str(weight) for weight in text_columns.values())
+        conditions, values = self._conditions(
+            site, company, posted_since, min_salary, is_remote, where, params
+        )
+        sql = (
+            f"SELECT {self.table}.*, bm25({self.fts_table}, {weights}) AS rank "
+            f"FROM {self.fts_table} JOIN {self.table} "
+            f"ON {self.table}.rowid = {self.fts_table}.rowid "
+            f"WHERE {self.fts_table} MATCH ?"
+        )
+        for condition in conditions:
+            sql += f" AND {condition}"
+        sql += f" ORDER BY rank LIMIT {int(limit)}"
+        return self.sql(sql, [query, *values])
+
+    def _conditions(
+        self, site, company, posted_since, min_salary, is_remote, where, params
+    ) -> tuple[list[str], list]:
+        conditions, values = [], []
+        if site is not None:
+            sites = [site] if isinstance(site, (str, Site)) else list(site)
+            sites = [s.value if isinstance(s, Site) else s for s in sites]
+            conditions.append(f"{self.table}.site IN ({', '.join('?' * len(sites))})")
+            values += sites
+        if company is not None:
+            conditions.append(f"{self.table}.company = ?")
+            values.append(company)
+        if posted_since is not None:
+            conditions.append(f"{self.table}.date_posted >= ?")
+            values.append(_sql_value(posted_since))
+        if min_salary is not None:
+            conditions.append(f"{self.table}.min_amount >= ?")
+            values.append(min_salary)
+        if is_remote is not None:
+            conditions.append(f"{self.table}.is_remote = ?")
+            values.append(int(is_remote))
+        if where:
+            conditions.append(f"({where})")
+            values += list(params)
+        return conditions, values
+
+    def sql(self, sql: str, params: Iterable = ()) -> pd.DataFrame:
+        """Runs any read query against the store"""
+        with self.lock:
+            return pd.read_sql_query(sql, self.conn, params=list(params))
+
+    def count(self) -> int:
+        with self.lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def search_jobs(
+    query: str, store: JobStore | str | Path = "jobs.db", **filters
+) -> pd.DataFrame:
+    """
+    Full text search over a job store, indexing it first if it has no index yet
+    :param filters: site, company, posted_since, min_salary, is_remote, where, limit
+    """
+    if isinstance(store, JobStore):
+        return store.search(query, **filters)
+    with JobStore(store) as job_store:
+        return job_store.search(query, **filters)
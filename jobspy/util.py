@@ -1,20 +1,43 @@
 from __future__ import annotations
 
+import json
 import logging
+import os
 import re
+import tempfile
+from datetime import date, datetime, time, timedelta
 from itertools import cycle
-from typing import Iterable
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, Tuple
 
 import numpy as np
+import pandas as pd
 import requests
 import tls_client
 import urllib3
 from markdownify import markdownify as md
-from requests.adapters import HTTPAdapter, Retry
 
-from jobspy.model import CompensationInterval, JobType, Site
+from jobspy.model import (
+    CompensationInterval,
+    Country,
+    JobPost,
+    JobType,
+    Location,
+    SalarySource,
+    Site,
+)
 from jobspy.user_agents import DEFAULT_USER_AGENTS
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
@@ -53,6 +76,26 @@ class RotatingProxySession:
             return {"http": proxy, "https": proxy}
         return {"http": f"http://{proxy}", "https": f"http://{proxy}"}
 
+    def rotate_proxy(self) -> str:
+        """
+        Switches to the next proxy of the cycle
+        :return: the proxy now in use, "direct" without one
+        """
+        if self.proxy_cycle:
+            next_proxy = next(self.proxy_cycle)
+            if next_proxy["http"] != "http://localhost":
+                self.proxies = next_proxy
+            else:
+                self.proxies = {}
+        return self.proxies.get("http", "direct") if self.proxies else "direct"
+
+    def send_with_policy(self, send):
+        """Sends through the proxy now in use, retried per the session's retry policy"""
+        proxy = self.rotate_proxy()
+        if self.retry_policy is None:
+            return send()
+        return self.retry_policy.send(self.site, proxy, send)
+
 
 class RotatingUserAgent:
     def __init__(self, user_agents: Iterable[str] | None = None):
@@ -74,64 +117,81 @@ class RequestsRotating(RotatingProxySession, RotatingUserAgent, requests.Session
         delay=1,
         clear_cookies=False,
         user_agents=None,
+        identity=None,
+        site: Site | None = None,
+        retry_policy=None,
     ):
+        if identity is not None:
+            proxies, user_agents = identity.proxy, identity.user_agent
         RotatingProxySession.__init__(self, proxies=proxies)
         RotatingUserAgent.__init__(self, user_agents=user_agents)
         requests.Session.__init__(self)
-        self.clear_cookies = clear_cookies
+        self.clear_cookies = clear_cookies and identity is None
         self.allow_redirects = True
-        self.setup_session(has_retry, delay)
-
-    def setup_session(self, has_retry, delay):
-        if has_retry:
-            retries = Retry(
-                total=3,
-                connect=3,
-                status=3,
-                status_forcelist=[500, 502, 503, 504, 429],
-                backoff_factor=delay,
-            )
-            adapter = HTTPAdapter(max_retries=retries)
-            self.mount("http://", adapter)
-            self.mount("https://", adapter)
+        self.site = site
+        self.retry_policy = retry_policy or default_retry_policy(has_retry, delay)
+        if identity is not None:
+            identity.apply(self)
 
     def request(self, method, url, **kwargs):
         if self.clear_cookies:
             self.cookies.clear()
 
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
         headers = kwargs.get("headers", {})
         headers["user-agent"] = self.get_user_agent()
         kwargs["headers"] = headers
-        return requests.Session.request(self, method, url, **kwargs)
+        return self.send_with_policy(
+            lambda: requests.Session.request(self, method, url, **kwargs)
+        )
 
 
 class TLSRotating(RotatingProxySession, RotatingUserAgent, tls_client.Session):
-    def __init__(self, proxies=None, user_agents=None):
+    def __init__(
+        self,
+        proxies=None,
+        user_agents=None,
+        identity=None,
+        site: Site | None = None,
+        retry_policy=None,
+    ):
+        client_identifier = "chrome_120"
+        if identity is not None:
+            proxies, user_agents = identity.proxy, identity.user_agent
+            client_identifier = identity.client_identifier
         RotatingProxySession.__init__(self, proxies=proxies)
         RotatingUserAgent.__init__(self, user_agents=user_agents)
-        tls_client.Session.__init__(self, random_tls_extension_order=True)
+        tls_client.Session.__init__(
+            self,
+            client_identifier=client_identifier,
+            random_tls_extension_order=True,
+        )
+        self.site = site
+        self.retry_policy = retry_policy
+        if identity is not None:
+            identity.apply(self)
 
     def execute_request(self, *args, **kwargs):
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
         headers = kwargs.get("headers", {})
         headers["user-agent"] = self.get_user_agent()
         kwargs["headers"] = headers
-        response = tls_client.Session.execute_request(self, *args, **kwargs)
+        response = self.send_with_policy(
+            lambda: tls_client.Session.execute_request(self, *args, **kwargs)
+        )
         response.ok = response.status_code in range(200, 400)
         return response
 
 
+def default_retry_policy(has_retry: bool, delay: float):
+    """
+    The retry policy of a session created without one, None for no retries
+    """
+    if not has_retry:
+        return None
+    from jobspy.retry import RetryPolicy
+
+    return RetryPolicy(backoff=delay, budget=None)
+
+
 def create_session(
     *,
     proxies: dict | str | None = None,
@@ -141,13 +201,26 @@ def create_session(
     delay: int = 1,
     clear_cookies: bool = False,
     user_agents: Iterable[str] | str | None = None,
+    identity=None,
+    site: Site | None = None,
+    retry_policy=None,
 ) -> requests.Session:
     """
     Creates a requests session with optional tls, proxy, and retry settings.
+    An identity pins the proxy, user agent, tls fingerprint and cookies instead
+    of rotating them per request. A retry policy replaces has_retry and delay and
+    feeds the circuit breaker of site.
     :return: A session object
     """
+    retry_policy = retry_policy or default_retry_policy(has_retry, delay)
     if is_tls:
-        session = TLSRotating(proxies=proxies, user_agents=user_agents)
+        session = TLSRotating(
+            proxies=proxies,
+            user_agents=user_agents,
+            identity=identity,
+            site=site,
+            retry_policy=retry_policy,
+        )
     else:
         session = RequestsRotating(
             proxies=proxies,
@@ -155,6 +228,9 @@ def create_session(
             delay=delay,
             clear_cookies=clear_cookies,
             user_agents=user_agents,
+            identity=identity,
+            site=site,
+            retry_policy=retry_policy,
         )
 
     if ca_cert:
@@ -182,6 +258,124 @@ def set_logger_level(verbose: int):
         raise ValueError(f"Invalid log level: {level_name}")
 
 
+def json_loads(data: str | bytes) -> Any:
+    """Decodes JSON with orjson when installed, else the stdlib json module"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def json_dumps(obj: Any) -> str:
+    """Encodes JSON with orjson when installed, else the stdlib json module"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, default=_json_default)
+
+
+def write_json_atomic(path: str | Path, obj: Any):
+    """
+    Writes obj as JSON to a temporary file next to path and renames it over
+    path, so readers in other processes never see a partial file
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w") as tmp:
+        tmp.write(json_dumps(obj))
+    os.replace(tmp_path, path)
+
+
+def json_backend() -> str:
+    """Name of the module behind json_loads / json_dumps"""
+    return "orjson" if orjson is not None else "json"
+
+
+def iter_json_values(
+    source: IO[bytes] | bytes, prefixes: Iterable[str]
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Incrementally decodes a JSON document, yielding (prefix, value) for every
+    value found at one of the prefixes as soon as it is complete. Prefixes use
+    ijson notation, e.g. "data.jobSearch.results.item" for each element of
+    data.jobSearch.results. Without ijson installed the whole document is
+    decoded first and the same values are yielded.
+    """
+    prefixes = set(prefixes)
+    if isinstance(source, (bytes, bytearray)):
+        if ijson is None:
+            yield from _iter_json_values_decoded(json_loads(source), prefixes)
+            return
+        from io import BytesIO
+
+        source = BytesIO(source)
+    if ijson is None:
+        yield from _iter_json_values_decoded(json_loads(source.read()), prefixes)
+        return
+
+    events = ijson.parse(source, use_float=True)
+    for prefix, event, value in events:
+        if prefix not in prefixes or event in ("map_key", "end_map", "end_array"):
+            continue
+        builder = ijson.ObjectBuilder()
+        builder.event(event, value)
+        depth = 1 if event in ("start_map", "start_array") else 0
+        while depth:
+            _, event, value = next(events)
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+        yield prefix, builder.value
+
+
+def split_json_stream(
+    source: IO[bytes] | bytes, items_prefix: str, cursor_prefix: str
+) -> Tuple[Iterator[Any], Any]:
+    """
+    Reads a paginated JSON response up to its next page cursor.
+    :return: iterator decoding the items lazily, the cursor
+    """
+    values = iter_json_values(source, [items_prefix, cursor_prefix])
+    buffered, cursor = [], None
+    for prefix, value in values:
+        if prefix == cursor_prefix:
+            cursor = value
+            break
+        buffered.append(value)
+
+    def items():
+        yield from buffered
+        for prefix, value in values:
+            if prefix == items_prefix:
+                yield value
+
+    return items(), cursor
+
+
+def _iter_json_values_decoded(
+    data: Any, prefixes: set[str], prefix: str = ""
+) -> Iterator[Tuple[str, Any]]:
+    if prefix in prefixes:
+        yield prefix, data
+        return
+    if isinstance(data, dict):
+        for key, value in data.items():
+            child = f"{prefix}.{key}" if prefix else key
+            if any(p == child or p.startswith(child + ".") for p in prefixes):
+                yield from _iter_json_values_decoded(value, prefixes, child)
+    elif isinstance(data, list):
+        child = f"{prefix}.item" if prefix else "item"
+        if any(p == child or p.startswith(child + ".") for p in prefixes):
+            for value in data:
+                yield from _iter_json_values_decoded(value, prefixes, child)
+
+
 def markdown_converter(description_html: str):
     if description_html is None:
         return None
@@ -189,6 +383,34 @@ def markdown_converter(description_html: str):
     return markdown.strip()
 
 
+def posted_cutoff(hours_old: int | None) -> datetime | None:
+    """
+    :return: the earliest posting time wanted for hours_old, None without a limit
+    """
+    if not hours_old:
+        return None
+    return datetime.now() - timedelta(hours=hours_old)
+
+
+def posted_before(
+    posted: datetime | date | int | None, cutoff: datetime | None
+) -> bool:
+    """
+    Whether a job was certainly posted before cutoff. A date counts as its last
+    moment, so day-precision dates are only dropped once the whole day is too old.
+    :param posted: posting time, date, or epoch milliseconds; None is never too old
+    """
+    if cutoff is None or posted is None:
+        return False
+    if isinstance(posted, (int, float)):
+        posted = datetime.fromtimestamp(posted / 1000)
+    elif not isinstance(posted, datetime):
+        posted = datetime.combine(posted, time.max)
+    elif posted.tzinfo is not None:
+        posted = posted.astimezone().replace(tzinfo=None)
+    return posted < cutoff
+
+
 def extract_emails_from_text(text: str) -> list[str] | None:
     if not text:
         return None
@@ -346,6 +568,75 @@ def convert_to_annual(job_data: dict):
     job_data["interval"] = "yearly"
 
 
+def job_to_row(
+    job: JobPost, site: str, country: Country, enforce_annual_salary: bool = False
+) -> dict:
+    """
+    Flattens a scraped job into the row scrape_jobs returns
+    :param site: value of the site the job was scraped from
+    :param country: Indeed country, salaries are only parsed out of US descriptions
+    :return: the job's fields plus the desired_order columns
+    """
+    job_data = job.model_dump()
+    job_data["site"] = site
+    job_data["company"] = job_data["company_name"]
+    job_data["job_type"] = (
+        ", ".join(job_type.value[0] for job_type in job_data["job_type"])
+        if job_data["job_type"]
+        else None
+    )
+    job_data["emails"] = ", ".join(job_data["emails"]) if job_data["emails"] else None
+    if job_data["location"]:
+        job_data["location"] = Location(**job_data["location"]).display_location()
+
+    # Handle compensation
+    compensation_obj = job_data.get("compensation")
+    if compensation_obj and isinstance(compensation_obj, dict):
+        job_data["interval"] = (
+            compensation_obj.get("interval").value
+            if compensation_obj.get("interval")
+            else None
+        )
+        job_data["min_amount"] = compensation_obj.get("min_amount")
+        job_data["max_amount"] = compensation_obj.get("max_amount")
+        job_data["currency"] = compensation_obj.get("currency", "USD")
+        job_data["salary_source"] = SalarySource.DIRECT_DATA.value
+        if enforce_annual_salary and (
+            job_data["interval"]
+            and job_data["interval"] != "yearly"
+            and job_data["min_amount"]
+            and job_data["max_amount"]
+        ):
+            convert_to_annual(job_data)
+    else:
+        if country == Country.USA:
+            (
+                job_data["interval"],
+                job_data["min_amount"],
+                job_data["max_amount"],
+                job_data["currency"],
+            ) = extract_salary(
+                job_data["description"],
+                enforce_annual_salary=enforce_annual_salary,
+            )
+            job_data["salary_source"] = SalarySource.DESCRIPTION.value
+
+    job_data["salary_source"] = (
+        job_data["salary_source"]
+        if "min_amount" in job_data and job_data["min_amount"]
+        else None
+    )
+
+    # naukri-specific fields
+    job_data["skills"] = ", ".join(job_data["skills"]) if job_data["skills"] else None
+    job_data["experience_range"] = job_data.get("experience_range")
+    job_data["company_rating"] = job_data.get("company_rating")
+    job_data["company_reviews_count"] = job_data.get("company_reviews_count")
+    job_data["vacancy_count"] = job_data.get("vacancy_count")
+    job_data["work_from_home_type"] = job_data.get("work_from_home_type")
+    return job_data
+
+
 desired_order = [
     "id",
     "site",
@@ -383,3 +674,57 @@ desired_order = [
     "vacancy_count",
     "work_from_home_type",
 ]
+
+# low-cardinality columns typed_frame stores as categories
+category_columns = [
+    "site",
+    "company",
+    "job_type",
+    "salary_source",
+    "interval",
+    "currency",
+    "job_level",
+    "listing_type",
+    "work_from_home_type",
+]
+nullable_types = {
+    "min_amount": "Float64",
+    "max_amount": "Float64",
+    "is_remote": "boolean",
+    "company_rating": "Float64",
+    "company_reviews_count": "Int64",
+    "vacancy_count": "Int64",
+}
+
+
+def typed_frame(
+    jobs_df: pd.DataFrame, dtype_backend: str = "numpy_nullable"
+) -> pd.DataFrame:
+    """
+    Gives the scrape_jobs columns compact types in place of object: categories for
+    the repeated strings, datetime64 for date_posted and nullable numbers
+    :param dtype_backend: "numpy_nullable", or "pyarrow" to also store the other
+        text columns as pyarrow strings
+    """
+    if dtype_backend not in ("numpy_nullable", "pyarrow"):
+        raise ValueError(
+            f"dtype_backend must be numpy_nullable or pyarrow, not {dtype_backend}"
+        )
+    jobs_df = jobs_df.copy()
+    for column in jobs_df.columns:
+        if column in category_columns:
+            jobs_df[column] = jobs_df[column].astype("category")
+        elif column in nullable_types:
+            jobs_df[column] = jobs_df[column].astype(nullable_types[column])
+        elif column == "date_posted":
+            # Indeed gives "%Y-%m-%d" strings, the other sites dates
+            jobs_df[column] = pd.to_datetime(jobs_df[column], errors="coerce")
+        elif dtype_backend == "pyarrow":
+            try:
+                jobs_df[column] = jobs_df[column].astype("string[pyarrow]")
+            except ImportError:
+                raise ImportError(
+                    'dtype_backend="pyarrow" needs pyarrow: '
+                    'pip install -U "python-jobspy[arrow]"'
+                )
+    return jobs_df
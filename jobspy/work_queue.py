@@ -0,0 +1,440 @@
+"""
+Spreads a batch of searches over worker processes and machines. Searches are
+split into one task per site, shard and page range on a shared queue, e.g.
+
+    python -m jobspy.work_queue enqueue searches.json --queue tasks.db
+    python -m jobspy.work_queue work --queue tasks.db --store jobs.db   # per worker
+
+Workers are stateless: they lease a task, run the site's Scraper.scrape and
+upsert the jobs into the store keyed by job id, so a task that is retried after
+a lost lease writes the same rows again instead of duplicating them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import pandas as pd
+from pydantic import BaseModel
+
+from jobspy import SCRAPER_MAPPING
+from jobspy.exception import ScrapeFailedException
+from jobspy.model import Country, JobFilter, JobType, ScraperInput, Site
+from jobspy.shard import plan_shards
+from jobspy.store import JobStore
+from jobspy.util import (
+    create_logger,
+    get_enum_from_value,
+    job_to_row,
+    json_dumps,
+    json_loads,
+    map_str_to_site,
+    set_logger_level,
+)
+
+log = create_logger("WorkQueue")
+
+# sites whose offset starts the search at that result, so page ranges can run apart
+page_sites = {Site.LINKEDIN}
+site_loggers = {
+    Site.LINKEDIN: "LinkedIn",
+    Site.INDEED: "Indeed",
+    Site.ZIP_RECRUITER: "ZipRecruiter",
+    Site.GLASSDOOR: "Glassdoor",
+    Site.GOOGLE: "Google",
+    Site.BAYT: "Bayt",
+    Site.NAUKRI: "Naukri",
+}
+
+
+class Task(BaseModel):
+    id: str
+    batch: str
+    site: Site
+    payload: dict
+    attempts: int = 0
+
+
+def dump_scraper_input(scraper_input: ScraperInput) -> dict:
+    """JSON-safe form of a ScraperInput, enums stored by name"""
+    data = scraper_input.model_dump(mode="json", exclude={"country", "job_type"})
+    data["country"] = scraper_input.country.name if scraper_input.country else None
+    data["job_type"] = scraper_input.job_type.name if scraper_input.job_type else None
+    return data
+
+
+def load_scraper_input(data: dict) -> ScraperInput:
+    data = dict(data)
+    if data.get("country"):
+        data["country"] = Country[data["country"]]
+    if data.get("job_type"):
+        data["job_type"] = JobType[data["job_type"]]
+    return ScraperInput(**data)
+
+
+def search_scraper_input(search: dict) -> ScraperInput:
+    """
+    Builds the ScraperInput of a search given as scrape_jobs parameters
+    """
+    search = dict(search)
+    site_name = search.pop("site_name", None)
+    if site_name is None:
+        sites = list(Site)
+    else:
+        site_name = [site_name] if isinstance(site_name, (str, Site)) else site_name
+        sites = [map_str_to_site(s) if isinstance(s, str) else s for s in site_name]
+    filters = search.get("filters")
+    if isinstance(filters, dict):
+        filters = JobFilter(**filters)
+    fields = {
+        name: value
+        for name, value in search.items()
+        if name in ScraperInput.model_fields and value is not None
+    }
+    fields.update(
+        site_type=sites,
+        country=Country.from_string(search.get("country_indeed", "usa")),
+        distance=search.get("distance", 50),
+        filters=filters,
+        is_remote=search.get("is_remote", False) or bool(filters and filters.is_remote),
+    )
+    if search.get("job_type"):
+        fields["job_type"] = get_enum_from_value(search["job_type"])
+    return ScraperInput(**fields)
+
+
+def plan_tasks(
+    search: dict, batch: str = "default", page_size: int = 100
+) -> list[Task]:
+    """
+    Splits a search into tasks, one per site and shard of shard_by, and for sites
+    in page_sites one per page_size results
+    :param search: scrape_jobs parameters, shard_by and shard_locations included
+    """
+    scraper_input = search_scraper_input(search)
+    if search.get("shard_by"):
+        shards = plan_shards(
+            scraper_input, search["shard_by"], search.get("shard_locations")
+        )
+        inputs = [(shard.site, shard.scraper_input) for shard in shards]
+    else:
+        inputs = [
+            (site, scraper_input.model_copy(update={"site_type": [site]}))
+            for site in scraper_input.site_type
+        ]
+    options = {"enforce_annual_salary": search.get("enforce_annual_salary", False)}
+
+    tasks = []
+    for site, site_input in inputs:
+        ranges = [site_input]
+        if site in page_sites and site_input.results_wanted > page_size:
+            ranges = [
+                site_input.model_copy(
+                    update={
+                        "offset": site_input.offset + start,
+                        "results_wanted": min(
+                            page_size, site_input.results_wanted - start
+                        ),
+                    }
+                )
+                for start in range(0, site_input.results_wanted, page_size)
+            ]
+        for task_input in ranges:
+            payload = {"input": dump_scraper_input(task_input), **options}
+            # the same search enqueued twice maps to the same task ids
+            digest = hashlib.sha1(json_dumps([batch, payload]).encode()).hexdigest()
+            tasks.append(Task(id=digest, batch=batch, site=site, payload=payload))
+    return tasks
+
+
+class TaskQueue(ABC):
+    """
+    Queue of scrape tasks shared by workers. A leased task is invisible to other
+    workers until its lease runs out, after which it is handed out again.
+    """
+
+    @abstractmethod
+    def put(self, tasks: list[Task]) -> int: ...
+
+    @abstractmethod
+    def lease(self, worker: str, lease_seconds: float = 600) -> Task | None: ...
+
+    @abstractmethod
+    def complete(self, task: Task, worker: str): ...
+
+    @abstractmethod
+    def fail(self, task: Task, worker: str, error: str): ...
+
+    @abstractmethod
+    def counts(self, batch: str | None = None) -> dict[str, int]: ...
+
+
+class SQLiteTaskQueue(TaskQueue):
+    """
+    TaskQueue in a SQLite file, for workers on one machine or a shared volume.
+    Failed tasks are retried with exponential backoff up to max_attempts.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = "tasks.db",
+        max_attempts: int = 3,
+        retry_backoff: float = 30,
+    ):
+        self.path = str(path)
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.conn = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self.lock = threading.Lock()
+        with self.lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS tasks ("
+                "id TEXT PRIMARY KEY, batch TEXT NOT NULL, site TEXT NOT NULL, "
+                "payload TEXT NOT NULL, status TEXT NOT NULL DEFAULT 'pending', "
+                "attempts INTEGER NOT NULL DEFAULT 0, available_at REAL NOT NULL, "
+                "worker TEXT, error TEXT)"
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS tasks_available "
+                "ON tasks (status, available_at)"
+            )
+
+    def put(self, tasks: list[Task]) -> int:
+        """
+        Adds tasks, skipping ids already queued
+        :return: number of new tasks
+        """
+        now = time.time()
+        rows = [
+            (task.id, task.batch, task.site.value, json_dumps(task.payload), now)
+            for task in tasks
+        ]
+        with self.lock:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO tasks (id, batch, site, payload, available_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            return self.conn.total_changes - before
+
+    def lease(self, worker: str, lease_seconds: float = 600) -> Task | None:
+        now = time.time()
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                # leases that ran out on their last attempt will not come back
+                self.conn.execute(
+                    "UPDATE tasks SET status = 'failed', error = 'lease expired' "
+                    "WHERE status = 'leased' AND available_at <= ? AND attempts >= ?",
+                    (now, self.max_attempts),
+                )
+                row = self.conn.execute(
+                    "SELECT id, batch, site, payload, attempts FROM tasks "
+                    "WHERE status IN ('pending', 'leased') AND available_at <= ? "
+                    "ORDER BY available_at LIMIT 1",
+                    (now,),
+                ).fetchone()
+                if row is not None:
+                    self.conn.execute(
+                        "UPDATE tasks SET status = 'leased', worker = ?, "
+                        "attempts = attempts + 1, available_at = ? WHERE id = ?",
+                        (worker, now + lease_seconds, row[0]),
+                    )
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        task_id, batch, site, payload, attempts = row
+        return Task(
+            id=task_id,
+            batch=batch,
+            site=Site(site),
+            payload=json_loads(payload),
+            attempts=attempts + 1,
+        )
+
+    def complete(self, task: Task, worker: str):
+        with self.lock:
+            self.conn.execute(
+                "UPDATE tasks SET status = 'done', error = NULL "
+                "WHERE id = ? AND worker = ? AND status = 'leased'",
+                (task.id, worker),
+            )
+
+    def fail(self, task: Task, worker: str, error: str):
+        retry = task.attempts < self.max_attempts
+        available_at = time.time() + self.retry_backoff * 2 ** (task.attempts - 1)
+        with self.lock:
+            self.conn.execute(
+                "UPDATE tasks SET status = ?, error = ?, available_at = ? "
+                "WHERE id = ? AND worker = ? AND status = 'leased'",
+                (
+                    "pending" if retry else "failed",
+                    error,
+                    available_at,
+                    task.id,
+                    worker,
+                ),
+            )
+
+    def counts(self, batch: str | None = None) -> dict[str, int]:
+        sql = "SELECT status, COUNT(*) FROM tasks"
+        params = ()
+        if batch is not None:
+            sql += " WHERE batch = ?"
+            params = (batch,)
+        with self.lock:
+            return dict(self.conn.execute(sql + " GROUP BY status", params).fetchall())
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+class ErrorLog(logging.Handler):
+    """Collects the errors a scraper logs for blocked or failed requests"""
+
+    def __init__(self):
+        super().__init__(logging.ERROR)
+        self.errors: list[str] = []
+
+    def emit(self, record: logging.LogRecord):
+        self.errors.append(record.getMessage())
+
+
+class Worker:
+    """
+    Leases tasks one at a time and writes their jobs to the sink. Proxies and the
+    other transport settings belong to the worker, not the task. Scrapers log
+    429s, bad statuses and proxy errors rather than raising, so a task whose
+    scraper logged errors and came back short of results_wanted counts as
+    failed and is retried; the jobs it did find are written either way.
+    """
+
+    def __init__(
+        self,
+        queue: TaskQueue,
+        sink: JobStore | str,
+        worker_id: str | None = None,
+        lease_seconds: float = 600,
+        **scraper_kwargs,
+    ):
+        """
+        :param scraper_kwargs: passed to each Scraper, e.g. proxies, ca_cert,
+            identity_pool, session_state, retry_policy
+        """
+        self.queue = queue
+        self.sink = JobStore(sink) if isinstance(sink, str) else sink
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_seconds = lease_seconds
+        self.scraper_kwargs = scraper_kwargs
+
+    def run_task(self, task: Task) -> int:
+        """
+        :return: number of jobs written to the sink
+        """
+        scraper_input = load_scraper_input(task.payload["input"])
+        scraper = SCRAPER_MAPPING[task.site](**self.scraper_kwargs)
+        error_log = ErrorLog()
+        site_log = create_logger(site_loggers[task.site])
+        site_log.addHandler(error_log)
+        try:
+            jobs = scraper.scrape(scraper_input).jobs
+        finally:
+            site_log.removeHandler(error_log)
+            scraper.close()
+        rows = [
+            job_to_row(
+                job,
+                task.site.value,
+                scraper_input.country,
+                task.payload.get("enforce_annual_salary", False),
+            )
+            for job in jobs
+        ]
+        written = self.sink.upsert(pd.DataFrame(rows))
+        if error_log.errors and len(jobs) < scraper_input.results_wanted:
+            raise ScrapeFailedException(
+                f"{len(jobs)} of {scraper_input.results_wanted} jobs after "
+                f"{len(error_log.errors)} errors, last: {error_log.errors[-1]}"
+            )
+        return written
+
+    def run(self, stop_when_empty: bool = True, poll: float = 5) -> int:
+        """
+        Works through the queue until it is empty, or forever
+        :return: number of tasks completed
+        """
+        completed = 0
+        while True:
+            task = self.queue.lease(self.worker_id, self.lease_seconds)
+            if task is None:
+                if stop_when_empty:
+                    return completed
+                time.sleep(poll)
+                continue
+            try:
+                written = self.run_task(task)
+            except Exception as e:
+                log.error(f"task {task.id[:8]} ({task.site.value}) failed: {e}")
+                self.queue.fail(task, self.worker_id, str(e))
+                continue
+            self.queue.complete(task, self.worker_id)
+            completed += 1
+            log.info(f"task {task.id[:8]} ({task.site.value}) wrote {written} jobs")
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m jobspy.work_queue", description="Distributed scraping"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    enqueue = commands.add_parser("enqueue", help="queue a JSON list of searches")
+    enqueue.add_argument("searches", help="JSON list of scrape_jobs parameters")
+    enqueue.add_argument("--batch", default="default")
+    enqueue.add_argument("--page-size", type=int, default=100)
+    work = commands.add_parser("work", help="run tasks from the queue")
+    work.add_argument("--store", default="jobs.db", help="SQLite job store")
+    work.add_argument("--proxies", nargs="+")
+    work.add_argument("--forever", action="store_true", help="keep polling")
+    status = commands.add_parser("status", help="count tasks by status")
+    status.add_argument("--batch")
+    for command in (enqueue, work, status):
+        command.add_argument("--queue", default="tasks.db", help="SQLite task queue")
+    parser.add_argument("--verbose", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    set_logger_level(args.verbose)
+    queue = SQLiteTaskQueue(args.queue)
+    if args.command == "enqueue":
+        searches = json_loads(Path(args.searches).read_text())
+        tasks = [
+            task
+            for search in searches
+            for task in plan_tasks(search, args.batch, args.page_size)
+        ]
+        log.info(f"queued {queue.put(tasks)} of {len(tasks)} tasks")
+    elif args.command == "work":
+        worker = Worker(queue, args.store, proxies=args.proxies)
+        worker.run(stop_when_empty=not args.forever)
+    else:
+        print(json_dumps(queue.counts(args.batch)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-import json
 import math
 import re
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 from datetime import datetime
 
 from bs4 import BeautifulSoup
 
+from jobspy.pagination import pipelined_pages
 from jobspy.ziprecruiter.constant import headers, get_cookie_data
 from jobspy.util import (
     extract_emails_from_text,
@@ -16,6 +17,9 @@ from jobspy.util import (
     markdown_converter,
     remove_attributes,
     create_logger,
+    json_loads,
+    posted_before,
+    posted_cutoff,
 )
 from jobspy.model import (
     JobPost,
@@ -32,27 +36,43 @@ from jobspy.ziprecruiter.util import get_job_type_enum, add_params
 
 log = create_logger("ZipRecruiter")
 
+# full job page results by (job id, description format), shared across scrapes
+detail_cache: OrderedDict = OrderedDict()
+detail_cache_lock = threading.Lock()
+detail_cache_size = 10000
+
 
 class ZipRecruiter(Scraper):
     base_url = "https://www.ziprecruiter.com"
     api_url = "https://api.ziprecruiter.com"
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        **kwargs,
     ):
         """
         Initializes ZipRecruiterScraper with the ZipRecruiter job search url
         """
-        super().__init__(Site.ZIP_RECRUITER, proxies=proxies)
+        super().__init__(Site.ZIP_RECRUITER, proxies=proxies, **kwargs)
 
         self.scraper_input = None
-        self.session = create_session(proxies=proxies, ca_cert=ca_cert)
+        self.session = create_session(
+            proxies=self.proxies,
+            ca_cert=ca_cert,
+            identity=self.identity,
+            site=self.site,
+            retry_policy=self.retry_policy,
+        )
         self.session.headers.update(headers)
+        self.cookies_from_store = False
         self._get_cookies()
 
         self.delay = 5
         self.jobs_per_page = 20
         self.seen_urls = set()
+        self.cutoff = None
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         """
@@ -61,35 +81,93 @@ class ZipRecruiter(Scraper):
         :return: JobResponse containing a list of jobs.
         """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
-        continue_token = None
+        self.cutoff = posted_cutoff(scraper_input.hours_old)
+        checkpoint = self.open_checkpoint(scraper_input)
+        page_state, _, job_list = checkpoint.start()
 
         max_pages = math.ceil(scraper_input.results_wanted / self.jobs_per_page)
-        for page in range(1, max_pages + 1):
-            if len(job_list) >= scraper_input.results_wanted:
-                break
+
+        def fetch_page(page_state: tuple[int, str | None]):
+            page, continue_token = page_state
             if page > 1:
                 time.sleep(self.delay)
             log.info(f"search page: {page} / {max_pages}")
             jobs_on_page, continue_token = self._find_jobs_in_page(
                 scraper_input, continue_token
             )
-            if jobs_on_page:
-                job_list.extend(jobs_on_page)
-            else:
-                break
-            if not continue_token:
-                break
-        return JobResponse(jobs=job_list[: scraper_input.results_wanted])
+            # filtered out jobs do not count, so keep following the token chain
+            more_pages = page < max_pages or scraper_input.filters is not None
+            next_state = (
+                (page + 1, continue_token) if continue_token and more_pages else None
+            )
+            return jobs_on_page, next_state
+
+        if max_pages < 1:
+            return JobResponse(jobs=job_list)
+        pages = pipelined_pages(
+            self.executor,
+            self.site,
+            fetch_page,
+            cursor=tuple(page_state) if page_state else (1, None),
+            should_prefetch=lambda jobs_on_page: len(job_list) + len(jobs_on_page)
+            < scraper_input.results_wanted,
+            with_cursor=True,
+        )
+        detail_futures = {}
+        # jobs of a resumed run were checkpointed before their details came in
+        for idx, job_post in enumerate(job_list):
+            if self._needs_details(job_post):
+                detail_futures[idx] = self.executor.submit(
+                    self.site, self._get_descr_cached, job_post
+                )
+        try:
+            for jobs_on_page, next_state in pages:
+                new_jobs = self._process_jobs_page(jobs_on_page)
+                new_jobs = new_jobs[: scraper_input.results_wanted - len(job_list)]
+                for job_post in new_jobs:
+                    if self._needs_details(job_post):
+                        detail_futures[len(job_list)] = self.executor.submit(
+                            self.site, self._get_descr_cached, job_post
+                        )
+                    job_list.append(job_post)
+                checkpoint.save(next_state, job_list)
+                if len(job_list) >= scraper_input.results_wanted:
+                    break
+                if self.on_page is not None:
+                    # on_page sees each job once, so it gets the page with its details
+                    self._apply_details(job_list, detail_futures)
+                if self.page_done(job_list):
+                    break
+        finally:
+            pages.close()
+
+        self._apply_details(job_list, detail_futures)
+        checkpoint.finish()
+        return JobResponse(jobs=job_list)
+
+    @staticmethod
+    def _apply_details(job_list: list[JobPost], detail_futures: dict):
+        """
+        Waits for the pending job page fetches and updates their jobs in job_list
+        """
+        for idx, future in detail_futures.items():
+            description_full, job_url_direct = future.result()
+            job_list[idx] = job_list[idx].model_copy(
+                update={
+                    "description": description_full or job_list[idx].description,
+                    "job_url_direct": job_url_direct,
+                }
+            )
+        detail_futures.clear()
 
     def _find_jobs_in_page(
         self, scraper_input: ScraperInput, continue_token: str | None = None
-    ) -> tuple[list[JobPost], str | None]:
+    ) -> tuple[list[dict], str | None]:
         """
-        Scrapes a page of ZipRecruiter for jobs with scraper_input criteria
+        Fetches a page of ZipRecruiter for jobs with scraper_input criteria
         :param scraper_input:
         :param continue_token:
-        :return: jobs found on page
+        :return: raw jobs found on page, next page token
         """
         jobs_list = []
         params = add_params(scraper_input)
@@ -97,6 +175,8 @@ class ZipRecruiter(Scraper):
             params["continue_from"] = continue_token
         try:
             res = self.session.get(f"{self.api_url}/jobs-app/jobs", params=params)
+            if res.status_code in (401, 403) and self._refresh_cookies():
+                res = self.session.get(f"{self.api_url}/jobs-app/jobs", params=params)
             if res.status_code not in range(200, 400):
                 if res.status_code == 429:
                     err = "429 Response - Blocked by ZipRecruiter for too many requests"
@@ -112,14 +192,44 @@ class ZipRecruiter(Scraper):
                 log.error(f"Indeed: {str(e)}")
             return jobs_list, ""
 
-        res_data = res.json()
+        res_data = json_loads(res.content)
         jobs_list = res_data.get("jobs", [])
         next_continue_token = res_data.get("continue", None)
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            job_results = [executor.submit(self._process_job, job) for job in jobs_list]
+        return jobs_list, next_continue_token
+
+    def _process_jobs_page(self, jobs_list: list[dict]) -> list[JobPost]:
+        """
+        Processes the jobs of a page from the API response alone
+        """
+        return list(filter(None, (self._process_job(job) for job in jobs_list)))
 
-        job_list = list(filter(None, (result.result() for result in job_results)))
-        return job_list, next_continue_token
+    def _needs_details(self, job_post: JobPost) -> bool:
+        """
+        Whether the full job page should be fetched for the job per zip_fetch_details
+        """
+        fetch_details = self.scraper_input.zip_fetch_details
+        if fetch_details == "missing":
+            return not job_post.description
+        return fetch_details == "always"
+
+    def _get_descr_cached(self, job_post: JobPost) -> tuple[str | None, str | None]:
+        """
+        Fetches the full description and direct url of the job page, reusing
+        earlier results for the same listing key
+        """
+        cache_key = (job_post.id, self.scraper_input.description_format)
+        with detail_cache_lock:
+            if cache_key in detail_cache:
+                detail_cache.move_to_end(cache_key)
+                return detail_cache[cache_key]
+        self.executor.throttle(self.site)
+        details = self._get_descr(job_post.job_url)
+        if details[0]:
+            with detail_cache_lock:
+                detail_cache[cache_key] = details
+                if len(detail_cache) > detail_cache_size:
+                    detail_cache.popitem(last=False)
+        return details
 
     def _process_job(self, job: dict) -> JobPost | None:
         """
@@ -130,6 +240,9 @@ class ZipRecruiter(Scraper):
         if job_url in self.seen_urls:
             return
         self.seen_urls.add(job_url)
+        posted_time = datetime.fromisoformat(job["posted_time"].replace("Z", "+00:00"))
+        if posted_before(posted_time, self.cutoff):
+            return
 
         description = job.get("job_description", "").strip()
         listing_type = job.get("buyer_type", "")
@@ -148,15 +261,14 @@ class ZipRecruiter(Scraper):
         job_type = get_job_type_enum(
             job.get("employment_type", "").replace("_", "").lower()
         )
-        date_posted = datetime.fromisoformat(job["posted_time"].rstrip("Z")).date()
+        date_posted = posted_time.date()
         comp_interval = job.get("compensation_interval")
         comp_interval = "yearly" if comp_interval == "annual" else comp_interval
         comp_min = int(job["compensation_min"]) if "compensation_min" in job else None
         comp_max = int(job["compensation_max"]) if "compensation_max" in job else None
         comp_currency = job.get("compensation_currency")
-        description_full, job_url_direct = self._get_descr(job_url)
 
-        return JobPost(
+        job_post = JobPost(
             id=f'zr-{job["listing_key"]}',
             title=title,
             company_name=company,
@@ -170,11 +282,14 @@ class ZipRecruiter(Scraper):
             ),
             date_posted=date_posted,
             job_url=job_url,
-            description=description_full if description_full else description,
+            description=description,
             emails=extract_emails_from_text(description) if description else None,
-            job_url_direct=job_url_direct,
             listing_type=listing_type,
         )
+        filters = self.scraper_input.filters
+        if filters and not filters.accepts_job(job_post):
+            return None
+        return job_post
 
     def _get_descr(self, job_url):
         res = self.session.get(job_url, allow_redirects=True)
@@ -198,7 +313,7 @@ class ZipRecruiter(Scraper):
             try:
                 script_tag = soup.find("script", type="application/json")
                 if script_tag:
-                    job_json = json.loads(script_tag.string)
+                    job_json = json_loads(script_tag.string)
                     job_url_val = job_json["model"].get("saveJobURL", "")
                     m = re.search(r"job_url=(.+)", job_url_val)
                     if m:
@@ -212,8 +327,36 @@ class ZipRecruiter(Scraper):
         return description_full, job_url_direct
 
     def _get_cookies(self):
+        """
+        Reuses stored session cookies for this proxy, otherwise sends a session
+        event to the API with device properties.
+        """
+        if self.session_state:
+            stored = self.session_state.restore(self.site, self.proxies, self.session)
+            if stored is not None:
+                self.cookies_from_store = True
+                return
+        self._send_session_event()
+
+    def _send_session_event(self):
         """
         Sends a session event to the API with device properties.
         """
         url = f"{self.api_url}/jobs-app/event"
         self.session.post(url, data=get_cookie_data)
+        if self.session_state:
+            self.session_state.persist(self.site, self.proxies, self.session)
+
+    def _refresh_cookies(self) -> bool:
+        """
+        Replaces stored cookies rejected by the API with a new session event
+        :return: whether the cookies were refreshed and the request is worth retrying
+        """
+        if not self.cookies_from_store:
+            return False
+        self.cookies_from_store = False
+        log.info("stored session cookies rejected, sending a new session event")
+        self.session_state.invalidate(self.site, self.proxies)
+        self.session.cookies.clear()
+        self._send_session_event()
+        return True
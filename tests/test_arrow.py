@@ -0,0 +1,68 @@
+from datetime import date
+
+import pytest
+
+import jobspy
+from jobspy.arrow import arrow_row, rows_to_table, write_dataset
+from jobspy.model import Country, JobPost, Site
+from jobspy.sink import PageSink
+from jobspy.util import desired_order, job_to_row, json_loads
+
+
+def job(job_id, posted=date(2024, 5, 1)):
+    return JobPost(
+        id=job_id,
+        title="Python Developer",
+        company_name="Acme",
+        job_url=f"https://example.com/{job_id}",
+        location=None,
+        date_posted=posted,
+    )
+
+
+def test_arrow_row_parses_date_strings():
+    row = job_to_row(job("in-1"), "indeed", Country.USA)
+    row["date_posted"] = "2024-05-02"
+    row = arrow_row(row)
+    assert list(row) == desired_order
+    assert row["date_posted"] == date(2024, 5, 2)
+    assert arrow_row({"date_posted": "last week"})["date_posted"] is None
+
+
+def test_rows_to_table_schema_and_order():
+    pytest.importorskip("pyarrow")
+    rows = [
+        job_to_row(job("li-1", date(2024, 5, 1)), "linkedin", Country.USA),
+        job_to_row(job("in-1", date(2024, 5, 1)), "indeed", Country.USA),
+        job_to_row(job("in-2", date(2024, 5, 3)), "indeed", Country.USA),
+    ]
+    table = rows_to_table(rows, {"retries": 0})
+    assert table.column_names == desired_order
+    assert table.column("id").to_pylist() == ["in-2", "in-1", "li-1"]
+    assert str(table.schema.field("date_posted").type) == "date32[day]"
+    assert json_loads(table.schema.metadata[b"jobspy"]) == {"retries": 0}
+
+
+def test_write_dataset_appends_a_row_group_per_page(tmp_path, monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    def fake_scrape_jobs(on_page, **params):
+        sink = PageSink(on_page, Country.USA, params["results_wanted"])
+        sink(Site.INDEED, [job("in-1"), job("in-2", date(2024, 5, 2))])
+        sink(Site.INDEED, [job("in-3")])
+        sink(Site.LINKEDIN, [job("li-1")])
+
+    monkeypatch.setattr(jobspy, "scrape_jobs", fake_scrape_jobs)
+    files = write_dataset(tmp_path / "jobs", results_wanted=10)
+
+    assert len(files) == 3
+    indeed = tmp_path / "jobs" / "site=indeed" / "date_posted=2024-05-01"
+    (path,) = indeed.iterdir()
+    assert pq.ParquetFile(path).num_row_groups == 2
+
+    dataset = ds.dataset(tmp_path / "jobs", partitioning="hive")
+    table = dataset.to_table()
+    assert sorted(table.column("id").to_pylist()) == ["in-1", "in-2", "in-3", "li-1"]
+    assert isinstance(table, pa.Table)
@@ -0,0 +1,19 @@
+from jobspy.budget import ResultsBudget, trim_to_budget
+
+
+def test_budget_is_met_by_combined_reports():
+    budget = ResultsBudget(10)
+    assert not budget.report(1, 4)
+    assert not budget.report(2, 5)
+    assert not budget.report(1, 4)
+    assert budget.report(2, 6)
+    assert budget.jobs_found == 10
+
+
+def test_trim_follows_site_order():
+    jobs = {"indeed": [1, 2, 3], "linkedin": [4, 5], "google": [6]}
+    assert trim_to_budget(jobs, 4, ["linkedin"]) == {
+        "linkedin": [4, 5],
+        "indeed": [1, 2],
+        "google": [],
+    }
@@ -0,0 +1,89 @@
+from datetime import date
+
+import pytest
+
+from jobspy.checkpoint import CheckpointStore
+from jobspy.indeed import Indeed
+from jobspy.model import (
+    Compensation,
+    CompensationInterval,
+    Country,
+    JobPost,
+    JobType,
+    Location,
+    ScraperInput,
+    Site,
+)
+
+# five pages of ten jobs chained by cursors c1..c4
+pages = {None: ("p0", "c1"), "c1": ("p1", "c2"), "c2": ("p2", "c3")}
+pages.update({"c3": ("p3", "c4"), "c4": ("p4", None)})
+
+
+def job(page, i):
+    return JobPost(
+        id=f"in-{page}-{i}",
+        title="Python Developer",
+        company_name="Acme",
+        job_url=f"https://example.com/{page}/{i}",
+        location=Location(city="Austin", country=Country.USA),
+        date_posted=date(2024, 5, 1),
+        job_type=[JobType.FULL_TIME],
+        compensation=Compensation(
+            interval=CompensationInterval.YEARLY, min_amount=1, max_amount=2
+        ),
+    )
+
+
+def fake_indeed(store, fetched, fail_at="never"):
+    scraper = Indeed(checkpoints=store)
+    scraper.jobs_per_page = 10
+
+    def scrape_page(cursor):
+        if cursor == fail_at:
+            raise ConnectionError("blocked")
+        fetched.append(cursor)
+        return pages[cursor]
+
+    scraper._scrape_page = scrape_page
+    scraper._process_page = lambda page: [job(page, i) for i in range(10)]
+    return scraper
+
+
+def scraper_input(**fields):
+    return ScraperInput(site_type=[Site.INDEED], search_term="python", **fields)
+
+
+def test_crashed_run_resumes_with_its_jobs(tmp_path):
+    store = CheckpointStore(tmp_path / "checkpoints.db")
+    fetched = []
+    crashing = fake_indeed(store, fetched, fail_at="c3")
+    with pytest.raises(ConnectionError):
+        crashing.scrape(scraper_input(results_wanted=45))
+    assert fetched == [None, "c1", "c2"]
+
+    fetched.clear()
+    jobs = fake_indeed(store, fetched).scrape(scraper_input(results_wanted=45)).jobs
+    assert fetched == ["c3", "c4"]
+    assert [j.id for j in jobs] == [f"in-p{i // 10}-{i % 10}" for i in range(45)]
+    assert jobs[0] == job("p0", 0)
+
+    # a finished run starts over
+    fetched.clear()
+    fake_indeed(store, fetched).scrape(scraper_input(results_wanted=5))
+    assert fetched == [None]
+
+
+def test_later_offsets_start_from_cached_cursor(tmp_path):
+    store = CheckpointStore(tmp_path / "checkpoints.db")
+    fetched = []
+    fake_indeed(store, fetched).scrape(scraper_input(results_wanted=35))
+
+    fetched.clear()
+    jobs = (
+        fake_indeed(store, fetched)
+        .scrape(scraper_input(results_wanted=10, offset=25))
+        .jobs
+    )
+    assert fetched == ["c2", "c3"]
+    assert [j.id for j in jobs] == [f"in-p{i // 10}-{i % 10}" for i in range(25, 35)]
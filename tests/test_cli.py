@@ -0,0 +1,106 @@
+import functools
+import json
+from datetime import date
+
+import jobspy.cli as cli
+from jobspy.model import Country, JobPost, ScraperInput, Site
+from jobspy.sink import PageSink
+
+
+def job(job_id):
+    return JobPost(
+        id=job_id,
+        title="Python Developer",
+        company_name="Acme",
+        job_url=f"https://example.com/{job_id}",
+        location=None,
+        date_posted=date(2024, 5, 1),
+    )
+
+
+def test_sink_skips_repeats_and_stops_at_results_wanted():
+    pages = []
+    sink = PageSink(lambda site, rows: pages.append(rows), Country.USA, 3)
+    sink(Site.INDEED, [job("in-1"), job("in-2")])
+    sink(Site.INDEED, [job("in-1"), job("in-2"), job("in-3"), job("in-4")])
+    sink(Site.INDEED, [job("in-5")])
+    assert [[row["id"] for row in rows] for rows in pages] == [
+        ["in-1", "in-2"],
+        ["in-3"],
+    ]
+    assert pages[0][0]["site"] == "indeed"
+    assert list(pages[0][0]) == cli.desired_order
+
+
+def test_cli_maps_flags_and_streams_ndjson(monkeypatch, capsys):
+    calls = []
+
+    # keeps the scrape_jobs signature the flags are built from
+    @functools.wraps(cli.scrape_jobs)
+    def fake_scrape_jobs(on_page, **params):
+        calls.append(params)
+        sink = PageSink(on_page, Country.USA, params["results_wanted"])
+        sink(Site.INDEED, [job("in-1")])
+        sink(Site.INDEED, [job("in-2")])
+
+    monkeypatch.setattr(cli, "scrape_jobs", fake_scrape_jobs)
+    cli.main(
+        [
+            "--site-name", "indeed", "linkedin",
+            "--search-term", "python",
+            "--results-wanted", "5",
+            "--is-remote",
+            "--filters", '{"min_salary": 100000}',
+        ]
+    )  # fmt: skip
+    assert calls == [
+        {
+            "site_name": ["indeed", "linkedin"],
+            "search_term": "python",
+            "results_wanted": 5,
+            "is_remote": True,
+            "filters": {"min_salary": 100000},
+        }
+    ]
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["in-1", "in-2"]
+    assert json.loads(lines[0])["date_posted"] == "2024-05-01"
+
+
+def test_streamed_zip_recruiter_rows_have_job_page_details(monkeypatch):
+    from jobspy.ziprecruiter import ZipRecruiter
+
+    def raw_job(key):
+        return {
+            "listing_key": key,
+            "name": "Python Developer",
+            "posted_time": "2024-05-01T00:00:00Z",
+            "job_description": "short",
+        }
+
+    tokens = {None: ([raw_job("stream-1")], "t1"), "t1": ([raw_job("stream-2")], None)}
+    monkeypatch.setattr(ZipRecruiter, "_get_cookies", lambda self: None)
+    monkeypatch.setattr(
+        ZipRecruiter,
+        "_find_jobs_in_page",
+        lambda self, scraper_input, token=None: tokens[token],
+    )
+    monkeypatch.setattr(
+        ZipRecruiter,
+        "_get_descr",
+        lambda self, job_url: ("FULL DESCRIPTION", "https://direct"),
+    )
+    pages = []
+    sink = PageSink(lambda site, rows: pages.append(rows), Country.USA, 40)
+    scraper = ZipRecruiter(on_page=sink)
+    scraper.delay = 0
+    scraper_input = ScraperInput(
+        site_type=[Site.ZIP_RECRUITER], search_term="python", results_wanted=40
+    )
+    scraped = scraper.scrape(scraper_input)
+    sink(Site.ZIP_RECRUITER, scraped.jobs)
+
+    rows = [row for page in pages for row in page]
+    assert [row["id"] for row in rows] == ["zr-stream-1", "zr-stream-2"]
+    assert all(row["description"] == "FULL DESCRIPTION" for row in rows)
+    assert all(row["job_url_direct"] == "https://direct" for row in rows)
@@ -0,0 +1,51 @@
+import threading
+import time
+
+from jobspy.executor import ScrapeExecutor
+from jobspy.model import Site
+
+
+def test_detail_quota_bounds_in_flight_tasks():
+    executor = ScrapeExecutor(site_workers=2, detail_workers=8, detail_quota=2)
+    lock = threading.Lock()
+    running = peak = 0
+
+    def task(i):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return i
+
+    futures = executor.map(Site.GLASSDOOR, task, range(10))
+    assert [f.result() for f in futures] == list(range(10))
+    assert peak <= 2
+
+    metrics = executor.metrics()
+    assert metrics["detail_submitted"]["glassdoor"] == 10
+    assert metrics["detail_threads"] <= 8
+    executor.shutdown()
+
+
+def test_fanout_sites_are_rate_limited_by_default():
+    executor = ScrapeExecutor(requests_per_second={Site.LINKEDIN: 0.5})
+    for site in (Site.LINKEDIN, Site.NAUKRI, Site.INDEED):
+        executor.throttle(site)
+    limiters = executor._limiters
+    assert limiters[Site.LINKEDIN].interval == 2
+    assert limiters[Site.NAUKRI].interval == 1
+    assert limiters[Site.INDEED].interval == 0
+    executor.shutdown()
+
+
+def test_default_detail_quota_keeps_per_page_concurrency():
+    quota = ScrapeExecutor().metrics()["detail_quota"]
+    assert quota["glassdoor"] == 30
+    assert quota["zip_recruiter"] == 20
+    assert quota["indeed"] == 16
+    capped = ScrapeExecutor(detail_workers=8, detail_quota={Site.INDEED: 4})
+    assert capped.quota_for(Site.INDEED) == 4
+    assert capped.quota_for(Site.GLASSDOOR) == 8
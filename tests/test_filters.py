@@ -0,0 +1,76 @@
+from jobspy.linkedin.util import salary_bucket
+from jobspy.model import Compensation, CompensationInterval, JobFilter, JobPost
+
+
+def test_filter_checks_only_known_fields():
+    filters = JobFilter(
+        min_salary=100000,
+        exclude_companies=["Acme"],
+        title_keywords=["python"],
+        exclude_title_keywords=["senior"],
+        is_remote=True,
+    )
+    assert filters.accepts(title="Python Developer")
+    assert not filters.accepts(title="Java Developer")
+    assert not filters.accepts(title="Senior Python Developer")
+    assert not filters.accepts(company_name="acme")
+    assert filters.accepts(compensation=Compensation())
+    assert not JobFilter(min_salary=1, include_unknown_salary=False).accepts(
+        compensation=Compensation()
+    )
+
+    hourly = Compensation(interval=CompensationInterval.HOURLY, max_amount=40)
+    assert not filters.accepts(compensation=hourly)
+    hourly = Compensation(interval=CompensationInterval.HOURLY, max_amount=60)
+    assert filters.accepts(compensation=hourly)
+
+    job = JobPost(
+        title="Python Engineer",
+        company_name="Other",
+        job_url="https://example.com",
+        location=None,
+        is_remote=False,
+    )
+    assert not filters.accepts_job(job)
+    assert filters.accepts_job(job.model_copy(update={"is_remote": True}))
+
+
+def test_linkedin_salary_bucket_rounds_down():
+    assert salary_bucket(30000) is None
+    assert salary_bucket(40000) == 1
+    assert salary_bucket(119999) == 4
+    assert salary_bucket(500000) == 9
+
+
+def test_indeed_applies_is_remote_and_checks_each_job_once(monkeypatch):
+    from jobspy.indeed import Indeed
+    from jobspy.model import ScraperInput, Site
+
+    def raw_job(key, location):
+        job = {
+            "key": key,
+            "title": "Python Developer",
+            "employer": None,
+            "compensation": {"baseSalary": None, "estimated": None},
+            "description": {"html": "Build pipelines"},
+            "attributes": [],
+            "datePublished": 1714521600000,
+            "location": {"city": None, "formatted": {"long": location}},
+            "recruit": None,
+        }
+        return {"job": job}
+
+    checks = []
+    passes_filters = Indeed._passes_filters
+    monkeypatch.setattr(
+        Indeed,
+        "_passes_filters",
+        lambda self, job: checks.append(job["key"]) or passes_filters(self, job),
+    )
+    scraper = Indeed()
+    scraper.scraper_input = ScraperInput(
+        site_type=[Site.INDEED], filters=JobFilter(is_remote=False)
+    )
+    jobs = scraper._process_page([raw_job("a", "Remote"), raw_job("b", "Austin, TX")])
+    assert [job.id for job in jobs] == ["in-b"]
+    assert checks == ["a", "b"]
@@ -0,0 +1,20 @@
+import json
+
+from jobspy.google.util import find_job_info_in_text, find_job_info_initial_page
+
+job_info = ['Engineer [NYC] "remote"', "Acme", "New York, NY", [["https://x"]]]
+
+
+def test_initial_page_slices_job_info_with_brackets_in_strings():
+    html = '<script>x={"520084652":' + json.dumps(job_info) + "}]]]]];</script>"
+    assert find_job_info_initial_page(html) == [job_info]
+
+
+def test_unterminated_anchor_is_ignored():
+    html = '"520084652":[["a", ] ' * 50
+    assert find_job_info_initial_page(html) == []
+
+
+def test_find_job_info_in_text():
+    job_data = json.dumps([[[{"other": [1], "520084652": job_info}]]])
+    assert find_job_info_in_text(job_data) == job_info
@@ -0,0 +1,23 @@
+from jobspy.identity import IdentityPool
+from jobspy.model import Site
+from jobspy.util import create_session
+
+firefox = "Mozilla/5.0 (X11; Linux x86_64; rv:120.0) Gecko/20100101 Firefox/120.0"
+
+
+def test_released_identity_is_reused_with_its_cookies():
+    pool = IdentityPool(proxies=["p1:80", "p2:80"], user_agents=[firefox])
+    identity = pool.lease(Site.LINKEDIN)
+    other = pool.lease(Site.LINKEDIN)
+    assert identity.proxy != other.proxy
+    assert identity.client_identifier == "firefox_120"
+
+    session = create_session(is_tls=False, clear_cookies=True, identity=identity)
+    assert not session.clear_cookies
+    assert session.get_user_agent() == session.get_user_agent() == firefox
+    session.cookies.set("li", "1")
+    pool.release(Site.LINKEDIN, identity, session)
+
+    assert pool.lease(Site.INDEED) is not identity
+    assert pool.lease(Site.LINKEDIN) is identity
+    assert create_session(is_tls=False, identity=identity).cookies.get("li") == "1"
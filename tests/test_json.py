@@ -0,0 +1,36 @@
+import json
+
+import pytest
+
+import jobspy.util as util
+from jobspy.util import iter_json_values, split_json_stream
+
+payload = json.dumps(
+    {
+        "data": {
+            "jobSearch": {
+                "pageInfo": {"nextCursor": "next"},
+                "results": [{"job": {"key": "a"}}, {"job": {"key": "b", "pay": 1.5}}],
+            }
+        }
+    }
+).encode()
+
+
+@pytest.mark.parametrize("use_ijson", [True, False])
+def test_split_json_stream_reads_cursor_before_items(monkeypatch, use_ijson):
+    if not use_ijson:
+        monkeypatch.setattr(util, "ijson", None)
+    elif util.ijson is None:
+        pytest.skip("ijson not installed")
+    items, cursor = split_json_stream(
+        payload, "data.jobSearch.results.item", "data.jobSearch.pageInfo.nextCursor"
+    )
+    assert cursor == "next"
+    assert [item["job"]["key"] for item in items] == ["a", "b"]
+
+
+def test_iter_json_values_top_level_array():
+    data = json.dumps([{"list": [{"id": 1}, {"id": 2}]}]).encode()
+    values = list(iter_json_values(data, ["item.list.item"]))
+    assert values == [("item.list.item", {"id": 1}), ("item.list.item", {"id": 2})]
@@ -0,0 +1,94 @@
+from datetime import date
+
+import pandas as pd
+
+import jobspy
+from jobspy.memory import MemoryBound
+from jobspy.model import Country, JobPost, JobResponse, Location, Scraper, Site
+from jobspy.store import JobStore
+
+
+def job(i, description="Build data pipelines in Python"):
+    return JobPost(
+        id=f"in-{i}",
+        title="Python Developer",
+        company_name="Acme",
+        job_url=f"https://example.com/{i}",
+        location=Location(city="Austin", country=Country.USA),
+        date_posted=date(2024, 5, 1),
+        description=description,
+    )
+
+
+def test_intern_shares_identical_descriptions():
+    memory = MemoryBound()
+    # equal but distinct string objects
+    jobs = [job(i, " ".join(["Build", "data", "pipelines"])) for i in range(3)]
+    memory.intern_jobs(jobs)
+    assert jobs[0].description is jobs[1].description is jobs[2].description
+    assert memory.report()["descriptions"] == 3
+    assert memory.report()["unique_descriptions"] == 1
+
+
+def test_compressed_descriptions_are_restored_in_the_frame():
+    memory = MemoryBound(compress=True)
+    memory.add("indeed", [job(1), job(2), job(3, description=None)], Country.USA)
+    assert all(isinstance(value, bytes) for value in memory.descriptions.values())
+
+    frame = memory.frame()
+    assert list(frame["id"]) == ["in-1", "in-2", "in-3"]
+    assert frame["description"][0] == "Build data pipelines in Python"
+    assert frame["description"][1] == frame["description"][0]
+    assert pd.isna(frame["description"][2])
+    assert frame["site"][0] == "indeed"
+
+
+def test_spills_rows_past_the_limit(tmp_path, monkeypatch):
+    written = {}
+    monkeypatch.setattr(
+        pd.DataFrame,
+        "to_parquet",
+        lambda frame, path, index: written.setdefault(path, frame),
+    )
+    memory = MemoryBound(limit_mb=0.001, spill_dir=tmp_path / "spill", compress=True)
+    memory.add("indeed", [job(1), job(2)], Country.USA)
+    memory.add("indeed", [job(3)], Country.USA)
+
+    assert memory.rows == [] and memory.descriptions == {}
+    spilled = list(written.values())
+    assert [list(frame["id"]) for frame in spilled] == [["in-1", "in-2"], ["in-3"]]
+    assert spilled[1]["description"][0] == "Build data pipelines in Python"
+    report = memory.report()
+    assert report["rows_spilled"] == 3
+    assert report["spill_files"] == [str(path) for path in written]
+
+
+class ManyJobs(Scraper):
+    def __init__(self, proxies=None, ca_cert=None, **kwargs):
+        super().__init__(Site.INDEED, proxies=proxies, ca_cert=ca_cert, **kwargs)
+
+    def scrape(self, scraper_input):
+        return JobResponse(jobs=[job(i) for i in range(5)])
+
+
+def test_spilled_rows_reach_the_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(pd.DataFrame, "to_parquet", lambda frame, path, index: None)
+    monkeypatch.setitem(jobspy.SCRAPER_MAPPING, Site.INDEED, ManyJobs)
+    store = str(tmp_path / "jobs.db")
+    jobs = jobspy.scrape_jobs(
+        site_name="indeed",
+        memory=MemoryBound(limit_mb=0.001, spill_dir=tmp_path / "spill"),
+        store=store,
+    )
+    assert jobs.empty
+    assert jobs.attrs["memory"]["rows_spilled"] == 5
+    with JobStore(store) as stored:
+        assert stored.count() == 5
+        assert set(stored.query()["description"]) == {"Build data pipelines in Python"}
+
+
+def test_over_the_limit_without_spill_dir_keeps_rows():
+    memory = MemoryBound(limit_mb=0.001)
+    memory.add("indeed", [job(1)], Country.USA)
+    assert memory.warned
+    assert len(memory.frame()) == 1
@@ -0,0 +1,47 @@
+from jobspy.executor import ScrapeExecutor
+from jobspy.model import Site
+from jobspy.pagination import fan_out_pages, pipelined_pages
+
+
+def test_pipelined_pages_follows_cursor_and_stops_prefetching():
+    executor = ScrapeExecutor(site_workers=1, detail_workers=4)
+    fetched = []
+
+    def fetch_page(cursor):
+        fetched.append(cursor)
+        return [cursor] * 3, cursor + 1 if cursor < 5 else None
+
+    collected = []
+    pages = pipelined_pages(
+        executor,
+        Site.INDEED,
+        fetch_page,
+        cursor=1,
+        should_prefetch=lambda page: len(collected) + len(page) < 6,
+    )
+    for page in pages:
+        collected.extend(page)
+
+    assert collected == [1, 1, 1, 2, 2, 2]
+    assert fetched == [1, 2]
+    executor.shutdown()
+
+
+def test_fan_out_pages_yields_in_order_and_stops_at_empty_page():
+    executor = ScrapeExecutor(site_workers=1, detail_workers=4)
+    batches = []
+
+    def fetch_page(page):
+        return [page] if page < 6 else []
+
+    pages = fan_out_pages(
+        executor,
+        Site.NAUKRI,
+        fetch_page,
+        start=1,
+        fanout=3,
+        between_batches=lambda: batches.append(True),
+    )
+    assert list(pages) == [[1], [2], [3], [4], [5]]
+    assert len(batches) == 1
+    executor.shutdown()
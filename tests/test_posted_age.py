@@ -0,0 +1,20 @@
+from datetime import datetime, timedelta, timezone
+
+from jobspy.util import posted_before, posted_cutoff
+
+
+def test_posted_before_cutoff():
+    cutoff = posted_cutoff(6)
+    now = datetime.now()
+    assert posted_cutoff(None) is None
+    assert not posted_before(now - timedelta(hours=6), None)
+
+    assert posted_before(now - timedelta(hours=7), cutoff)
+    assert not posted_before(now - timedelta(hours=5), cutoff)
+    assert posted_before((now - timedelta(hours=7)).timestamp() * 1000, cutoff)
+    assert not posted_before(datetime.now(timezone.utc), cutoff)
+
+    # day precision dates are kept while any moment of the day is recent enough
+    assert not posted_before(now.date(), cutoff)
+    assert posted_before((now - timedelta(days=2)).date(), posted_cutoff(1))
+    assert not posted_before(None, cutoff)
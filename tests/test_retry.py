@@ -0,0 +1,117 @@
+import pytest
+
+import jobspy
+from jobspy.exception import CircuitOpenException, RequestBudgetException
+from jobspy.model import JobPost, JobResponse, Scraper, Site
+from jobspy.retry import CircuitBreaker, RetryPolicy, retry_after_seconds
+from jobspy.store import JobStore
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None, url="https://example.com"):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.url = url
+
+
+def test_retries_until_success_within_budget():
+    policy = RetryPolicy(backoff=0, budget=2, breaker=CircuitBreaker(threshold=10))
+    responses = iter([FakeResponse(503), FakeResponse(502), FakeResponse(503)])
+    response = policy.send(Site.INDEED, "direct", lambda: next(responses))
+    assert response.status_code == 503
+    assert policy.retries == 2
+
+    response = policy.send(Site.INDEED, "direct", lambda: FakeResponse(500))
+    assert response.status_code == 500
+    assert policy.retries == 2
+
+
+def test_retry_after_is_honoured():
+    assert retry_after_seconds(FakeResponse(429, {"Retry-After": "7"})) == 7
+    policy = RetryPolicy(backoff=1, max_backoff=3)
+    assert policy.delay(0, FakeResponse(429, {"Retry-After": "120"})) == 3
+    assert retry_after_seconds(FakeResponse(429)) is None
+
+
+def test_breaker_opens_on_blocked_responses():
+    breaker = CircuitBreaker(threshold=2, cooldown=60)
+    policy = RetryPolicy(max_attempts=1, breaker=breaker)
+    signup = FakeResponse(200, url="https://www.linkedin.com/signup/cold-join")
+    policy.send(Site.LINKEDIN, "p1", lambda: signup)
+    policy.send(Site.LINKEDIN, "p1", lambda: FakeResponse(429))
+    with pytest.raises(CircuitOpenException):
+        policy.send(Site.LINKEDIN, "p1", lambda: FakeResponse(200))
+    assert (
+        policy.send(Site.LINKEDIN, "p2", lambda: FakeResponse(200)).status_code == 200
+    )
+
+
+def test_request_limits_stop_sending():
+    policy = RetryPolicy(request_limits={Site.INDEED: 2})
+    sent = []
+    for _ in range(2):
+        policy.send(Site.INDEED, "direct", lambda: sent.append(1) or FakeResponse(200))
+    with pytest.raises(RequestBudgetException):
+        policy.send(Site.INDEED, "direct", lambda: sent.append(1) or FakeResponse(200))
+    assert len(sent) == 2
+    assert policy.requests[Site.INDEED] == 2
+
+
+class FakeSite(Scraper):
+    """Finds one page of two jobs, then requests another through the policy"""
+
+    def __init__(self, site, proxies=None, ca_cert=None, **kwargs):
+        super().__init__(site, proxies=proxies, ca_cert=ca_cert, **kwargs)
+
+    def scrape(self, scraper_input):
+        prefix = self.site.value[:2]
+        job_list = [
+            JobPost(
+                id=f"{prefix}-{i}",
+                title="Python Developer",
+                company_name="Acme",
+                job_url=f"https://example.com/{prefix}/{i}",
+                location=None,
+            )
+            for i in range(2)
+        ]
+        self.page_done(job_list)
+        self.retry_policy.send(self.site, "direct", lambda: FakeResponse(200))
+        return JobResponse(jobs=job_list)
+
+
+def fake_sites(monkeypatch):
+    for site in (Site.INDEED, Site.LINKEDIN):
+        monkeypatch.setitem(
+            jobspy.SCRAPER_MAPPING,
+            site,
+            lambda site=site, **kwargs: FakeSite(site, **kwargs),
+        )
+
+
+def test_open_circuit_stops_only_its_site(monkeypatch):
+    fake_sites(monkeypatch)
+    breaker = CircuitBreaker(threshold=1, cooldown=60)
+    breaker.record(Site.INDEED, "direct", blocked=True)
+    jobs = jobspy.scrape_jobs(
+        site_name=["indeed", "linkedin"],
+        retry_policy=RetryPolicy(breaker=breaker),
+    )
+    # indeed keeps the page it finished before the circuit stopped it
+    assert sorted(jobs["id"]) == ["in-0", "in-1", "li-0", "li-1"]
+    assert list(jobs.attrs["site_errors"]) == ["indeed"]
+
+
+def test_used_up_request_budget_stops_only_its_site(monkeypatch, tmp_path):
+    fake_sites(monkeypatch)
+    store = str(tmp_path / "jobs.db")
+    jobs = jobspy.scrape_jobs(
+        site_name=["indeed", "linkedin"],
+        retry_policy=RetryPolicy(request_limits={Site.INDEED: 0}),
+        store=store,
+    )
+    assert sorted(jobs["id"]) == ["in-0", "in-1", "li-0", "li-1"]
+    assert list(jobs.attrs["site_errors"]) == ["indeed"]
+    stored = JobStore(store)
+    assert sorted(stored.query()["id"]) == ["in-0", "in-1", "li-0", "li-1"]
+    stored.close()
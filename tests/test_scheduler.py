@@ -0,0 +1,75 @@
+import pandas as pd
+
+import jobspy.scheduler as scheduler_module
+from jobspy.model import Site
+from jobspy.scheduler import SavedSearch, Scheduler
+
+
+def test_scheduler_runs_incrementally_within_site_budgets(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_scrape_jobs(retry_policy, store, **params):
+        calls.append(params)
+        retry_policy.requests[Site.LINKEDIN] = 5
+        return pd.DataFrame({"id": ["li-1"]})
+
+    monkeypatch.setattr(scheduler_module, "scrape_jobs", fake_scrape_jobs)
+    search = SavedSearch(
+        name="python",
+        interval_minutes=60,
+        params={"site_name": ["linkedin", "indeed"], "search_term": "python"},
+    )
+    state_path = tmp_path / "state.json"
+    scheduler = Scheduler(
+        [search],
+        state_path=state_path,
+        site_budgets={"linkedin": {"requests": 5, "window_minutes": 60}},
+    )
+    start = scheduler.next_run()
+    assert scheduler.run_pending(start - 1) == 0
+
+    assert scheduler.run_pending(start) == 1
+    assert calls[0]["site_name"] == ["linkedin", "indeed"]
+    assert "hours_old" not in calls[0]
+    assert 54 * 60 <= scheduler.next_run() - start <= 66 * 60
+
+    # linkedin used its budget, so the second run only covers indeed, incrementally
+    restarted = Scheduler(
+        [search],
+        state_path=state_path,
+        site_budgets={"linkedin": {"requests": 5, "window_minutes": 120}},
+    )
+    restarted.run_pending(start + 90 * 60)
+    assert calls[1]["site_name"] == ["indeed"]
+    assert calls[1]["hours_old"] == 3
+
+
+def test_scheduler_keeps_filters_and_caps_requests_to_the_budget(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_scrape_jobs(retry_policy, store, **params):
+        calls.append((params, dict(retry_policy.request_limits)))
+        retry_policy.requests[Site.LINKEDIN] = 2
+        return pd.DataFrame({"id": ["li-1"]})
+
+    monkeypatch.setattr(scheduler_module, "scrape_jobs", fake_scrape_jobs)
+    search = SavedSearch(
+        name="remote",
+        interval_minutes=60,
+        params={"site_name": ["linkedin", "indeed"], "is_remote": True},
+    )
+    scheduler = Scheduler(
+        [search],
+        state_path=tmp_path / "state.json",
+        site_budgets={"linkedin": {"requests": 5, "window_minutes": 120}},
+    )
+    start = scheduler.next_run()
+    scheduler.run_pending(start)
+    scheduler.run_pending(start + 90 * 60)
+
+    # hours_old would turn off Indeed's remote filter
+    assert "hours_old" not in calls[1][0]
+    assert [limits for _, limits in calls] == [
+        {Site.LINKEDIN: 5},
+        {Site.LINKEDIN: 3},
+    ]
@@ -0,0 +1,83 @@
+import functools
+import json
+import threading
+from urllib.request import Request, urlopen
+
+import jobspy.server as server_module
+from jobspy.server import create_server
+
+
+def test_identical_requests_share_one_scrape(monkeypatch):
+    calls = []
+    release = threading.Event()
+
+    @functools.wraps(server_module.scrape_jobs)
+    def fake_scrape_jobs(on_page, **params):
+        calls.append(params)
+        on_page("indeed", [{"id": "in-1"}])
+        release.wait(5)
+        on_page("indeed", [{"id": "in-2"}])
+
+    monkeypatch.setattr(server_module, "scrape_jobs", fake_scrape_jobs)
+    server = create_server(port=0, ttl=60)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/scrape"
+    body = json.dumps({"site_name": "indeed", "search_term": "python"}).encode()
+
+    def post(query=""):
+        response = urlopen(Request(url + query, data=body), timeout=5)
+        return response.headers["X-JobSpy-Cache"], response.read().decode()
+
+    try:
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(post())) for _ in range(2)
+        ]
+        flights = server.RequestHandlerClass.flights
+        get = flights.get
+        joined = threading.Semaphore(0)
+
+        def counting_get(params):
+            flight = get(params)
+            joined.release()
+            return flight
+
+        monkeypatch.setattr(flights, "get", counting_get)
+        for thread in threads:
+            thread.start()
+        # finish the scrape only once both requests are attached to it
+        assert joined.acquire(timeout=5) and joined.acquire(timeout=5)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        assert sorted(cache for cache, _ in results) == ["miss", "shared"]
+        for _, text in results:
+            assert [json.loads(line)["id"] for line in text.splitlines()] == [
+                "in-1",
+                "in-2",
+            ]
+
+        cache, text = post("?format=json")
+        assert cache == "hit"
+        assert [row["id"] for row in json.loads(text)] == ["in-1", "in-2"]
+        assert len(calls) == 1
+
+        bad = Request(url, data=json.dumps({"store": "x.db"}).encode())
+        try:
+            urlopen(bad, timeout=5)
+            assert False, "expected a 400"
+        except Exception as e:
+            assert e.code == 400
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_coalescing_key_normalizes_the_scraper_input():
+    key = server_module.SingleFlight.key
+    assert key({"site_name": "indeed"}) == key({"site_name": ["indeed"]})
+    assert key({"site_name": ["indeed", "linkedin"]}) == key(
+        {"site_name": ["linkedin", "indeed"], "results_wanted": 15}
+    )
+    assert key({"site_name": "indeed"}) != key({"site_name": "indeed", "offset": 10})
+    assert key({}) != key({"enforce_annual_salary": True})
@@ -0,0 +1,28 @@
+import requests
+
+from jobspy.model import Site
+from jobspy.session_state import SessionStateStore
+
+
+def test_state_is_shared_per_site_and_proxy(tmp_path):
+    store = SessionStateStore(tmp_path)
+    session = requests.Session()
+    session.cookies.set("sid", "abc")
+    store.persist(Site.GLASSDOOR, ["http://p1"], session, tokens={"csrf_token": "t"})
+
+    other = requests.Session()
+    tokens = SessionStateStore(tmp_path).restore(Site.GLASSDOOR, ["http://p1"], other)
+    assert tokens == {"csrf_token": "t"}
+    assert other.cookies.get("sid") == "abc"
+
+    assert store.load(Site.GLASSDOOR, ["http://p2"]) is None
+    assert store.load(Site.LINKEDIN, ["http://p1"]) is None
+
+    store.invalidate(Site.GLASSDOOR, ["http://p1"])
+    assert store.load(Site.GLASSDOOR, ["http://p1"]) is None
+
+
+def test_expired_state_is_ignored(tmp_path):
+    store = SessionStateStore(tmp_path)
+    store.save(Site.ZIP_RECRUITER, None, cookies={"a": "b"}, ttl=-1)
+    assert store.load(Site.ZIP_RECRUITER, None) is None
@@ -0,0 +1,62 @@
+from jobspy.model import JobPost, ScraperInput, Site
+from jobspy.shard import cap_merged_jobs, merge_shard_jobs, plan_shards
+
+
+def test_plan_shards_splits_linkedin_companies_only_for_linkedin():
+    scraper_input = ScraperInput(
+        site_type=[Site.LINKEDIN, Site.INDEED], linkedin_company_ids=[1, 2]
+    )
+    shards = plan_shards(scraper_input, ["company", "job_type"])
+    linkedin = [shard for shard in shards if shard.site == Site.LINKEDIN]
+    indeed = [shard for shard in shards if shard.site == Site.INDEED]
+    assert len(linkedin) == 2 * len(indeed)
+    assert {tuple(s.scraper_input.linkedin_company_ids) for s in linkedin} == {
+        (1,),
+        (2,),
+    }
+    assert all(shard.scraper_input.site_type == [shard.site] for shard in shards)
+
+
+def test_merge_shard_jobs_reports_new_jobs():
+    shard = plan_shards(ScraperInput(site_type=[Site.INDEED]), ["hours_old"])[0]
+    seen, merged = set(), []
+    jobs = [
+        JobPost(
+            id=f"in-{i}", title="t", company_name=None, job_url=f"u{i}", location=None
+        )
+        for i in range(3)
+    ]
+    first = merge_shard_jobs(shard, jobs[:2], seen, merged)
+    coverage = merge_shard_jobs(shard, jobs, seen, merged)
+    assert coverage.jobs_found == 3
+    assert coverage.new_jobs == 1
+    assert len(merged) == 3
+
+    # the merged jobs are cut back to results_wanted, dropping the second shard's
+    assert cap_merged_jobs(merged, [first, coverage], 2) == jobs[:2]
+    assert [first.kept, coverage.kept] == [2, 0]
+    assert coverage.summary()["kept"] == 0
+
+
+def test_hours_old_shards_keep_old_jobs_and_site_filters():
+    scraper_input = ScraperInput(site_type=[Site.LINKEDIN, Site.INDEED])
+    shards = plan_shards(scraper_input, ["hours_old"])
+    assert [shard.scraper_input.hours_old for shard in shards] == [
+        24,
+        72,
+        168,
+        720,
+        None,
+        24,
+        72,
+        168,
+        720,
+        None,
+    ]
+
+    # Indeed drops is_remote and job_type once hours_old is set
+    remote = ScraperInput(site_type=[Site.LINKEDIN, Site.INDEED], is_remote=True)
+    indeed = [s for s in plan_shards(remote, ["hours_old"]) if s.site == Site.INDEED]
+    assert [shard.scraper_input.hours_old for shard in indeed] == [None]
+    both = plan_shards(ScraperInput(site_type=[Site.INDEED]), ["job_type", "hours_old"])
+    assert all(shard.scraper_input.hours_old is None for shard in both)
@@ -0,0 +1,56 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from jobspy.store import JobStore, search_jobs
+
+
+def jobs(**overrides):
+    row = {
+        "id": "in-1",
+        "site": "indeed",
+        "title": "Data Engineer",
+        "company": "Acme",
+        "date_posted": date(2024, 5, 1),
+        "min_amount": np.float64(120000),
+        "is_remote": True,
+        "description": "Python and SQL",
+    }
+    row.update(overrides)
+    return pd.DataFrame([row])
+
+
+def test_upsert_keeps_first_seen_and_known_values(tmp_path):
+    with JobStore(tmp_path / "jobs.db") as store:
+        assert store.upsert(jobs()) == 1
+        first = store.query().iloc[0]
+        assert store.upsert(jobs(description=None, title="Senior Data Engineer")) == 1
+        assert store.count() == 1
+        row = store.query().iloc[0]
+        assert row["title"] == "Senior Data Engineer"
+        assert row["description"] == "Python and SQL"
+        assert row["first_seen"] == first["first_seen"]
+
+        store.upsert(jobs(id="li-2", site="linkedin", min_amount=np.nan))
+        assert list(store.query(site="linkedin")["id"]) == ["li-2"]
+        assert list(store.query(min_salary=100000)["id"]) == ["in-1"]
+        assert len(store.query(posted_since="2024-04-30", is_remote=True)) == 2
+        assert len(store.query(where="title LIKE ?", params=["Senior%"])) == 1
+
+
+def test_full_text_index_follows_upserts(tmp_path):
+    path = tmp_path / "jobs.db"
+    with JobStore(path) as store:
+        store.upsert(jobs())
+    with JobStore(path, full_text=True) as store:
+        store.upsert(
+            jobs(id="li-2", site="linkedin", title="ML Engineer", description="PyTorch")
+        )
+        assert list(store.search("python")["id"]) == ["in-1"]
+        store.upsert(jobs(description="Rust and Go"))
+        assert store.search("python").empty
+
+    results = search_jobs("engineer", store=path, site="linkedin")
+    assert list(results["id"]) == ["li-2"]
+    assert "rank" in results.columns
@@ -0,0 +1,72 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from jobspy.model import (
+    Compensation,
+    CompensationInterval,
+    Country,
+    JobPost,
+    JobType,
+    Location,
+)
+from jobspy.store import JobStore
+from jobspy.util import desired_order, job_to_row, typed_frame
+
+
+def rows():
+    linkedin = JobPost(
+        id="li-1",
+        title="Python Developer",
+        company_name="Acme",
+        job_url="https://example.com/1",
+        location=Location(city="Austin", country=Country.USA),
+        date_posted=date(2024, 5, 1),
+        job_type=[JobType.FULL_TIME],
+        compensation=Compensation(
+            interval=CompensationInterval.YEARLY, min_amount=100000, max_amount=120000
+        ),
+        is_remote=True,
+    )
+    indeed = JobPost(
+        id="in-1",
+        title="Data Engineer",
+        company_name="Acme",
+        job_url="https://example.com/2",
+        location=Location(city="Austin", country=Country.USA),
+    )
+    row = job_to_row(indeed, "indeed", Country.USA)
+    # Indeed's date_posted is a string
+    row["date_posted"] = "2024-05-02"
+    frame = pd.DataFrame([job_to_row(linkedin, "linkedin", Country.USA), row])
+    return frame[desired_order]
+
+
+def test_typed_frame_types():
+    jobs_df = typed_frame(rows())
+    assert isinstance(jobs_df["site"].dtype, pd.CategoricalDtype)
+    assert isinstance(jobs_df["company"].dtype, pd.CategoricalDtype)
+    assert jobs_df["date_posted"].dtype.kind == "M"
+    assert list(jobs_df["date_posted"].dt.day) == [1, 2]
+    assert jobs_df["min_amount"].dtype == "Float64"
+    assert pd.isna(jobs_df["min_amount"][1])
+    assert jobs_df["is_remote"].dtype == "boolean"
+    assert jobs_df["vacancy_count"].dtype == "Int64"
+    assert list(jobs_df.columns) == desired_order
+
+    ordered = jobs_df.sort_values(by=["site", "date_posted"], ascending=[True, False])
+    assert list(ordered["id"]) == ["in-1", "li-1"]
+
+
+def test_typed_frame_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        typed_frame(rows(), "numpy")
+
+
+def test_store_keeps_dates_of_typed_rows(tmp_path):
+    store = JobStore(tmp_path / "jobs.db")
+    store.upsert(typed_frame(rows()))
+    stored = store.query(order_by="id")
+    assert list(stored["date_posted"]) == ["2024-05-02", "2024-05-01"]
+    store.close()
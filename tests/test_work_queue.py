@@ -0,0 +1,110 @@
+import jobspy.work_queue as work_queue
+from jobspy.model import JobPost, JobResponse, JobType, Scraper, Site
+from jobspy.store import JobStore
+from jobspy.util import create_logger
+from jobspy.work_queue import SQLiteTaskQueue, Worker, load_scraper_input, plan_tasks
+
+
+def test_plan_splits_sites_shards_and_pages():
+    search = {
+        "site_name": ["linkedin", "indeed"],
+        "search_term": "python",
+        "results_wanted": 250,
+        "job_type": "fulltime",
+        "country_indeed": "uk",
+    }
+    tasks = plan_tasks(search, page_size=100)
+    assert [task.site for task in tasks] == [Site.LINKEDIN] * 3 + [Site.INDEED]
+    inputs = [load_scraper_input(task.payload["input"]) for task in tasks]
+    assert [(i.offset, i.results_wanted) for i in inputs[:3]] == [
+        (0, 100),
+        (100, 100),
+        (200, 50),
+    ]
+    assert inputs[3].job_type == JobType.FULL_TIME
+    assert inputs[3].country.name == "UK"
+    assert [task.id for task in plan_tasks(search, page_size=100)] == [
+        task.id for task in tasks
+    ]
+
+    sharded = plan_tasks(
+        {"site_name": "indeed", "shard_by": ["location"], "shard_locations": ["A", "B"]}
+    )
+    assert [load_scraper_input(t.payload["input"]).location for t in sharded] == [
+        "A",
+        "B",
+    ]
+
+
+def test_queue_leases_retries_and_fails(tmp_path):
+    queue = SQLiteTaskQueue(tmp_path / "tasks.db", max_attempts=2, retry_backoff=0)
+    tasks = plan_tasks({"site_name": ["indeed", "google"], "search_term": "x"})
+    assert queue.put(tasks) == 2
+    assert queue.put(tasks) == 0
+
+    first = queue.lease("a")
+    second = queue.lease("b")
+    assert {first.id, second.id} == {task.id for task in tasks}
+    assert queue.lease("c") is None
+
+    queue.complete(first, "a")
+    queue.fail(second, "b", "boom")
+    retried = queue.lease("c")
+    assert retried.id == second.id and retried.attempts == 2
+    # a worker whose lease was taken over can't settle the task
+    queue.complete(retried, "b")
+    queue.fail(retried, "c", "boom")
+    assert queue.lease("d") is None
+    assert queue.counts() == {"done": 1, "failed": 1}
+
+    # an expired lease is handed out again
+    expiring = plan_tasks({"site_name": "bayt", "search_term": "x"})
+    queue.put(expiring)
+    assert queue.lease("e", lease_seconds=-1).id == expiring[0].id
+    assert queue.lease("f").id == expiring[0].id
+
+
+class FakeIndeed(Scraper):
+    def __init__(self, proxies=None, ca_cert=None, **kwargs):
+        super().__init__(Site.INDEED, proxies=proxies, ca_cert=ca_cert, **kwargs)
+
+    def scrape(self, scraper_input):
+        jobs = [
+            JobPost(
+                id=f"in-{scraper_input.location}-{i}",
+                title="Python Developer",
+                company_name="Acme",
+                job_url=f"https://example.com/{i}",
+                location=None,
+            )
+            for i in range(3)
+        ]
+        return JobResponse(jobs=jobs)
+
+
+def test_workers_write_each_job_once(tmp_path, monkeypatch):
+    monkeypatch.setitem(work_queue.SCRAPER_MAPPING, Site.INDEED, FakeIndeed)
+    queue = SQLiteTaskQueue(tmp_path / "tasks.db")
+    queue.put(plan_tasks({"site_name": "indeed", "location": "Austin"}))
+    with JobStore(tmp_path / "jobs.db") as store:
+        assert Worker(queue, store, worker_id="a").run() == 1
+        # a task run twice, e.g. after a lost lease, rewrites the same rows
+        task = plan_tasks({"site_name": "indeed", "location": "Austin"})[0]
+        Worker(queue, store, worker_id="b").run_task(task)
+        assert store.count() == 3
+
+
+class BlockedIndeed(FakeIndeed):
+    def scrape(self, scraper_input):
+        # like the real scrapers, a 429 is logged and a partial result returned
+        create_logger("Indeed").error("429 Response - Blocked by Indeed")
+        return JobResponse(jobs=[])
+
+
+def test_blocked_task_is_retried_not_completed(tmp_path, monkeypatch):
+    monkeypatch.setitem(work_queue.SCRAPER_MAPPING, Site.INDEED, BlockedIndeed)
+    queue = SQLiteTaskQueue(tmp_path / "tasks.db", max_attempts=2, retry_backoff=0)
+    queue.put(plan_tasks({"site_name": "indeed", "location": "Austin"}))
+    with JobStore(tmp_path / "jobs.db") as store:
+        assert Worker(queue, store, worker_id="a").run() == 0
+    assert queue.counts() == {"failed": 1}